@@ -0,0 +1,5 @@
+"""
+Benchmark scripts for nepali-num2word.
+
+Each module can be run directly, e.g. ``python benchmarks/bench_threads.py``.
+"""
@@ -0,0 +1,56 @@
+"""
+Benchmark for convert_to_words_batch(errors='return') on dirty data.
+
+Compares a per-row try/except loop around convert_to_words with the
+error-as-value batch mode, at 1%, 10% and 50% invalid rows.
+"""
+
+import random
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, convert_to_words_batch
+
+INVALID_VALUES = ['', 'abc', '12a', None, True, 1000000000, '1.2.3', 'N/A']
+
+
+def dirty_rows(count, invalid_ratio, seed=12345):
+    """Mix valid integers and strings with a given share of invalid values."""
+    rng = random.Random(seed)
+    rows = []
+    for number in sample_numbers(count, seed):
+        if rng.random() < invalid_ratio:
+            rows.append(rng.choice(INVALID_VALUES))
+        elif rng.random() < 0.5:
+            rows.append(str(number))
+        else:
+            rows.append(number)
+    return rows
+
+
+def try_except_loop(rows):
+    """The loop callers write today."""
+    results = []
+    errors = []
+    for row in rows:
+        try:
+            results.append(convert_to_words(row))
+            errors.append(None)
+        except (TypeError, ValueError) as e:
+            results.append(None)
+            errors.append(str(e))
+    return results, errors
+
+
+def main():
+    count = 100000
+    for ratio in (0.01, 0.10, 0.50):
+        rows = dirty_rows(count, ratio)
+        seconds = time_call(lambda: try_except_loop(rows))
+        report(f"try/except loop ({ratio:.0%} invalid)", seconds, count)
+        seconds = time_call(lambda: convert_to_words_batch(rows, errors='return'))
+        report(f"convert_to_words_batch errors='return' ({ratio:.0%} invalid)", seconds, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark for warm-start cache snapshots.
+
+Simulates a restarted batch worker on skewed data (a few amounts occur very
+often). One worker starts with an empty ResultCache, the other loads the
+snapshot saved by a previous run first. Throughput is reported per window of
+calls, with the time to reach steady state, i.e. 90% of the final window, and
+the engine calls (cache misses) in the first window, which does not depend on
+machine noise.
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from common import report
+
+from nepali_num2word.cache import ResultCache
+
+WINDOW = 20000
+WINDOWS = 10
+
+
+def skewed_amounts(count, seed):
+    """Amounts drawn from a fixed Zipf-like distribution over 200,000 values."""
+    population_rng = random.Random(0)
+    population = [population_rng.randint(1, 99999999) for _ in range(200000)]
+    weights = [1 / (rank + 1) for rank in range(len(population))]
+    return random.Random(seed).choices(population, weights, k=count)
+
+
+def first_window_misses(cache, amounts):
+    """Share of calls in the first window that had to run the engine."""
+    before = len(cache)
+    for amount in amounts[:WINDOW]:
+        cache.convert_to_words(amount, 'np')
+        cache.format_number(amount, 'np')
+    return (len(cache) - before) / (2 * WINDOW)
+
+
+def run_worker(cache, amounts):
+    """Return the ops/s of each window."""
+    rates = []
+    for start in range(0, len(amounts), WINDOW):
+        began = time.perf_counter()
+        for amount in amounts[start:start + WINDOW]:
+            cache.convert_to_words(amount, 'np')
+            cache.format_number(amount, 'np')
+        rates.append(2 * WINDOW / (time.perf_counter() - began))
+    return rates
+
+
+def time_to_steady_state(rates):
+    """Seconds until a window reaches 90% of the final window's ops/s."""
+    elapsed = 0.0
+    for rate in rates:
+        if rate >= 0.9 * rates[-1]:
+            return elapsed
+        elapsed += 2 * WINDOW / rate
+    return elapsed
+
+
+def main():
+    # A previous worker run fills its cache and saves the hot set
+    previous = ResultCache()
+    run_worker(previous, skewed_amounts(WINDOW * WINDOWS, seed=1))
+    path = os.path.join(tempfile.mkdtemp(), 'hot.snap')
+    saved = previous.save(path, limit=50000)
+    print(f"snapshot: {saved:,} entries, {os.path.getsize(path):,} bytes")
+
+    amounts = skewed_amounts(WINDOW * WINDOWS, seed=2)
+    cold = warm = None
+    for _ in range(3):
+        # Best of three restarts for each, window by window
+        rates = run_worker(ResultCache(), amounts)
+        cold = rates if cold is None else list(map(max, cold, rates))
+
+        began = time.perf_counter()
+        warm_cache = ResultCache()
+        loaded = warm_cache.load(path)
+        load_seconds = time.perf_counter() - began
+        rates = run_worker(warm_cache, amounts)
+        warm = rates if warm is None else list(map(max, warm, rates))
+    print(f"load: {loaded:,} entries in {load_seconds * 1000:.1f} ms")
+    warm_cache = ResultCache()
+    warm_cache.load(path)
+    print(f"first window engine calls: cold {first_window_misses(ResultCache(), amounts):.0%}, "
+          f"warm {first_window_misses(warm_cache, amounts):.0%}")
+
+    for label, rates in (('cold start', cold), ('warm start (snapshot)', warm)):
+        report(f"{label}, first window", 2 * WINDOW / rates[0], 2 * WINDOW)
+        report(f"{label}, last window", 2 * WINDOW / rates[-1], 2 * WINDOW)
+        print(f"{label}: {time_to_steady_state(rates) * 1000:.0f} ms to steady state, "
+              f"{sum(2 * WINDOW / rate for rate in rates) * 1000:.0f} ms for all {len(rates)} windows")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
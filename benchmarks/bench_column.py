@@ -0,0 +1,53 @@
+"""
+Benchmark for Arrow-style UTF-8 column output against list output.
+
+Compares building a list of str with building a Utf8Column, for words,
+Nepali-style formatting and compact strings. Memory held by the result and
+the peak while building it are traced by tracemalloc; time is measured
+separately.
+"""
+
+import gc
+import tracemalloc
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word.column import (
+    compact_number_column, convert_to_words_column, format_number_column,
+)
+
+
+def traced_bytes(build):
+    """Return (bytes held by the result, peak bytes while building it)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held, peak
+
+
+def main():
+    count = 300000
+    numbers = sample_numbers(count)
+    workloads = (
+        ('words en', lambda: [convert_to_words(n) for n in numbers],
+         lambda: convert_to_words_column(numbers)),
+        ('words np', lambda: [convert_to_words(n, 'np') for n in numbers],
+         lambda: convert_to_words_column(numbers, 'np')),
+        ('format np', lambda: [format_number(n, 'np') for n in numbers],
+         lambda: format_number_column(numbers, 'np')),
+        ('compact en', lambda: [compact_number(n) for n in numbers],
+         lambda: compact_number_column(numbers)),
+    )
+    for label, as_list, as_column in workloads:
+        for kind, build in (('list of str', as_list), ('Utf8Column', as_column)):
+            held, peak = traced_bytes(build)
+            report(f"{kind}, {label} ({held / count:.0f}/{peak / count:.0f} B/row)",
+                   time_call(build, repeat=3), count)
+    print("(B/row: bytes held by the result / peak while building)")
+
+if __name__ == "__main__":
+    main()
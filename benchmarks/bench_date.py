@@ -0,0 +1,53 @@
+"""
+Benchmark for Bikram Sambat date to words.
+
+Uses a realistic distribution of dates: most years are recent (birth dates
+and document dates cluster in the last few decades), months are uniform and
+days 1-29 are far more common than 30-32.
+"""
+
+import random
+
+from common import report, time_call
+
+from nepali_num2word import convert_date_to_words, convert_date_to_words_batch
+from nepali_num2word.core import convert_integer_to_words
+from nepali_num2word.date import MONTHS_NP
+
+
+def realistic_dates(count, seed=12345):
+    """Generate deterministic ``YYYY-MM-DD`` strings."""
+    rng = random.Random(seed)
+    dates = []
+    for _ in range(count):
+        year = min(2082, int(rng.triangular(2000, 2082, 2078)))
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 29) if rng.random() < 0.95 else rng.randint(30, 32)
+        dates.append(f"{year}-{month:02d}-{day:02d}")
+    return dates
+
+
+def uncached(date):
+    """Convert a date without any caching, for comparison."""
+    year, month, day = (int(part) for part in date.split('-'))
+    return (f"{convert_integer_to_words(year, 'np')} साल {MONTHS_NP[month - 1]} "
+            f"{convert_integer_to_words(day, 'np')} गते")
+
+
+def main():
+    dates = realistic_dates(200000)
+    tuples = [tuple(int(part) for part in date.split('-')) for date in dates]
+
+    seconds = time_call(lambda: [uncached(d) for d in dates])
+    report("uncached engine (np)", seconds, len(dates))
+    for lang in ('en', 'np'):
+        seconds = time_call(lambda: [convert_date_to_words(d, lang) for d in dates])
+        report(f"convert_date_to_words str ({lang})", seconds, len(dates))
+        seconds = time_call(lambda: [convert_date_to_words(d, lang) for d in tuples])
+        report(f"convert_date_to_words tuple ({lang})", seconds, len(dates))
+        seconds = time_call(lambda: convert_date_to_words_batch(dates, lang))
+        report(f"convert_date_to_words_batch str ({lang})", seconds, len(dates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark for input type dispatch.
+
+Shows that plain int and float inputs take the same time as before, and
+what NumPy scalars, Decimal and Fraction cost on the cached dispatch path.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, compact_number
+from nepali_num2word.core import convert_integer_to_words
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def main():
+    ints = sample_numbers(200000)
+    inputs = [
+        ('int', ints),
+        ('float', [n / 100 for n in ints]),
+        ('str', [str(n) for n in ints]),
+        ('Decimal', [Decimal(n) / 100 for n in ints]),
+        ('Fraction', [Fraction(n, 100) for n in ints]),
+    ]
+    if numpy is not None:
+        inputs.append(('numpy.int64', list(numpy.array(ints, dtype=numpy.int64))))
+        inputs.append(('numpy.float64', list(numpy.array(ints, dtype=numpy.float64) / 100)))
+    else:
+        print("numpy not installed; skipping NumPy scalars")
+
+    seconds = time_call(lambda: [convert_integer_to_words(n) for n in ints])
+    report("convert_integer_to_words int (no validation)", seconds, len(ints))
+    for label, values in inputs:
+        seconds = time_call(lambda: [convert_to_words(n) for n in values])
+        report(f"convert_to_words {label}", seconds, len(values))
+    for label, values in inputs:
+        seconds = time_call(lambda: [compact_number(n) for n in values])
+        report(f"compact_number {label}", seconds, len(values))
+
+
+if __name__ == "__main__":
+    main()
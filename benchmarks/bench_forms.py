@@ -0,0 +1,63 @@
+"""
+Benchmark for number_forms against three separate calls.
+
+Produces the words, Nepali-style grouping and compact form for every value
+and compares time and peak traced memory of both approaches.
+"""
+
+import tracemalloc
+from decimal import Decimal
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import compact_number, convert_to_words, format_number, number_forms
+
+
+def separate(numbers):
+    return [
+        (convert_to_words(n), format_number(n), compact_number(n))
+        for n in numbers
+    ]
+
+
+def _all_forms(forms):
+    forms.words, forms.formatted, forms.compact
+    return forms
+
+
+def combined(numbers):
+    return [_all_forms(number_forms(n)) for n in numbers]
+
+
+def peak_memory(func, numbers):
+    """Return peak traced memory in bytes while func builds and holds its results."""
+    tracemalloc.start()
+    results = func(numbers)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del results
+    return peak
+
+
+def main():
+    for label, numbers in (
+        ('int', sample_numbers(300000)),
+        ('str', [str(n) for n in sample_numbers(300000)]),
+        ('float', [n / 100 for n in sample_numbers(300000)]),
+        ('Decimal', [Decimal(n) / 100 for n in sample_numbers(300000)]),
+    ):
+        seconds = time_call(lambda: separate(numbers), repeat=3)
+        report(f"three separate calls ({label})", seconds, len(numbers))
+        seconds = time_call(lambda: combined(numbers), repeat=3)
+        report(f"number_forms, all forms ({label})", seconds, len(numbers))
+        seconds = time_call(lambda: [number_forms(n).words for n in numbers], repeat=3)
+        report(f"number_forms, words only ({label})", seconds, len(numbers))
+
+        separate_peak = peak_memory(separate, numbers)
+        combined_peak = peak_memory(combined, numbers)
+        print(f"peak memory ({label}): separate {separate_peak / len(numbers):.0f} B/value, "
+              f"number_forms {combined_peak / len(numbers):.0f} B/value")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmark for Nepali and international grouping.
+
+Times format_number, format_number_batch and NumberFormatter in both
+grouping modes, with ASCII and Devanagari digits.
+"""
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import NumberFormatter, format_number, format_number_batch
+
+
+def main():
+    numbers = sample_numbers(200000)
+    for grouping in ('nepali', 'international'):
+        for lang in ('en', 'np'):
+            label = f"{grouping}, lang={lang}"
+            seconds = time_call(lambda: [format_number(n, lang, grouping) for n in numbers], repeat=3)
+            report(f"format_number, {label}", seconds, len(numbers))
+            seconds = time_call(lambda: format_number_batch(numbers, lang, grouping), repeat=3)
+            report(f"format_number_batch, {label}", seconds, len(numbers))
+            formatter = NumberFormatter(lang, grouping)
+            seconds = time_call(lambda: formatter.format_batch(numbers), repeat=3)
+            report(f"NumberFormatter.format_batch, {label}", seconds, len(numbers))
+    rupees = [n / 100 for n in numbers]
+    for grouping in ('nepali', 'international'):
+        formatter = NumberFormatter(grouping=grouping)
+        seconds = time_call(lambda: formatter.format_batch(rupees), repeat=3)
+        report(f"NumberFormatter.format_batch, {grouping}, floats", seconds, len(rupees))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark for newline-delimited bytes input, in MB/s of input.
+
+Compares convert_lines on the raw buffer with decoding the buffer and
+converting each line as a str, and with decoding each line and calling int().
+"""
+
+import random
+
+from common import time_call
+
+from nepali_num2word import convert_lines, convert_to_words, convert_to_words_batch
+
+
+def build_feed(count, decimals):
+    """Newline-delimited ASCII feed of ``count`` random amounts."""
+    rng = random.Random(12345)
+    if decimals:
+        texts = [f"{rng.randint(0, 9999999)}.{rng.randint(0, 99):02d}" for _ in range(count)]
+    else:
+        texts = [str(rng.randint(-999999999, 999999999)) for _ in range(count)]
+    return ('\n'.join(texts) + '\n').encode('ascii')
+
+
+def report_mbs(label, seconds, data, lines):
+    """Print throughput in MB/s and lines/s."""
+    print(f"{label:<44} {len(data) / seconds / 1e6:>8.2f} MB/s {lines / seconds:>12,.0f} lines/s")
+
+
+def main():
+    for decimals in (False, True):
+        data = build_feed(200000, decimals)
+        lines = data.count(b'\n')
+        kind = "decimal" if decimals else "integer"
+        print(f"{kind} feed: {lines:,} lines, {len(data) / 1e6:.2f} MB")
+        seconds = time_call(lambda: convert_to_words_batch(data.decode('ascii').splitlines()), repeat=3)
+        report_mbs("decode + convert_to_words_batch(str lines)", seconds, data, lines)
+        number = float if decimals else int
+        seconds = time_call(lambda: [convert_to_words(number(line.decode('ascii')))
+                                     for line in data.splitlines()], repeat=3)
+        report_mbs("per-line decode + int()/float()", seconds, data, lines)
+        seconds = time_call(lambda: convert_lines(data), repeat=3)
+        report_mbs("convert_lines(bytes)", seconds, data, lines)
+        view = memoryview(data)
+        seconds = time_call(lambda: convert_lines(view), repeat=3)
+        report_mbs("convert_lines(memoryview)", seconds, data, lines)
+
+
+if __name__ == "__main__":
+    main()
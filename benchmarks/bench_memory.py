@@ -0,0 +1,106 @@
+"""
+Memory benchmark based on tracemalloc.
+
+For each function reports, per call:
+    peak:     transient bytes allocated above the baseline during the call
+              (max and mean over the sample)
+    retained: bytes and blocks still allocated after the call, with the
+              result kept (the result string itself) and with it discarded
+              (should be 0; anything else is a leak)
+and for batch workloads the peak memory of converting the whole list.
+"""
+
+import sys
+import tracemalloc
+
+from common import sample_numbers
+
+from nepali_num2word import compact_number, convert_to_words, convert_to_words_batch, format_number
+from nepali_num2word.core import _convert_digits_to_nepali, _format_integer_part
+
+
+def peak_per_call(func, values):
+    """Return (max, mean) transient peak bytes of ``func(value)`` over ``values``."""
+    func(values[0])
+    peaks = []
+    for value in values:
+        _restart()
+        func(value)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+    return max(peaks), sum(peaks) / len(peaks)
+
+
+def _restart():
+    """Clear the traces and the peak; tracemalloc.reset_peak() needs Python 3.9."""
+    tracemalloc.stop()
+    tracemalloc.start()
+
+
+def retained_per_call(func, values, keep):
+    """Return (bytes, blocks) per call still allocated after calling ``func`` on ``values``."""
+    func(values[0])
+    results = [None] * len(values)
+    before = tracemalloc.take_snapshot()
+    if keep:
+        for index, value in enumerate(values):
+            results[index] = func(value)
+    else:
+        for value in values:
+            func(value)
+    after = tracemalloc.take_snapshot()
+    diff = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in diff)
+    blocks = sum(stat.count_diff for stat in diff)
+    del results
+    return size / len(values), blocks / len(values)
+
+
+def batch_peak(func):
+    """Return peak bytes while ``func()`` runs."""
+    _restart()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    del result
+    return peak
+
+
+def main():
+    numbers = sample_numbers(5000)
+    strings = [str(n) for n in numbers]
+    rupees = [n / 100 for n in numbers]
+    workloads = (
+        ("convert_to_words, en", lambda n: convert_to_words(n), numbers),
+        ("convert_to_words, np", lambda n: convert_to_words(n, 'np'), numbers),
+        ("convert_to_words, rupees", lambda n: convert_to_words(n), rupees),
+        ("format_number, en", lambda n: format_number(n), numbers),
+        ("format_number, np", lambda n: format_number(n, 'np'), numbers),
+        ("_format_integer_part", _format_integer_part, numbers),
+        ("_convert_digits_to_nepali", _convert_digits_to_nepali, strings),
+        ("compact_number, en", lambda n: compact_number(n), numbers),
+    )
+
+    tracemalloc.start()
+    print(f"Python {sys.version.split()[0]}, {len(numbers):,} values per workload")
+    print(f"{'workload':<28} {'peak max':>9} {'peak mean':>10} {'kept B':>8} {'kept blk':>9} "
+          f"{'freed B':>8} {'freed blk':>9}")
+    for label, func, values in workloads:
+        peak_max, peak_mean = peak_per_call(func, values)
+        kept_bytes, kept_blocks = retained_per_call(func, values, keep=True)
+        freed_bytes, freed_blocks = retained_per_call(func, values, keep=False)
+        print(f"{label:<28} {peak_max:>9,} {peak_mean:>10.1f} {kept_bytes:>8.1f} {kept_blocks:>9.2f} "
+              f"{freed_bytes:>8.1f} {freed_blocks:>9.2f}")
+
+    batch = sample_numbers(100000)
+    print()
+    for label, func in (
+        ("convert_to_words_batch, 100k", lambda: convert_to_words_batch(batch)),
+        ("convert_to_words_batch np, 100k", lambda: convert_to_words_batch(batch, 'np')),
+        ("[format_number(n)], 100k", lambda: [format_number(n) for n in batch]),
+    ):
+        peak = batch_peak(func)
+        print(f"{label:<36} peak {peak / 2**20:>7.2f} MiB  {peak / len(batch):>7.1f} B/value")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Overhead benchmark for call metrics.
+
+Times convert_to_words and format_number plain, instrumented with metrics
+disabled (the default) and instrumented with metrics enabled, then runs the
+instrumented function from several threads to check that recording does not
+contend. Fails if an instrumented call with metrics off adds more than
+MAX_OFF_OVERHEAD of a plain call's time.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, format_number
+from nepali_num2word.metrics import Metrics
+
+# Largest allowed slowdown of an instrumented call while metrics are off
+MAX_OFF_OVERHEAD = 0.25
+
+
+def wrapper_overhead(metrics, calls=200000):
+    """
+    Seconds an instrumented call adds in the current state of ``metrics``.
+
+    Measured on a function that does nothing, so the difference is not lost in
+    the noise of the conversion itself.
+    """
+    def noop(number, lang='en'):
+        return number
+
+    wrapped = metrics.instrument(noop)
+    plain = time_call(lambda: [noop(n, 'np') for n in range(calls)], repeat=5)
+    instrumented = time_call(lambda: [wrapped(n, 'np') for n in range(calls)], repeat=5)
+    return max(instrumented - plain, 0) / calls
+
+
+def main():
+    numbers = sample_numbers(200000)
+    for func in (convert_to_words, format_number):
+        metrics = Metrics()
+        wrapped = metrics.instrument(func)
+        name = func.__name__
+        plain = time_call(lambda: [func(n, 'np') for n in numbers], repeat=3)
+        report(f"{name}, plain", plain, len(numbers))
+        off = time_call(lambda: [wrapped(n, 'np') for n in numbers], repeat=3)
+        report(f"{name}, instrumented, metrics off", off, len(numbers))
+        overhead = wrapper_overhead(metrics)
+        assert overhead <= plain / len(numbers) * MAX_OFF_OVERHEAD, (
+            f"{name}: metrics off add {overhead * 1e9:.0f} ns to a "
+            f"{plain / len(numbers) * 1e9:.0f} ns call"
+        )
+        metrics.enabled = True
+        seconds = time_call(lambda: [wrapped(n, 'np') for n in numbers], repeat=3)
+        report(f"{name}, instrumented, metrics on", seconds, len(numbers))
+
+    metrics = Metrics(enabled=True)
+    wrapped = metrics.instrument(convert_to_words)
+    for func, label in ((convert_to_words, "plain"), (wrapped, "metrics on")):
+        chunks = [numbers[i::4] for i in range(4)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(lambda chunk: [func(n) for n in chunk], chunk) for chunk in chunks]:
+                future.result()
+        report(f"convert_to_words, 4 threads, {label}", time.perf_counter() - start, len(numbers))
+    seconds = time_call(metrics.to_prometheus, repeat=3)
+    print(f"to_prometheus: {seconds * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
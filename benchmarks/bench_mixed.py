@@ -0,0 +1,45 @@
+"""
+Benchmark for mixed-script output ("१ लाख २० हजार").
+
+Compares convert_to_mixed with composing the same text by hand from
+format_number: split the grouped digits on commas and attach scale words.
+"""
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_mixed, convert_to_mixed_batch, format_number
+
+SCALE_WORDS = {
+    'en': ('crore', 'lakh', 'thousand'),
+    'np': ('करोड', 'लाख', 'हजार'),
+}
+
+
+def mixed_by_hand(number, lang):
+    """Digits with scale words, built from format_number output."""
+    groups = format_number(number, lang).split(',')
+    tail = groups.pop()
+    scales = SCALE_WORDS[lang][-len(groups):] if groups else ()
+    zero = '०' if lang == 'np' else '0'
+    parts = [f"{group.lstrip(zero)} {scale}" for group, scale in zip(groups, scales)
+             if group.strip(zero)]
+    tail = tail.lstrip(zero)
+    if tail:
+        parts.append(tail)
+    return ' '.join(parts) or zero
+
+
+def main():
+    numbers = sample_numbers(200000)
+    for lang in ('en', 'np'):
+        assert [mixed_by_hand(n, lang) for n in numbers[:1000]] == convert_to_mixed_batch(numbers[:1000], lang)
+        seconds = time_call(lambda: [mixed_by_hand(n, lang) for n in numbers], repeat=3)
+        report(f"format_number + split, lang={lang}", seconds, len(numbers))
+        seconds = time_call(lambda: [convert_to_mixed(n, lang) for n in numbers], repeat=3)
+        report(f"convert_to_mixed, lang={lang}", seconds, len(numbers))
+        seconds = time_call(lambda: convert_to_mixed_batch(numbers, lang), repeat=3)
+        report(f"convert_to_mixed_batch, lang={lang}", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
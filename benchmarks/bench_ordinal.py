@@ -0,0 +1,42 @@
+"""
+Benchmark for ordinal conversion.
+
+Compares convert_to_ordinal with post-processing the output of
+convert_to_words, which is what callers had to do before.
+"""
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, convert_to_ordinal, convert_to_ordinal_batch
+
+
+def post_processed(number):
+    """Naive English ordinal by rewriting the last cardinal word."""
+    words = convert_to_words(number)
+    if words.endswith('y'):
+        return words[:-1] + 'ieth'
+    for cardinal, ordinal in (('one', 'first'), ('two', 'second'), ('three', 'third'),
+                              ('five', 'fifth'), ('eight', 'eighth'), ('nine', 'ninth'),
+                              ('twelve', 'twelfth')):
+        if words.endswith(cardinal):
+            return words[:-len(cardinal)] + ordinal
+    return words + 'th'
+
+
+def main():
+    for label, numbers in (
+        ('rankings 1-100', sample_numbers(200000, low=1, high=100)),
+        ('installments 1-10,000', sample_numbers(200000, low=1, high=10000)),
+        ('full range', sample_numbers(200000)),
+    ):
+        seconds = time_call(lambda: [post_processed(n) for n in numbers])
+        report(f"post-process words ({label})", seconds, len(numbers))
+        for lang in ('en', 'np'):
+            seconds = time_call(lambda: [convert_to_ordinal(n, lang) for n in numbers])
+            report(f"convert_to_ordinal {lang} ({label})", seconds, len(numbers))
+            seconds = time_call(lambda: convert_to_ordinal_batch(numbers, lang))
+            report(f"convert_to_ordinal_batch {lang} ({label})", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
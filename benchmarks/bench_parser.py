@@ -0,0 +1,62 @@
+"""
+Benchmark for the shared numeric string parser.
+
+Compares parse_number with the float()/int() try-chain the CLIs used before,
+on plain inputs (which both accept) and on a realistic mix.
+"""
+
+import random
+
+from common import report, time_call
+
+from nepali_num2word import parse_number
+
+
+def try_chain(text):
+    """The parser previously duplicated in every CLI module."""
+    try:
+        if '.' in text:
+            return float(text)
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Invalid number format: {text}")
+
+
+def mixed_inputs(count, seed=12345):
+    """Generate a deterministic mix of formats seen in real data."""
+    rng = random.Random(seed)
+    forms = [
+        lambda n: str(n),
+        lambda n: f"{n / 100:.2f}",
+        lambda n: f"{n:,}",
+        lambda n: f"Rs. {n}",
+        lambda n: f"  {n}  ",
+        lambda n: str(n).translate(str.maketrans('0123456789', '०१२३४५६७८९')),
+    ]
+    return [rng.choice(forms)(rng.randint(0, 999999999)) for _ in range(count)]
+
+
+def _safe(func, text):
+    try:
+        return func(text)
+    except ValueError:
+        return None
+
+
+def main():
+    rng = random.Random(1)
+    plain_ints = [str(rng.randint(0, 999999999)) for _ in range(200000)]
+    plain_floats = [f"{rng.uniform(0, 999999999):.2f}" for _ in range(200000)]
+    mixed = mixed_inputs(200000)
+
+    for label, values in (('plain ints', plain_ints), ('plain floats', plain_floats), ('mixed', mixed)):
+        seconds = time_call(lambda: [_safe(try_chain, v) for v in values])
+        accepted = sum(_safe(try_chain, v) is not None for v in values)
+        report(f"float()/int() try-chain ({label}, {accepted / len(values):.0%} ok)", seconds, len(values))
+        seconds = time_call(lambda: [_safe(parse_number, v) for v in values])
+        accepted = sum(_safe(parse_number, v) is not None for v in values)
+        report(f"parse_number ({label}, {accepted / len(values):.0%} ok)", seconds, len(values))
+
+
+if __name__ == "__main__":
+    main()
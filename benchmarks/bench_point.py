@@ -0,0 +1,46 @@
+"""
+Benchmark for decimal-point words ("twelve point three four five").
+
+Compares convert_to_point_words on strings with the usual hand-written
+approach: float() the text, str() it back and look up a word per digit. The
+float round trip also changes the digits ("2.50" loses its zero, long
+fractions are rounded), so it is shown for speed only.
+"""
+
+import random
+from decimal import Decimal
+
+from common import report, time_call
+
+from nepali_num2word import convert_to_point_words, convert_to_point_words_batch
+from nepali_num2word.core import WORDS, convert_integer_to_words
+from nepali_num2word.point import POINT_WORDS
+
+
+def point_words_by_float(text, lang):
+    """Point words through a float round trip, one lookup per digit."""
+    whole, _, fraction = str(float(text)).partition('.')
+    words = convert_integer_to_words(int(whole), lang)
+    if fraction == '0':
+        return words
+    digits = ' '.join(WORDS[lang][int(d)] for d in fraction)
+    return f"{words} {POINT_WORDS[lang]} {digits}"
+
+
+def main():
+    rng = random.Random(50)
+    texts = [f"{rng.randint(0, 999999)}.{rng.randint(1, 999):03d}" for _ in range(200000)]
+    decimals = [Decimal(text) for text in texts]
+    for lang in ('en', 'np'):
+        seconds = time_call(lambda: [point_words_by_float(t, lang) for t in texts], repeat=3)
+        report(f"float round trip, lang={lang}", seconds, len(texts))
+        seconds = time_call(lambda: [convert_to_point_words(t, lang) for t in texts], repeat=3)
+        report(f"convert_to_point_words(str), lang={lang}", seconds, len(texts))
+        seconds = time_call(lambda: [convert_to_point_words(d, lang) for d in decimals], repeat=3)
+        report(f"convert_to_point_words(Decimal), lang={lang}", seconds, len(texts))
+        seconds = time_call(lambda: convert_to_point_words_batch(texts, lang), repeat=3)
+        report(f"convert_to_point_words_batch(str), lang={lang}", seconds, len(texts))
+
+
+if __name__ == "__main__":
+    main()
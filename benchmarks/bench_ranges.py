@@ -0,0 +1,31 @@
+"""
+Benchmark for incremental range enumeration.
+
+Compares iter_range_words with a naive loop over convert_integer_to_words on a
+long consecutive range and on a stepped range.
+
+Usage:
+    python benchmarks/bench_ranges.py [STOP]
+"""
+
+import sys
+
+from common import report, time_call
+
+from nepali_num2word import iter_range_words
+from nepali_num2word.core import convert_integer_to_words
+
+
+def main():
+    stop = int(sys.argv[1]) if len(sys.argv) > 1 else 2000001
+    for lang in ('en', 'np'):
+        for label, numbers in ((f"1-{stop - 1:,}", range(1, stop)), ("step 997", range(1, 999999999, 997))):
+            seconds = time_call(lambda: [convert_integer_to_words(n, lang) for n in numbers], repeat=3)
+            report(f"convert_integer_to_words loop {lang} ({label})", seconds, len(numbers))
+            seconds = time_call(lambda: list(iter_range_words(numbers.start, numbers.stop, numbers.step, lang)),
+                                repeat=3)
+            report(f"iter_range_words {lang} ({label})", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
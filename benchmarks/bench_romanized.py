@@ -0,0 +1,27 @@
+"""
+Benchmark for romanized Nepali output.
+
+lang='rom' uses the same lookup path as lang='np', so the cost per call
+should be the same.
+"""
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, convert_to_words_batch
+
+
+def main():
+    numbers = sample_numbers(200000)
+    small = sample_numbers(200000, high=99999)
+    rupees = [number / 100 for number in sample_numbers(200000, high=9999999)]
+    for label, values in (('integers', numbers), ('integers < 1 lakh', small), ('rupees and paisa', rupees)):
+        for lang in ('np', 'rom'):
+            seconds = time_call(lambda: [convert_to_words(n, lang) for n in values])
+            report(f"convert_to_words lang={lang!r} ({label})", seconds, len(values))
+    for lang in ('np', 'rom'):
+        seconds = time_call(lambda: convert_to_words_batch(numbers, lang))
+        report(f"convert_to_words_batch lang={lang!r}", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
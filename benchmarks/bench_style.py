@@ -0,0 +1,35 @@
+"""
+Benchmark for precompiled output styles.
+
+For each style, compares the styled tables with post-processing the default
+output (str.upper(), str.title(), replace and concatenation).
+"""
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import CHEQUE, WordStyle, convert_to_words
+
+
+def main():
+    numbers = sample_numbers(200000)
+    styles = (
+        ('default', WordStyle(), lambda n: convert_to_words(n)),
+        ('upper', WordStyle(case='upper'), lambda n: convert_to_words(n).upper()),
+        ('title', WordStyle(case='title'), lambda n: convert_to_words(n).title()),
+        ('no hyphen', WordStyle(hyphen=False), lambda n: convert_to_words(n).replace('-', ' ')),
+        ('cheque', CHEQUE, lambda n: f"Rupees {convert_to_words(n).title()} Only"),
+    )
+    seconds = time_call(lambda: [convert_to_words(n) for n in numbers], repeat=3)
+    report("convert_to_words (baseline)", seconds, len(numbers))
+    for label, style, post_process in styles:
+        seconds = time_call(lambda: [post_process(n) for n in numbers], repeat=3)
+        report(f"post-processing, {label}", seconds, len(numbers))
+        seconds = time_call(lambda: [style.convert(n) for n in numbers], repeat=3)
+        report(f"WordStyle, {label}", seconds, len(numbers))
+    style = WordStyle(use_and=True)
+    seconds = time_call(lambda: [style.convert(n) for n in numbers], repeat=3)
+    report("WordStyle, and insertion", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Multithreaded throughput benchmark.
+
+Runs the same batch of conversions across 1, 2, 4, ... threads and reports
+throughput and speed-up relative to one thread. On a regular (GIL) build the
+speed-up stays near 1x; on a free-threaded build (3.13t/3.14t) it should grow
+with the thread count up to the number of cores.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common import sample_numbers
+
+from nepali_num2word import convert_to_words, format_number, compact_number
+
+
+def _work(numbers, lang):
+    for number in numbers:
+        convert_to_words(number, lang)
+        format_number(number, lang)
+        compact_number(number, lang=lang)
+
+
+def run(threads, numbers, lang):
+    """Split ``numbers`` across ``threads`` workers and return elapsed seconds."""
+    chunks = [numbers[i::threads] for i in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for future in [pool.submit(_work, chunk, lang) for chunk in chunks]:
+            future.result()
+    return time.perf_counter() - start
+
+
+def main():
+    gil_check = getattr(sys, '_is_gil_enabled', None)
+    gil_enabled = gil_check() if gil_check is not None else True
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}, "
+          f"{os.cpu_count()} CPUs")
+
+    numbers = sample_numbers(200000)
+    max_threads = os.cpu_count() or 1
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= max_threads:
+        thread_counts.append(thread_counts[-1] * 2)
+
+    for lang in ('en', 'np'):
+        baseline = None
+        for threads in thread_counts:
+            elapsed = run(threads, numbers, lang)
+            baseline = baseline or elapsed
+            ops = len(numbers) * 3
+            print(f"lang={lang} threads={threads:<3} {ops / elapsed:>12,.0f} ops/s "
+                  f"speed-up {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
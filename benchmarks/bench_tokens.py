@@ -0,0 +1,45 @@
+"""
+Benchmark for token-ID output against a list of strings.
+
+Measures the memory held by the results (tracemalloc) and, separately, the
+throughput of producing them and of decoding every result back to a string.
+"""
+
+import gc
+import tracemalloc
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words
+from nepali_num2word.tokens import convert_to_tokens
+
+
+def held_bytes(build):
+    """Return (result, bytes still allocated by the result)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held
+
+
+def main():
+    count = 500000
+    numbers = sample_numbers(count)
+    for lang in ('en', 'np'):
+        build_strings = lambda: [convert_to_words(n, lang) for n in numbers]
+        build_tokens = lambda: convert_to_tokens(numbers, lang)
+        strings, held = held_bytes(build_strings)
+        del strings
+        report(f"list of strings lang={lang!r} ({held / count:.1f} bytes/result)",
+               time_call(build_strings, repeat=3), count)
+        tokens, held = held_bytes(build_tokens)
+        report(f"convert_to_tokens lang={lang!r} ({held / count:.1f} bytes/result)",
+               time_call(build_tokens, repeat=3), count)
+        report(f"decode every token result lang={lang!r}",
+               time_call(lambda tokens=tokens: list(tokens), repeat=3), count)
+        del tokens
+
+if __name__ == "__main__":
+    main()
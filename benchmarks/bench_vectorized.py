@@ -0,0 +1,45 @@
+"""
+Benchmark for the NumPy format_number backend.
+
+Formats arrays of 1e3 to 1e8 random integers with format_number_array and
+compares with the scalar path (format_number per element). The scalar path
+is only timed up to --scalar-max elements (default 1e6); by default arrays
+stop at 1e7 because 1e8 values need several GB of memory (--max-size 1e8).
+
+Usage:
+    python benchmarks/bench_vectorized.py [--max-size N] [--scalar-max N]
+"""
+
+import argparse
+
+import numpy as np
+from common import report, time_call
+
+from nepali_num2word import format_number
+from nepali_num2word.vectorized import format_number_array
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-size', type=float, default=1e7)
+    parser.add_argument('--scalar-max', type=float, default=1e6)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(12345)
+    size = 1000
+    while size <= args.max_size:
+        values = rng.integers(-999999999, 999999999, size, dtype=np.int64)
+        repeat = 3 if size <= 1e6 else 1
+        if size <= args.scalar_max:
+            items = values.tolist()
+            seconds = time_call(lambda: [format_number(v) for v in items], repeat=repeat)
+            report(f"format_number loop, n={size:.0e}", seconds, size)
+        for lang, dtype in (('en', 'U'), ('en', 'S'), ('np', 'U')):
+            seconds = time_call(lambda: format_number_array(values, lang, dtype), repeat=repeat)
+            report(f"format_number_array lang={lang} dtype={dtype}, n={size:.0e}", seconds, size)
+        del values
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
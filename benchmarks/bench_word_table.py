@@ -0,0 +1,66 @@
+"""
+Benchmark for the precomputed on-disk word table.
+
+Reports the one-off cost of building the table file, the startup cost and
+peak RSS of a fresh process doing its first conversion, and the per-call
+latency of convert_to_words with and without the table.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words
+from nepali_num2word.table import install_word_table, uninstall_word_table, write_word_table
+
+_STARTUP = """
+import resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from nepali_num2word import convert_to_words
+{setup}
+convert_to_words(12345, 'np')
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def startup(root, setup):
+    """Run a fresh interpreter and return (seconds to first result, max RSS in KiB)."""
+    code = _STARTUP.format(root=root, setup=setup)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    elapsed, rss = output.stdout.split()
+    return float(elapsed), int(rss)
+
+
+def main():
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    path = os.path.join(tempfile.mkdtemp(), 'words.bin')
+    build = time_call(lambda: write_word_table(path), repeat=1)
+    print(f"build: {build * 1000:.1f} ms, {os.path.getsize(path):,} bytes")
+
+    for label, setup in (
+        ('no table', ''),
+        ('table', f"from nepali_num2word.table import install_word_table; install_word_table({path!r})"),
+    ):
+        elapsed, rss = startup(root, setup)
+        print(f"startup ({label}): {elapsed * 1000:.1f} ms to first result, max RSS {rss:,} KiB")
+
+    numbers = sample_numbers(200000)
+    small = sample_numbers(200000, high=99999)
+    for lang in ('en', 'np'):
+        for name, values in (('0-999,999,999', numbers), ('0-99,999', small)):
+            uninstall_word_table()
+            seconds = time_call(lambda: [convert_to_words(n, lang) for n in values])
+            report(f"engine {name} lang={lang}", seconds, len(values))
+            install_word_table(path)
+            seconds = time_call(lambda: [convert_to_words(n, lang) for n in values])
+            report(f"table  {name} lang={lang}", seconds, len(values))
+    uninstall_word_table()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark for fixed-width wrapping of words.
+
+Compares wrap_words/wrap_words_batch (precomputed word widths) with wrapping
+convert_to_words output by scanning every character for its width, and with
+textwrap.wrap (fast, but counts characters, so Nepali lines come out short).
+"""
+
+import textwrap
+
+from common import report, sample_numbers, time_call
+
+from nepali_num2word import convert_to_words, wrap_words, wrap_words_batch
+from nepali_num2word.wrap import display_width
+
+WIDTH = 30
+
+
+def wrap_by_scan(number, width, lang):
+    """Greedy wrap measuring each word with a per-character width scan."""
+    lines = []
+    line = []
+    used = 0
+    for word in convert_to_words(number, lang).split(' '):
+        size = display_width(word)
+        if line and used + 1 + size <= width:
+            line.append(word)
+            used += 1 + size
+        else:
+            if line:
+                lines.append(' '.join(line))
+            line = [word]
+            used = size
+    if line:
+        lines.append(' '.join(line))
+    return lines
+
+
+def main():
+    numbers = sample_numbers(100000)
+    for lang in ('en', 'np'):
+        assert [wrap_by_scan(n, WIDTH, lang) for n in numbers[:1000]] == wrap_words_batch(numbers[:1000], WIDTH, lang)
+        seconds = time_call(lambda: [textwrap.wrap(convert_to_words(n, lang), WIDTH) for n in numbers], repeat=3)
+        report(f"convert_to_words + textwrap.wrap, lang={lang}", seconds, len(numbers))
+        seconds = time_call(lambda: [wrap_by_scan(n, WIDTH, lang) for n in numbers], repeat=3)
+        report(f"convert_to_words + width scan, lang={lang}", seconds, len(numbers))
+        seconds = time_call(lambda: [wrap_words(n, WIDTH, lang) for n in numbers], repeat=3)
+        report(f"wrap_words, lang={lang}", seconds, len(numbers))
+        seconds = time_call(lambda: wrap_words_batch(numbers, WIDTH, lang), repeat=3)
+        report(f"wrap_words_batch, lang={lang}", seconds, len(numbers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path for importing nepali_num2word
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def sample_numbers(count, seed=12345, low=0, high=999999999):
+    """
+    Build a deterministic list of integers for benchmarking.
+    
+    Args:
+        count (int): Number of values to generate.
+        seed (int, optional): Random seed. Defaults to 12345.
+        low (int, optional): Smallest value (inclusive). Defaults to 0.
+        high (int, optional): Largest value (inclusive). Defaults to 999,999,999.
+    
+    Returns:
+        list: Pseudo-random integers in ``[low, high]``.
+    """
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(count)]
+
+
+def time_call(func, repeat=5):
+    """
+    Run ``func`` several times and return the best wall-clock time.
+    
+    Args:
+        func (callable): Zero-argument callable to time.
+        repeat (int, optional): Number of runs. Defaults to 5.
+    
+    Returns:
+        float: Best time in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label, seconds, ops):
+    """
+    Print a single benchmark line with ns/op and ops/sec.
+    
+    Args:
+        label (str): Name of the workload.
+        seconds (float): Elapsed time for ``ops`` operations.
+        ops (int): Number of operations performed.
+    """
+    ns_per_op = seconds * 1e9 / ops
+    print(f"{label:<52} {ns_per_op:>10.1f} ns/op {ops / seconds:>14,.0f} ops/s")
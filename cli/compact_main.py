@@ -8,34 +8,12 @@ like "1.2 lakhs", "4.5 crores" etc.
 import argparse
 import sys
 import os
-from typing import Union
 
 # Add parent directory to path for importing nepali_num2word
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from nepali_num2word import compact_number
-
-
-def parse_number(number_str: str) -> Union[int, float]:
-    """
-    Parse a number string to int or float.
-    
-    Args:
-        number_str (str): String representation of the number.
-    
-    Returns:
-        Union[int, float]: Parsed number as int or float.
-    
-    Raises:
-        ValueError: If the string cannot be parsed as a number.
-    """
-    try:
-        if '.' in number_str:
-            return float(number_str)
-        else:
-            return int(number_str)
-    except ValueError:
-        raise ValueError(f"Invalid number format: {number_str}")
+from nepali_num2word import compact_number, parse_number
+from nepali_num2word.bench import run_cli
 
 
 def main():
@@ -53,6 +31,7 @@ def main():
     
     parser.add_argument(
         'number',
+        nargs='?',
         type=str,
         help='Number to convert (integer or float)'
     )
@@ -64,8 +43,26 @@ def main():
         help='Output language: en (English) or np (Nepali Unicode). Default: en'
     )
     
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Run the built-in benchmark for compact_number and exit'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='With --bench, print the report as JSON'
+    )
+    
+    args = parser.parse_args()
+    if args.bench:
+        run_cli(('compact_number',), as_json=args.json)
+        return
+    if args.number is None:
+        parser.error('the following arguments are required: number')
+    
     try:
-        args = parser.parse_args()
         number = parse_number(args.number)
         result = compact_number(number, lang=args.lang)
         print(result)
@@ -8,34 +8,12 @@ Currently not implemented - returns None for all inputs.
 import argparse
 import sys
 import os
-from typing import Union
 
 # Add parent directory to path for importing nepali_num2word
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from nepali_num2word import format_number
-
-
-def parse_number(number_str: str) -> Union[int, float]:
-    """
-    Parse a number string to int or float.
-    
-    Args:
-        number_str (str): String representation of the number.
-    
-    Returns:
-        Union[int, float]: Parsed number as int or float.
-    
-    Raises:
-        ValueError: If the string cannot be parsed as a number.
-    """
-    try:
-        if '.' in number_str:
-            return float(number_str)
-        else:
-            return int(number_str)
-    except ValueError:
-        raise ValueError(f"Invalid number format: {number_str}")
+from nepali_num2word import format_number, parse_number
+from nepali_num2word.bench import run_cli
 
 
 def main() -> None:
@@ -54,12 +32,14 @@ def main() -> None:
                '  %(prog)s 1000000           # Output: 10,00,000\n'
                '  %(prog)s 1000000 --lang np # Output: १०,००,०००\n'
                '  %(prog)s 120000            # Output: 1,20,000\n'
-               '  %(prog)s 123.45 --lang np  # Output: १२३.४५',
+               '  %(prog)s 123.45 --lang np  # Output: १२३.४५\n'
+               '  %(prog)s 1000000 --grouping international # Output: 1,000,000',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument(
         'number', 
+        nargs='?',
         type=str, 
         help='Number to format (integer or float)'
     )
@@ -71,11 +51,35 @@ def main() -> None:
         help='Language for output: "en" for English digits, "np" for Nepali Unicode digits (default: en)'
     )
     
+    parser.add_argument(
+        '--grouping',
+        choices=['nepali', 'international'],
+        default='nepali',
+        help='Comma grouping: "nepali" (10,00,000) or "international" (1,000,000) (default: nepali)'
+    )
+    
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Run the built-in benchmark for format_number and exit'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='With --bench, print the report as JSON'
+    )
+    
     args = parser.parse_args()
+    if args.bench:
+        run_cli(('format_number',), as_json=args.json)
+        return
+    if args.number is None:
+        parser.error('the following arguments are required: number')
 
     try:
         number = parse_number(args.number)
-        result = format_number(number, lang=args.lang)
+        result = format_number(number, lang=args.lang, grouping=args.grouping)
         
         if result is None:
             print("Format function not yet implemented. Returns None.", file=sys.stderr)
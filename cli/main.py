@@ -8,34 +8,12 @@ Supports both integer and float inputs with optional language parameter.
 import argparse
 import sys
 import os
-from typing import Union
 
 # Add parent directory to path for importing nepali_num2word
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from nepali_num2word import convert_to_words
-
-
-def parse_number(number_str: str) -> Union[int, float]:
-    """
-    Parse a number string to int or float.
-    
-    Args:
-        number_str (str): String representation of the number.
-    
-    Returns:
-        Union[int, float]: Parsed number as int or float.
-    
-    Raises:
-        ValueError: If the string cannot be parsed as a number.
-    """
-    try:
-        if '.' in number_str:
-            return float(number_str)
-        else:
-            return int(number_str)
-    except ValueError:
-        raise ValueError(f"Invalid number format: {number_str}")
+from nepali_num2word import convert_to_words, parse_number
+from nepali_num2word.bench import run_cli
 
 
 def main() -> None:
@@ -50,24 +28,43 @@ def main() -> None:
         epilog='Examples:\n'
                '  %(prog)s 120000\n'
                '  %(prog)s 123.45 --lang en\n'
-               '  %(prog)s 120000 --lang np',
+               '  %(prog)s 120000 --lang np\n'
+               '  %(prog)s 120000 --lang rom',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument(
         'number', 
+        nargs='?',
         type=str, 
         help='Number to convert (integer or float)'
     )
     
     parser.add_argument(
         '--lang', 
-        choices=['en', 'np'], 
+        choices=['en', 'np', 'rom'], 
         default='en',
-        help='Output language: en (English) or np (Nepali Unicode). Default: en'
+        help='Output language: en (English), np (Nepali Unicode) or rom (romanized Nepali). Default: en'
+    )
+    
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Run the built-in benchmark for all functions and exit'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='With --bench, print the report as JSON'
     )
     
     args = parser.parse_args()
+    if args.bench:
+        run_cli(('convert_to_words', 'format_number', 'compact_number'), as_json=args.json)
+        return
+    if args.number is None:
+        parser.error('the following arguments are required: number')
 
     try:
         number = parse_number(args.number)
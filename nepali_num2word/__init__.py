@@ -7,15 +7,78 @@ Nepali-style comma separation.
 
 Main functions:
     convert_to_words: Convert numbers to words
-    format_number: Format numbers with Nepali-style commas
+    convert_to_words_batch: Convert many numbers, optionally returning errors as values
+    format_number: Format numbers with Nepali-style or international commas
+    NumberFormatter: Formatter with a fixed language and grouping
     compact_number: Convert numbers to compact, human-readable format
+    convert_to_ordinal: Convert integers to ordinal words
+    convert_date_to_words: Convert Bikram Sambat dates to words
+    number_forms: Validate once and get words, grouping and compact form lazily
+    convert_to_tokens: Convert many numbers to compact token-ID results
+    iter_range_words: Words for a consecutive range, updating only changed groups
+    convert_to_mixed: Digits with scale words ("१ लाख २० हजार")
+    convert_to_point_words: Decimal-point words with every digit ("twelve point three four five")
+    convert_lines: Convert newline-delimited ASCII bytes without decoding each line
+    wrap_words: Words wrapped to a fixed display width for print layouts
+    WordStyle: Casing, hyphenation and cheque styles compiled into the word tables
+    parse_number: Parse numeric strings ("1,20,000", "रु. ५००", "1e5")
 """
 
-from .core import convert_to_words, format_number, compact_number
+from .core import (
+    convert_to_words, format_number, compact_number,
+    convert_to_words_batch, ConversionError, format_number_batch,
+    convert_to_ordinal, convert_to_ordinal_batch,
+)
+from .parser import parse_number
+
+# Public names defined in other submodules. They are imported on first access
+# (PEP 562), so ``import nepali_num2word`` only loads the core engine.
+_LAZY_IMPORTS = {
+    'convert_date_to_words': 'date', 'convert_date_to_words_batch': 'date',
+    'NumberFormatter': 'formatter',
+    'NumberForms': 'forms', 'number_forms': 'forms',
+    'convert_lines': 'lines',
+    'convert_to_mixed': 'mixed', 'convert_to_mixed_batch': 'mixed',
+    'convert_to_point_words': 'point', 'convert_to_point_words_batch': 'point',
+    'iter_range_words': 'ranges',
+    'CHEQUE': 'style', 'WordStyle': 'style',
+    'TokenizedWords': 'tokens', 'convert_to_tokens': 'tokens', 'decode_tokens': 'tokens',
+    'wrap_words': 'wrap', 'wrap_words_batch': 'wrap',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.2.3"
 __author__ = "Kushal"
 __email__ = "work.kusal@gmail.com"
 
-__all__ = ['convert_to_words', 'format_number', 'compact_number']
+__all__ = [
+    'convert_to_words', 'format_number', 'compact_number',
+    'convert_to_words_batch', 'ConversionError',
+    'format_number_batch', 'NumberFormatter',
+    'convert_to_ordinal', 'convert_to_ordinal_batch',
+    'convert_date_to_words', 'convert_date_to_words_batch',
+    'NumberForms', 'number_forms',
+    'parse_number',
+    'TokenizedWords', 'convert_to_tokens', 'decode_tokens',
+    'iter_range_words',
+    'convert_to_mixed', 'convert_to_mixed_batch',
+    'convert_lines',
+    'convert_to_point_words', 'convert_to_point_words_batch',
+    'WordStyle', 'CHEQUE',
+    'wrap_words', 'wrap_words_batch',
+]
 
@@ -0,0 +1,209 @@
+"""
+asyncio-friendly API for nepali-num2word.
+
+Converting a large batch in one call blocks the event loop for as long as the
+conversion takes. The functions here split the work into chunks and give the
+loop control between chunks, so other tasks keep running. With an
+``executor`` (``ThreadPoolExecutor`` or ``ProcessPoolExecutor``) the chunks run
+in the pool instead, via ``loop.run_in_executor``, and the loop only waits.
+
+Batch functions return the full list; ``stream_words`` is an async generator
+that yields results as chunks finish. Inputs may be ordinary or async
+iterables.
+
+Examples:
+    >>> import asyncio
+    >>> asyncio.run(convert_to_words_async([1, 120000]))
+    ['one', 'one lakh twenty thousand']
+"""
+
+import asyncio
+from collections import deque
+from functools import partial
+
+from .core import compact_number, convert_to_words_batch, format_number
+
+# Values converted between two yields to the event loop
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _format_chunk(chunk, lang):
+    """Format one chunk (module level so process pools can pickle it)."""
+    return [format_number(number, lang) for number in chunk]
+
+
+def _compact_chunk(chunk, precision, lang):
+    """Compact one chunk (module level so process pools can pickle it)."""
+    return [compact_number(number, precision, lang) for number in chunk]
+
+
+async def _chunks(numbers, chunk_size):
+    """Split an iterable or async iterable into lists of ``chunk_size`` values."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    chunk = []
+    if hasattr(numbers, '__aiter__'):
+        async for number in numbers:
+            chunk.append(number)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for number in numbers:
+            chunk.append(number)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _map_chunks(convert, numbers, chunk_size, executor, prefetch):
+    """
+    Run ``convert`` on each chunk and yield the chunk results in order.
+
+    Without an executor each chunk runs in the event loop thread, followed by
+    ``asyncio.sleep(0)``. With one, up to ``prefetch`` chunks are in flight in
+    the pool at a time.
+    """
+    if executor is None:
+        async for chunk in _chunks(numbers, chunk_size):
+            yield convert(chunk)
+            await asyncio.sleep(0)
+        return
+
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    try:
+        async for chunk in _chunks(numbers, chunk_size):
+            pending.append(loop.run_in_executor(executor, convert, chunk))
+            if len(pending) >= prefetch:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _collect(convert, numbers, chunk_size, executor, prefetch):
+    """Concatenate the chunk results of _map_chunks into one list."""
+    results = []
+    async for chunk in _map_chunks(convert, numbers, chunk_size, executor, prefetch):
+        results.extend(chunk)
+    return results
+
+
+async def convert_to_words_async(numbers, lang='en', errors='raise', chunk_size=DEFAULT_CHUNK_SIZE,
+                                 executor=None, prefetch=4):
+    """
+    Convert many numbers to words without blocking the event loop.
+
+    Args:
+        numbers (iterable or async iterable): Values accepted by convert_to_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+        errors (str, optional): 'raise' or 'return', as in convert_to_words_batch.
+                                Defaults to 'raise'.
+        chunk_size (int, optional): Values converted per chunk. Defaults to 1000.
+        executor (concurrent.futures.Executor, optional): Pool to run chunks in.
+                                Defaults to None (run in the event loop thread,
+                                yielding between chunks).
+        prefetch (int, optional): Chunks in flight at once when using an
+                                  executor. Defaults to 4.
+
+    Returns:
+        list: The words, or ``(results, errors)`` with ``errors='return'``.
+
+    Raises:
+        TypeError: With ``errors='raise'``, if any value is not a valid numeric type.
+        ValueError: With ``errors='raise'``, if any value is invalid or out of range.
+    """
+    convert = partial(convert_to_words_batch, lang=lang, errors=errors)
+    if errors != 'return':
+        return await _collect(convert, numbers, chunk_size, executor, prefetch)
+
+    results = []
+    failures = []
+    async for chunk_results, chunk_errors in _map_chunks(convert, numbers, chunk_size, executor, prefetch):
+        results.extend(chunk_results)
+        failures.extend(chunk_errors)
+    return results, failures
+
+
+async def format_number_async(numbers, lang='en', chunk_size=DEFAULT_CHUNK_SIZE, executor=None,
+                              prefetch=4):
+    """
+    Format many numbers with Nepali-style commas without blocking the event loop.
+
+    Args:
+        numbers (iterable or async iterable): Values accepted by format_number.
+        lang (str, optional): 'en' or 'np'. Defaults to 'en'.
+        chunk_size (int, optional): Values formatted per chunk. Defaults to 1000.
+        executor (concurrent.futures.Executor, optional): Pool to run chunks in.
+                                Defaults to None.
+        prefetch (int, optional): Chunks in flight at once when using an
+                                  executor. Defaults to 4.
+
+    Returns:
+        list: The formatted numbers.
+    """
+    convert = partial(_format_chunk, lang=lang)
+    return await _collect(convert, numbers, chunk_size, executor, prefetch)
+
+
+async def compact_number_async(numbers, precision=1, lang='en', chunk_size=DEFAULT_CHUNK_SIZE,
+                               executor=None, prefetch=4):
+    """
+    Convert many numbers to compact form without blocking the event loop.
+
+    Args:
+        numbers (iterable or async iterable): Values accepted by compact_number.
+        precision (int, optional): Decimal places to show. Defaults to 1.
+        lang (str, optional): 'en' or 'np'. Defaults to 'en'.
+        chunk_size (int, optional): Values converted per chunk. Defaults to 1000.
+        executor (concurrent.futures.Executor, optional): Pool to run chunks in.
+                                Defaults to None.
+        prefetch (int, optional): Chunks in flight at once when using an
+                                  executor. Defaults to 4.
+
+    Returns:
+        list: The compact representations.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+    """
+    convert = partial(_compact_chunk, precision=precision, lang=lang)
+    return await _collect(convert, numbers, chunk_size, executor, prefetch)
+
+
+async def stream_words(numbers, lang='en', chunk_size=DEFAULT_CHUNK_SIZE, executor=None, prefetch=4):
+    """
+    Convert numbers to words, yielding each result as its chunk finishes.
+
+    Args:
+        numbers (iterable or async iterable): Values accepted by convert_to_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+        chunk_size (int, optional): Values converted per chunk. Defaults to 1000.
+        executor (concurrent.futures.Executor, optional): Pool to run chunks in.
+                                Defaults to None.
+        prefetch (int, optional): Chunks in flight at once when using an
+                                  executor. Defaults to 4.
+
+    Yields:
+        str: The words for each value, in input order.
+
+    Raises:
+        TypeError: If a value is not a valid numeric type.
+        ValueError: If a value is invalid or out of range.
+
+    Examples:
+        >>> async def main():
+        ...     return [words async for words in stream_words(range(3))]
+        >>> asyncio.run(main())
+        ['zero', 'one', 'two']
+    """
+    convert = partial(convert_to_words_batch, lang=lang)
+    async for chunk in _map_chunks(convert, numbers, chunk_size, executor, prefetch):
+        for words in chunk:
+            yield words
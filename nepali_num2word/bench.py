@@ -0,0 +1,177 @@
+"""
+Built-in self-benchmark for nepali-num2word.
+
+Runs fixed workloads through ``convert_to_words``, ``format_number`` and
+``compact_number`` in English and Nepali and reports throughput and latency
+percentiles. Inputs come from a seeded generator, so every host and release
+converts exactly the same values and results can be compared directly.
+
+Usage:
+    nepaliword --bench [--json]
+    python -m nepali_num2word.bench [--json] [--count N]
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+
+from . import __version__
+from .core import compact_number, convert_to_words, format_number
+
+# Seed of the workload generator; changing it changes every workload
+SEED = 20250101
+
+# Calls timed together as one latency sample
+SAMPLE_SIZE = 100
+
+FUNCTIONS = {
+    'convert_to_words': lambda number, lang: convert_to_words(number, lang),
+    'format_number': lambda number, lang: format_number(number, lang),
+    'compact_number': lambda number, lang: compact_number(number, 1, lang),
+}
+
+LANGUAGES = ('en', 'np')
+
+
+def workloads(count):
+    """
+    Build the standard workloads.
+
+    Args:
+        count (int): Values per workload.
+
+    Returns:
+        dict: Workload name -> list of input values.
+    """
+    rng = random.Random(SEED)
+    return {
+        'int': [rng.randint(0, 999999999) for _ in range(count)],
+        'int<1e5': [rng.randint(0, 99999) for _ in range(count)],
+        'rupees': [rng.randint(0, 99999999) / 100 for _ in range(count)],
+        'string': [str(rng.randint(-999999999, 999999999)) for _ in range(count)],
+    }
+
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_benchmarks(count=20000, functions=tuple(FUNCTIONS), languages=LANGUAGES):
+    """
+    Time every function, language and workload combination.
+
+    Each combination first runs one sample untimed as a warm-up. It is then timed in
+    samples of SAMPLE_SIZE calls; percentiles are over the per-call time of
+    those samples.
+
+    Args:
+        count (int, optional): Values per workload. Defaults to 20,000.
+        functions (tuple, optional): Names from FUNCTIONS. Defaults to all.
+        languages (tuple, optional): Language codes. Defaults to ('en', 'np').
+
+    Returns:
+        dict: ``meta`` (version, Python, platform, seed, count) and ``results``,
+              a list of dicts with ``function``, ``lang``, ``workload``, ``ops``,
+              ``ops_per_sec``, ``ns_per_op``, ``p50_ns``, ``p90_ns`` and ``p99_ns``.
+    """
+    inputs = workloads(count)
+    results = []
+    clock = time.perf_counter_ns
+    for name in functions:
+        func = FUNCTIONS[name]
+        for lang in languages:
+            for workload, values in inputs.items():
+                for number in values[:SAMPLE_SIZE]:
+                    func(number, lang)
+                samples = []
+                total = 0
+                for start in range(0, len(values), SAMPLE_SIZE):
+                    sample = values[start:start + SAMPLE_SIZE]
+                    began = clock()
+                    for number in sample:
+                        func(number, lang)
+                    elapsed = clock() - began
+                    total += elapsed
+                    samples.append(elapsed / len(sample))
+                samples.sort()
+                results.append({
+                    'function': name,
+                    'lang': lang,
+                    'workload': workload,
+                    'ops': len(values),
+                    'ops_per_sec': round(len(values) * 1e9 / total) if total else 0,
+                    'ns_per_op': round(total / len(values), 1),
+                    'p50_ns': round(_percentile(samples, 0.50), 1),
+                    'p90_ns': round(_percentile(samples, 0.90), 1),
+                    'p99_ns': round(_percentile(samples, 0.99), 1),
+                })
+    meta = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'seed': SEED,
+        'count': count,
+        'sample_size': SAMPLE_SIZE,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def format_report(report):
+    """
+    Render a benchmark report as a text table.
+
+    Args:
+        report (dict): Output of run_benchmarks.
+
+    Returns:
+        str: The table, one line per result.
+    """
+    meta = report['meta']
+    lines = [
+        f"nepali-num2word {meta['version']} on {meta['implementation']} {meta['python']} "
+        f"({meta['platform']}), {meta['count']:,} values per workload, seed {meta['seed']}",
+        f"{'function':<17} {'lang':<4} {'workload':<8} {'ops/s':>12} {'ns/op':>9} "
+        f"{'p50':>9} {'p90':>9} {'p99':>9}",
+    ]
+    for row in report['results']:
+        lines.append(
+            f"{row['function']:<17} {row['lang']:<4} {row['workload']:<8} "
+            f"{row['ops_per_sec']:>12,} {row['ns_per_op']:>9.1f} "
+            f"{row['p50_ns']:>9.1f} {row['p90_ns']:>9.1f} {row['p99_ns']:>9.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def run_cli(functions=tuple(FUNCTIONS), as_json=False, count=20000):
+    """
+    Run the benchmarks and print the report for a command-line tool.
+
+    Args:
+        functions (tuple, optional): Names from FUNCTIONS. Defaults to all.
+        as_json (bool, optional): Print JSON instead of a table. Defaults to False.
+        count (int, optional): Values per workload. Defaults to 20,000.
+    """
+    report = run_benchmarks(count, functions)
+    print(json.dumps(report, indent=2) if as_json else format_report(report))
+
+
+def main():
+    """Command-line entry point for ``python -m nepali_num2word.bench``."""
+    parser = argparse.ArgumentParser(description='Benchmark nepali-num2word on this host.')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--count', type=int, default=20000, help='Values per workload (default: 20000)')
+    parser.add_argument('--function', action='append', choices=list(FUNCTIONS),
+                        help='Benchmark only this function (repeatable)')
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error('--count must be at least 1')
+    run_cli(tuple(args.function or FUNCTIONS), args.json, args.count)
+
+
+if __name__ == "__main__":
+    main()
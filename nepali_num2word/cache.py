@@ -0,0 +1,217 @@
+"""
+Result cache with warm-start snapshots for nepali-num2word.
+
+Batch workers that restart often lose any cached results for the amounts that
+occur most in their data. ``ResultCache`` caches ``convert_to_words``,
+``format_number`` and ``compact_number`` results and can write its most used
+entries to a small file. It can load that file at startup. A snapshot records
+the package version and a fingerprint of the word tables and engine revision,
+and it is ignored when either differs, so a new release never serves stale
+words.
+
+Snapshot layout (integers little-endian):
+    header:   magic (8s), format version (H), entry count (I),
+              CRC-32 of payload (I), table and engine fingerprint (32s),
+              SHA-256 of the package version (32s)
+    payload:  zlib-compressed JSON list of groups
+              ``[function, lang, option, type tag, [values], [results]]``, where
+              the option is the compact precision or the format grouping
+"""
+
+import hashlib
+import heapq
+import json
+import struct
+import threading
+import zlib
+from itertools import repeat
+
+from . import __version__, core
+
+MAGIC = b'NPNWSNAP'
+FORMAT_VERSION = 2
+
+# Magic and format version, readable in every format version
+_PREFIX = struct.Struct('<8sH')
+_HEADER = struct.Struct('<8sHII32s32s')
+
+# Input types that are cached, with the tag stored in snapshots. JSON keeps
+# each of them as the same type, so values load back unchanged.
+_TYPE_TAGS = {int: 'i', float: 'f', str: 's'}
+
+# Cached functions by name; ``option`` is the grouping or precision argument
+_FUNCTIONS = {
+    'words': lambda number, lang, option: core.convert_to_words(number, lang),
+    'format': lambda number, lang, option: core.format_number(number, lang, option),
+    'compact': lambda number, lang, option: core.compact_number(number, option, lang),
+}
+
+
+def _version_digest():
+    """SHA-256 of the package version, any length."""
+    return hashlib.sha256(__version__.encode('utf-8')).digest()
+
+
+class ResultCache:
+    """
+    Cache for convert_to_words, format_number and compact_number results.
+
+    Only ``int``, ``float`` and ``str`` inputs are cached; other types and
+    invalid values go straight to the engine, and errors are never cached.
+    Once ``maxsize`` entries are stored, each new result evicts the least
+    recently used entry, so amounts that become hot later still get cached.
+    Hit counts decide which entries ``save()`` writes.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached results. Defaults to 100,000.
+
+    Examples:
+        >>> cache = ResultCache()
+        >>> cache.convert_to_words(120000)
+        'one lakh twenty thousand'
+        >>> cache.save('hot.snap')
+        1
+        >>> ResultCache().load('hot.snap')
+        1
+    """
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        # key -> [result, hits]
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _get(self, function, number, lang, option):
+        tag = _TYPE_TAGS.get(type(number))
+        if tag is None:
+            return _FUNCTIONS[function](number, lang, option)
+        key = (function, lang, option, tag, number)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                entry[1] += 1
+                # Reinsert as most recently used; dicts keep insertion order
+                self._entries[key] = entry
+                return entry[0]
+        result = _FUNCTIONS[function](number, lang, option)
+        with self._lock:
+            entries = self._entries
+            if key not in entries and self.maxsize > 0:
+                if len(entries) >= self.maxsize:
+                    # Evict the least recently used entry
+                    del entries[next(iter(entries))]
+                entries[key] = [result, 0]
+        return result
+
+    def convert_to_words(self, number, lang='en'):
+        """Cached ``convert_to_words(number, lang)``."""
+        return self._get('words', number, lang, None)
+
+    def format_number(self, number, lang='en', grouping='nepali'):
+        """Cached ``format_number(number, lang, grouping)``."""
+        return self._get('format', number, lang, grouping)
+
+    def compact_number(self, number, precision=1, lang='en'):
+        """Cached ``compact_number(number, precision, lang)``."""
+        return self._get('compact', number, lang, precision)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def save(self, path, limit=None):
+        """
+        Write the most used entries to a snapshot file.
+
+        Args:
+            path (str): Destination file path.
+            limit (int, optional): Maximum entries to write, most hits first.
+                                   Defaults to all cached entries.
+
+        Returns:
+            int: Number of entries written.
+        """
+        with self._lock:
+            items = [(key, result, hits) for key, (result, hits) in self._entries.items()]
+        if limit is not None and limit < len(items):
+            items = heapq.nlargest(limit, items, key=lambda item: item[2])
+        groups = {}
+        for key, result, _ in items:
+            values, results = groups.setdefault(key[:4], ([], []))
+            values.append(key[4])
+            results.append(result)
+        payload = json.dumps(
+            [list(group) + [values, results] for group, (values, results) in groups.items()],
+            ensure_ascii=False, separators=(',', ':'),
+        )
+        payload = zlib.compress(payload.encode('utf-8'))
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, len(items), zlib.crc32(payload),
+            bytes.fromhex(core._tables_fingerprint()), _version_digest(),
+        )
+        with open(path, 'wb') as handle:
+            handle.write(header)
+            handle.write(payload)
+        return len(items)
+
+    def load(self, path):
+        """
+        Add the entries of a snapshot file to the cache.
+
+        A snapshot from another package version, other word tables, another
+        engine revision or an older snapshot format is ignored, so it can
+        safely be left in place across upgrades.
+
+        Args:
+            path (str): Snapshot written by ``save()``.
+
+        Returns:
+            int: Number of entries loaded (0 for a stale snapshot).
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid snapshot.
+        """
+        with open(path, 'rb') as handle:
+            data = handle.read()
+        if len(data) < _PREFIX.size:
+            raise ValueError(f"{path} is not a cache snapshot: file too short")
+        magic, version = _PREFIX.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a cache snapshot: bad magic")
+        if version < FORMAT_VERSION:
+            # Written by an older release
+            return 0
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache snapshot version {version}, expected {FORMAT_VERSION}")
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a cache snapshot: file too short")
+        _, _, count, crc, fingerprint, version_digest = _HEADER.unpack_from(data, 0)
+        payload = memoryview(data)[_HEADER.size:]
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f"{path} failed its integrity check (CRC mismatch)")
+        if version_digest != _version_digest() or fingerprint.hex() != core._tables_fingerprint():
+            return 0
+
+        groups = json.loads(zlib.decompress(payload).decode('utf-8'))
+        if sum(len(group[4]) for group in groups) != count:
+            raise ValueError(f"{path} is corrupt: entry count does not match")
+        with self._lock:
+            before = len(self._entries)
+            room = self.maxsize - before
+            loaded = {}
+            for function, lang, option, tag, values, results in groups:
+                if room <= 0:
+                    break
+                values, results = values[:room], results[:room]
+                room -= len(values)
+                keys = zip(repeat(function), repeat(lang), repeat(option), repeat(tag), values)
+                loaded.update(zip(keys, map(list, zip(results, repeat(0)))))
+            # Entries already in the cache keep their results and hit counts
+            loaded.update(self._entries)
+            self._entries = loaded
+            return len(loaded) - before
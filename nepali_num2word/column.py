@@ -0,0 +1,288 @@
+"""
+Arrow-style string columns for bulk conversions in nepali-num2word.
+
+A ``Utf8Column`` holds many results in one contiguous UTF-8 ``bytearray`` plus
+an offsets array (int32, or int64 for large columns), the same layout Apache
+Arrow uses for its ``utf8``/``large_utf8`` types. Words are appended to the
+buffer from pre-encoded fragments, with no per-value ``str`` or ``bytes``.
+Formatted and compact strings are still built as ``str`` by the engine and
+encoded one at a time, then copied into a preallocated buffer that doubles when
+full. The data and offsets are exposed as ``memoryview``s without copying,
+e.g. for::
+
+    pyarrow.Array.from_buffers(pyarrow.utf8(), len(column),
+                               [None, pyarrow.py_buffer(column.offsets_view),
+                                pyarrow.py_buffer(column.data_view)])
+"""
+
+from array import array
+
+from .core import (
+    CURRENCY, GROUPS, SCALES, WORDS, _split_currency, _split_groups, _validate_number,
+    compact_number, format_number,
+)
+
+# Initial buffer size in bytes
+DEFAULT_CAPACITY = 1 << 16
+
+_INT32_MAX = 2 ** 31 - 1
+
+# Shared zero block used to grow buffers without allocating a temporary of the
+# full growth size
+_ZERO_BLOCK = bytes(1 << 20)
+
+
+class Utf8Column:
+    """
+    Strings stored back to back in one UTF-8 buffer with an offsets array.
+
+    String ``i`` is ``data[offsets[i]:offsets[i + 1]]``. Only the first
+    ``nbytes`` bytes of ``data`` are used; the rest is spare capacity.
+
+    While a view returned by ``data_view`` is alive the buffer cannot grow, so
+    release views before appending more strings.
+
+    Args:
+        capacity (int, optional): Initial buffer size in bytes. Defaults to 64 KiB.
+        large_offsets (bool, optional): Use int64 offsets (Arrow ``large_utf8``)
+                                        instead of int32. Defaults to False.
+
+    Attributes:
+        data (bytearray): The UTF-8 buffer, including spare capacity.
+        offsets (array): ``len(self) + 1`` offsets, typecode 'i' or 'q'.
+
+    Examples:
+        >>> column = convert_to_words_column([1, 25])
+        >>> bytes(column.data_view)
+        b'onetwenty-five'
+        >>> list(column.offsets)
+        [0, 3, 14]
+        >>> column[1]
+        'twenty-five'
+    """
+
+    __slots__ = ('data', 'offsets', 'nbytes')
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, large_offsets=False):
+        self.data = bytearray(max(capacity, 1))
+        self.offsets = array('q' if large_offsets else 'i', [0])
+        self.nbytes = 0
+
+    def append(self, encoded):
+        """
+        Append one already encoded string.
+
+        Args:
+            encoded (bytes): UTF-8 bytes of the string.
+
+        Raises:
+            OverflowError: If a column with int32 offsets would exceed 2 GiB.
+            BufferError: If the buffer must grow while a view of it is alive.
+        """
+        start = self.nbytes
+        end = start + len(encoded)
+        if end > len(self.data):
+            self._grow(end)
+        self.data[start:end] = encoded
+        self.nbytes = end
+        self.offsets.append(end)
+
+    def extend(self, encoded_strings):
+        """
+        Append many already encoded strings.
+
+        Args:
+            encoded_strings (iterable): UTF-8 bytes of each string.
+
+        Raises:
+            OverflowError: If a column with int32 offsets would exceed 2 GiB.
+            BufferError: If the buffer must grow while a view of it is alive.
+        """
+        data = self.data
+        offsets = self.offsets
+        position = self.nbytes
+        capacity = len(data)
+        try:
+            for encoded in encoded_strings:
+                end = position + len(encoded)
+                if end > capacity:
+                    self._grow(end)
+                    capacity = len(data)
+                data[position:end] = encoded
+                position = end
+                offsets.append(end)
+        finally:
+            self.nbytes = position
+
+    def _grow(self, needed):
+        """Enlarge the buffer to at least ``needed`` bytes, doubling its size."""
+        if self.offsets.typecode == 'i' and needed > _INT32_MAX:
+            raise OverflowError("Column exceeds 2 GiB; use large_offsets=True")
+        data = self.data
+        missing = max(needed, 2 * len(data)) - len(data)
+        block = len(_ZERO_BLOCK)
+        while missing > 0:
+            data += _ZERO_BLOCK if missing >= block else memoryview(_ZERO_BLOCK)[:missing]
+            missing -= block
+
+    def shrink_to_fit(self):
+        """Release the spare capacity at the end of the buffer."""
+        del self.data[max(self.nbytes, 1):]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Utf8Column index out of range")
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    def __iter__(self):
+        data = self.data
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield data[offsets[i]:offsets[i + 1]].decode('utf-8')
+
+    @property
+    def data_view(self):
+        """memoryview: The used part of the UTF-8 buffer, without copying."""
+        return memoryview(self.data)[:self.nbytes]
+
+    @property
+    def offsets_view(self):
+        """memoryview: The offsets as int32 or int64 values, without copying."""
+        return memoryview(self.offsets)
+
+    def __repr__(self):
+        return (f"Utf8Column({len(self)} strings, {self.nbytes} bytes, "
+                f"offsets={'int64' if self.offsets.typecode == 'q' else 'int32'})")
+
+
+def convert_to_words_column(numbers, lang='en', large_offsets=False):
+    """
+    Convert many numbers to words in a ``Utf8Column``.
+
+    Results are assembled from pre-encoded word fragments appended to the
+    column buffer with ``+=``, so no intermediate ``str`` or ``bytes`` is built
+    per value. The buffer is not preallocated: it grows through ``bytearray``'s
+    own over-allocation, which is faster here than writing fragments into a
+    preallocated buffer by slice assignment.
+
+    Args:
+        numbers (iterable): Values accepted by convert_to_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+        large_offsets (bool, optional): Use int64 offsets. Defaults to False.
+
+    Returns:
+        Utf8Column: ``column[i] == convert_to_words(numbers[i], lang)``, with
+                    the spare capacity released.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+        OverflowError: If a column with int32 offsets would exceed 2 GiB.
+    """
+    if lang not in WORDS:
+        lang = 'en'
+    # Every fragment ends with a space; the one after a result's last
+    # fragment is removed again
+    words = tuple(f"{word} ".encode('utf-8') for word in WORDS[lang])
+    scaled = {
+        scale: tuple(f"{word} {SCALES[lang][scale]} ".encode('utf-8') for word in WORDS[lang])
+        for _, scale in GROUPS
+    }
+    # rupee, rupees, paisa, paise, connector
+    units = tuple(f"{word.strip()} ".encode('utf-8') for word in CURRENCY[lang])
+    zero = words[0]
+
+    column = Utf8Column(0, large_offsets)
+    data = column.data
+    offsets = column.offsets
+    limit = _INT32_MAX if offsets.typecode == 'i' else None
+    del data[:]
+    try:
+        for number in numbers:
+            number = _validate_number(number)
+            if number < 0:
+                data += b'-'
+                number = -number
+            if type(number) is int:
+                if number:
+                    for count, scale in _split_groups(number):
+                        data += scaled[scale][count] if scale else words[count]
+                else:
+                    data += zero
+            else:
+                parts = _split_currency(number)
+                if not parts:
+                    data += zero
+                for index, (amount, unit) in enumerate(parts):
+                    if index:
+                        data += units[4]
+                    for count, scale in _split_groups(amount):
+                        data += scaled[scale][count] if scale else words[count]
+                    data += units[unit]
+            del data[-1]
+            if limit is not None and len(data) > limit:
+                raise OverflowError("Column exceeds 2 GiB; use large_offsets=True")
+            offsets.append(len(data))
+    finally:
+        column.nbytes = len(data)
+    column.shrink_to_fit()
+    return column
+
+
+def format_number_column(numbers, lang='en', capacity=DEFAULT_CAPACITY, large_offsets=False):
+    """
+    Format many numbers with Nepali-style commas in a ``Utf8Column``.
+
+    Each result is formatted as a ``str``, encoded, and copied into the
+    preallocated buffer.
+
+    Args:
+        numbers (iterable): Values accepted by format_number.
+        lang (str, optional): 'en' for English digits, 'np' for Nepali digits.
+                              Defaults to 'en'.
+        capacity (int, optional): Initial buffer size in bytes. Defaults to 64 KiB.
+        large_offsets (bool, optional): Use int64 offsets. Defaults to False.
+
+    Returns:
+        Utf8Column: ``column[i] == format_number(numbers[i], lang)``, with
+                    the spare capacity released.
+    """
+    column = Utf8Column(capacity, large_offsets)
+    column.extend(format_number(number, lang).encode('utf-8') for number in numbers)
+    column.shrink_to_fit()
+    return column
+
+
+def compact_number_column(numbers, precision=1, lang='en', capacity=DEFAULT_CAPACITY,
+                          large_offsets=False):
+    """
+    Convert many numbers to compact form in a ``Utf8Column``.
+
+    Each result is built as a ``str``, encoded, and copied into the
+    preallocated buffer.
+
+    Args:
+        numbers (iterable): Values accepted by compact_number.
+        precision (int, optional): Decimal places to show. Defaults to 1.
+        lang (str, optional): 'en' for English, 'np' for Nepali. Defaults to 'en'.
+        capacity (int, optional): Initial buffer size in bytes. Defaults to 64 KiB.
+        large_offsets (bool, optional): Use int64 offsets. Defaults to False.
+
+    Returns:
+        Utf8Column: ``column[i] == compact_number(numbers[i], precision, lang)``,
+                    with the spare capacity released.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+    """
+    column = Utf8Column(capacity, large_offsets)
+    column.extend(compact_number(number, precision, lang).encode('utf-8') for number in numbers)
+    column.shrink_to_fit()
+    return column
@@ -3,22 +3,34 @@ Core module for nepali-num2word package.
 
 This module provides functions to convert numbers to words in Nepali-style format
 and format numbers with Nepali-style comma separation.
+
+All lookup tables are immutable (tuples and read-only mappings) and every public
+function is free of shared mutable state, so the module is safe to use from
+multiple threads, including on free-threaded (no-GIL) CPython builds.
 """
 
+import math
+import numbers
+from collections import namedtuple
+from decimal import Decimal
+from types import MappingProxyType
+
+from .parser import _parse, _parse_error, _too_large_message, parse_number
+
 # Basic number words mapping (0-19)
-ONES = [
+ONES = (
     'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine',
     'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 
     'seventeen', 'eighteen', 'nineteen'
-]
+)
 
 # Tens (20, 30, 40, etc.)
-TENS = [
+TENS = (
     '', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety'
-]
+)
 
 # Nepali number words mapping (0-99) - Complete lookup table
-ONES_NP = [
+ONES_NP = (
     'शून्य', 'एक', 'दुई', 'तीन', 'चार', 'पाँच', 'छ', 'सात', 'आठ', 'नौ',
     'दश', 'एघार', 'बाह्र', 'तेह्र', 'चौध', 'पन्ध्र', 'सोह्र', 'सत्र', 'अठार', 'उन्नाइस',
     'बीस', 'एक्काइस', 'बाइस', 'तेइस', 'चौबीस', 'पच्चिस', 'छब्बिस', 'सत्ताइस', 'अठ्ठाईस', 'उनन्तीस',
@@ -29,26 +41,176 @@ ONES_NP = [
     'सत्तरी', 'एकहत्तर', 'बहत्तर', 'त्रिहत्तर', 'चौहत्तर', 'पचहत्तर', 'छयहत्तर', 'सतहत्तर', 'अठहत्तर', 'उनासी',
     'असी', 'एकासी', 'बयासी', 'त्रियासी', 'चौरासी', 'पचासी', 'छयासी', 'सतासी', 'अठासी', 'उनान्नब्बे',
     'नब्बे', 'एकान्नब्बे', 'बयान्नब्बे', 'त्रियान्नब्बे', 'चौरान्नब्बे', 'पन्चान्नब्बे', 'छयान्नब्बे', 'सन्तान्‍नब्बे', 'अन्ठान्नब्बे', 'उनान्सय'
-]
+)
 
 # Nepali scale words
-SCALE_NP = {
+SCALE_NP = MappingProxyType({
     'hundred': 'सय',
     'thousand': 'हजार',
     'lakh': 'लाख',
     'crore': 'करोड'
-}
+})
+
+# Romanized Nepali number words (0-99), spelled after ONES_NP.
+# ASCII only, so the output fits GSM-7 SMS encoding.
+ONES_ROM = (
+    'shunya', 'ek', 'dui', 'tin', 'char', 'panch', 'chha', 'saat', 'aath', 'nau',
+    'das', 'eghara', 'bahra', 'tehra', 'chaudha', 'pandhra', 'sohra', 'satra', 'athara', 'unnais',
+    'bis', 'ekkais', 'bais', 'teis', 'chaubis', 'pachchis', 'chhabbis', 'sattais', 'aththais', 'unantis',
+    'tis', 'ektis', 'battis', 'tettis', 'chauntis', 'paintis', 'chhattis', 'saintis', 'athtis', 'unanchalis',
+    'chalis', 'ekchalis', 'bayalis', 'trichalis', 'chawalis', 'paintalis', 'chhayalis', 'sachchalis', 'athchalis', 'unanchas',
+    'pachas', 'ekaunna', 'baunna', 'tripanna', 'chauwanna', 'pachpanna', 'chhapanna', 'santaunna', 'anthaunna', 'unansathi',
+    'sathi', 'eksaththi', 'bayasaththi', 'trisaththi', 'chaunsaththi', 'painsaththi', 'chhayasaththi', 'satsaththi', 'athsaththi', 'unansattari',
+    'sattari', 'ekhattar', 'bahattar', 'trihattar', 'chauhattar', 'pachahattar', 'chhayahattar', 'satahattar', 'athahattar', 'unasi',
+    'asi', 'ekasi', 'bayasi', 'triyasi', 'chaurasi', 'pachasi', 'chhayasi', 'satasi', 'athasi', 'unannabbe',
+    'nabbe', 'ekannabbe', 'bayannabbe', 'triyannabbe', 'chaurannabbe', 'panchannabbe', 'chhayannabbe', 'santannabbe', 'anthannabbe', 'unansaya'
+)
+
+# Romanized Nepali scale words
+SCALE_ROM = MappingProxyType({
+    'hundred': 'saya',
+    'thousand': 'hajar',
+    'lakh': 'lakh',
+    'crore': 'karod'
+})
+
+# English scale words
+SCALE_EN = MappingProxyType({
+    'hundred': 'hundred',
+    'thousand': 'thousand',
+    'lakh': 'lakh',
+    'crore': 'crore'
+})
+
+# Largest absolute value the converters accept (99 crore ...)
+MAX_NUMBER = 999999999
+
+# Nepali-style groups, largest first: (divisor, scale key)
+GROUPS = (
+    (10000000, 'crore'),
+    (100000, 'lakh'),
+    (1000, 'thousand'),
+    (100, 'hundred'),
+)
+
+# Revision of the conversion rules. Bump it whenever output changes without a
+# word table change (parsing, rounding, formatting options), so precomputed
+# word tables and cache snapshots from earlier code are treated as stale.
+ENGINE_REVISION = 1
+
+# English ordinal forms that do not simply add "th"
+_ORDINAL_EXCEPTIONS_EN = MappingProxyType({
+    'zero': 'zeroth', 'one': 'first', 'two': 'second', 'three': 'third',
+    'five': 'fifth', 'eight': 'eighth', 'nine': 'ninth', 'twelve': 'twelfth',
+})
+
+# Nepali ordinals for 1-4 when used on their own ("पहिलो", not "एकौँ")
+_ORDINALS_NP_STANDALONE = MappingProxyType({
+    1: 'पहिलो', 2: 'दोस्रो', 3: 'तेस्रो', 4: 'चौथो',
+})
+
+# Nepali ordinal forms that do not simply add "औँ"/"ौँ"
+_ORDINAL_EXCEPTIONS_NP = MappingProxyType({
+    'छ': 'छैटौँ', 'नौ': 'नवौँ',
+})
+
+# Translation table from Western digits (0-9) to Nepali digits (०-९)
+_NEPALI_DIGITS = MappingProxyType(str.maketrans('0123456789', '०१२३४५६७८९'))
+
+
+
+def _english_basic_word(number):
+    """Build the English word for 0-99 from ONES and TENS."""
+    if number < 20:
+        return ONES[number]
+    tens_digit, ones_digit = divmod(number, 10)
+    if ones_digit == 0:
+        return TENS[tens_digit]
+    return f"{TENS[tens_digit]}-{ONES[ones_digit]}"
+
 
+def _english_ordinal_word(word):
+    """Turn the last part of an English number word into its ordinal form."""
+    head, _, last = word.rpartition('-')
+    if last in _ORDINAL_EXCEPTIONS_EN:
+        last = _ORDINAL_EXCEPTIONS_EN[last]
+    elif last.endswith('y'):
+        last = last[:-1] + 'ieth'
+    else:
+        last = last + 'th'
+    return f"{head}-{last}" if head else last
+
+
+def _nepali_ordinal_word(word):
+    """Turn a Nepali number or scale word into its ordinal form (सात → सातौँ)."""
+    if word in _ORDINAL_EXCEPTIONS_NP:
+        return _ORDINAL_EXCEPTIONS_NP[word]
+    # Consonants take the vowel sign (ौँ); vowels and vowel signs take the full vowel (औँ)
+    if '\u0915' <= word[-1] <= '\u0939':
+        return word + '\u094c\u0901'
+    return word + '\u0914\u0901'
+
+
+# Precomputed words for 0-99, indexed by language
+WORDS = MappingProxyType({
+    'en': tuple(_english_basic_word(n) for n in range(100)),
+    'np': ONES_NP,
+    'rom': ONES_ROM,
+})
+
+# Scale words, indexed by language
+SCALES = MappingProxyType({
+    'en': SCALE_EN,
+    'np': SCALE_NP,
+    'rom': SCALE_ROM,
+})
+
+# Currency words, indexed by language: (rupee, rupees, paisa, paise, connector)
+CURRENCY = MappingProxyType({
+    'en': ('rupee', 'rupees', 'paisa', 'paise', ' and '),
+    'np': ('रुपैयाँ', 'रुपैयाँ', 'पैसा', 'पैसा', ' र '),
+    'rom': ('rupaiyan', 'rupaiyan', 'paisa', 'paisa', ' ra '),
+})
+
+# Precomputed ordinal words for 0-99 as the last group of a larger number
+ORDINAL_WORDS = MappingProxyType({
+    'en': tuple(_english_ordinal_word(word) for word in WORDS['en']),
+    'np': tuple(_nepali_ordinal_word(word) for word in WORDS['np']),
+})
+
+# Precomputed ordinal words for 0-99 used on their own
+ORDINAL_WORDS_STANDALONE = MappingProxyType({
+    'en': ORDINAL_WORDS['en'],
+    'np': tuple(_ORDINALS_NP_STANDALONE.get(n, word) for n, word in enumerate(ORDINAL_WORDS['np'])),
+})
 
-def convert_to_words(number, lang='en'):
+# Ordinal scale words ("hundredth", "सयौँ"), indexed by language
+ORDINAL_SCALES = MappingProxyType({
+    'en': MappingProxyType({key: f"{word}th" for key, word in SCALE_EN.items()}),
+    'np': MappingProxyType({key: _nepali_ordinal_word(word) for key, word in SCALE_NP.items()}),
+})
+
+# Error record returned by convert_to_words_batch(errors='return')
+ConversionError = namedtuple('ConversionError', ['code', 'message'])
+
+# Optional precomputed word table for 0-99,999 (see nepali_num2word.table).
+# Replaced as a whole by install_word_table(), never mutated in place.
+_word_table = None
+
+
+def convert_to_words(number, lang='en', style=None):
     """
     Convert a number to words in Nepali-style format (crore, lakh, thousand).
     
     Args:
-        number (int or float): The number to convert to words.
+        number (int, float, str or other real number): The number to convert to words.
                               Can be integer or float, including negative numbers.
-        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali.
-                              Defaults to 'en'. Both languages are now supported.
+                              Any ``numbers.Integral``/``numbers.Real`` (NumPy
+                              scalars, Fraction) and ``Decimal`` are accepted too.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali,
+                              'rom' for romanized Nepali in plain ASCII. Defaults to 'en'.
+        style (WordStyle, optional): Casing, hyphenation, "and" and prefix/suffix
+                              options (see nepali_num2word.style). Defaults to None.
     
     Returns:
         str: The number converted to words.
@@ -72,91 +234,319 @@ def convert_to_words(number, lang='en'):
         'एक सय तेइस रुपैयाँ र पैँतालीस पैसा'
         >>> convert_to_words(-123, lang='np')
         '-एक सय तेइस'
+        >>> convert_to_words(120000, lang='rom')
+        'ek lakh bis hajar'
+    """
+    if style is not None:
+        return style.convert(number, lang)
+    number = _validate_number(number)
+    return _number_words(number, lang)
+
+def convert_to_words_batch(numbers, lang='en', errors='raise'):
     """
-    # Type validation and conversion
-    if number is None:
-        raise TypeError("Number cannot be None")
+    Convert many numbers to words.
     
-    # Handle string inputs - try to convert to number
-    if isinstance(number, str):
-        if number.strip() == '':
-            raise ValueError("Empty string is not a valid number")
-        try:
-            # Try to convert string to number
-            if '.' in number:
-                number = float(number)
-            else:
-                number = int(number)
-        except ValueError:
-            raise ValueError(f"'{number}' is not a valid number")
+    With ``errors='return'`` invalid values do not raise. Instead a parallel list
+    of errors is returned, and the common failures (None, booleans, bad strings,
+    unsupported types, out-of-range values) are detected without raising any
+    exception internally.
     
-    # Handle boolean values explicitly (before numeric check since bool is subclass of int)
-    if isinstance(number, bool):
-        raise TypeError(f"Boolean values are not supported. Use 0 or 1 instead of {number}")
+    Error codes and the exception ``convert_to_words`` raises for them:
     
-    # Check if it's a valid numeric type
-    if not isinstance(number, (int, float)):
-        raise TypeError(f"Unsupported type: {type(number).__name__}. Expected int, float, or numeric string")
+        none_input        TypeError   None
+        boolean_input     TypeError   True or False
+        unsupported_type  TypeError   e.g. list or dict
+        empty_string      ValueError  "" or whitespace only
+        invalid_string    ValueError  string that is not a number
+        too_large         ValueError  absolute value above 999,999,999
+        invalid_number    ValueError  NaN and other values that cannot be converted
     
-    # Validate numeric range (optional - you can adjust these limits)
-    if abs(number) > 999999999:  # 99 crores limit
-        raise ValueError(f"Number {number} is too large. Maximum supported: 999,999,999")
+    The message of each error is the exact exception message.
+    
+    Args:
+        numbers (iterable): Values accepted by convert_to_words.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali,
+                              'rom' for romanized Nepali. Defaults to 'en'.
+        errors (str, optional): 'raise' to raise on the first invalid value, or
+                                'return' to collect errors. Defaults to 'raise'.
+    
+    Returns:
+        list: With ``errors='raise'``, the words in the same order as ``numbers``.
+        tuple: With ``errors='return'``, ``(results, errors)``: two lists as long
+               as ``numbers``. ``results[i]`` is None where ``errors[i]`` holds a
+               ``ConversionError(code, message)``, and ``errors[i]`` is None where
+               the conversion succeeded.
+    
+    Raises:
+        TypeError: With ``errors='raise'``, if any value is not a valid numeric type.
+        ValueError: With ``errors='raise'``, if any value is invalid or out of range,
+                    or if ``errors`` is not 'raise' or 'return'.
+    
+    Examples:
+        >>> convert_to_words_batch([1, 25])
+        ['one', 'twenty-five']
+        >>> convert_to_words_batch([1, 'abc'], errors='return')
+        (['one', None], [None, ConversionError(code='invalid_string', message="'abc' is not a valid number")])
+    """
+    if errors == 'raise':
+        return [_number_words(_validate_number(number), lang) for number in numbers]
+    if errors != 'return':
+        raise ValueError(f"errors must be 'raise' or 'return', got {errors!r}")
+    
+    results = []
+    failures = []
+    for number in numbers:
+        number, error = _check_number(number)
+        if error is None:
+            try:
+                results.append(_number_words(number, lang))
+                failures.append(None)
+                continue
+            except (TypeError, ValueError) as e:
+                # Rare values _check_number lets through, such as float NaN
+                error = ConversionError('invalid_number', str(e))
+        results.append(None)
+        failures.append(error)
+    return results, failures
+
+def _number_words(number, lang):
+    """
+    Convert a validated number to words.
+    
+    Args:
+        number (int, float, Decimal or Fraction): Output of _validate_number.
+        lang (str): Language for output.
     
+    Returns:
+        str: The number converted to words.
+    """
     # Handle negative numbers
     if number < 0:
-        positive_result = convert_to_words(abs(number), lang)
-        return f"-{positive_result}"
+        return f"-{_number_words(-number, lang)}"
+    
+    # Handle integer numbers
+    if type(number) is int:
+        return convert_integer_to_words(number, lang)
     
     # Handle decimal numbers (rupees and paise)
-    if isinstance(number, float) or '.' in str(number):
-        if isinstance(number, str):
-            number = float(number)
-        
-        integer_part = int(number)
-        decimal_part = round((number - integer_part) * 100)
-        
-        if integer_part == 0 and decimal_part == 0:
-            return 'शून्य' if lang == 'np' else 'zero'
-        
-        result_parts = []
-        
-        if integer_part > 0:
-            rupees_word = convert_integer_to_words(integer_part, lang)
-            if lang == 'np':
-                result_parts.append(f"{rupees_word} रुपैयाँ")
-            else:
-                if integer_part == 1:
-                    result_parts.append(f"{rupees_word} rupee")
-                else:
-                    result_parts.append(f"{rupees_word} rupees")
-        
-        if decimal_part > 0:
-            paise_word = convert_integer_to_words(decimal_part, lang)
-            if lang == 'np':
-                result_parts.append(f"{paise_word} पैसा")
-            else:
-                if decimal_part == 1:
-                    result_parts.append(f"{paise_word} paisa")
-                else:
-                    result_parts.append(f"{paise_word} paise")
-        
-        if len(result_parts) == 2:
-            connector = " र " if lang == 'np' else " and "
-            return f"{result_parts[0]}{connector}{result_parts[1]}"
+    parts = _split_currency(number)
+    if not parts:
+        return convert_integer_to_words(0, lang)
+    
+    currency = CURRENCY.get(lang, CURRENCY['en'])
+    return currency[4].join([
+        f"{convert_integer_to_words(amount, lang)} {currency[unit]}"
+        for amount, unit in parts
+    ])
+
+def _split_currency(number):
+    """
+    Split a non-negative non-integer amount into rupees and paise.
+    
+    Args:
+        number (float, Decimal or Fraction): Non-negative amount.
+    
+    Returns:
+        list: ``(amount, unit)`` pairs, where ``unit`` indexes a CURRENCY tuple
+              (0 rupee, 1 rupees, 2 paisa, 3 paise). Empty if the amount
+              rounds to zero paise.
+    
+    Examples:
+        >>> _split_currency(1.5)
+        [(1, 0), (50, 3)]
+        >>> _split_currency(0.01)
+        [(1, 2)]
+    """
+    integer_part = int(number)
+    decimal_part = round((number - integer_part) * 100)
+    parts = []
+    if integer_part > 0:
+        parts.append((integer_part, 0 if integer_part == 1 else 1))
+    if decimal_part > 0:
+        parts.append((decimal_part, 2 if decimal_part == 1 else 3))
+    return parts
+
+def _validate_number(number):
+    """
+    Validate and normalize input for convert_to_words and compact_number.
+    
+    Plain ``int`` and ``float`` pass straight through; any other type is handled
+    by a converter looked up once per type (see _resolve_type).
+    
+    Args:
+        number: Value passed by the caller.
+    
+    Returns:
+        int, float, Decimal or Fraction: The validated number. Integral values
+        of any type become ``int``.
+    
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted or is out of range.
+    """
+    cls = type(number)
+    if cls is not int and cls is not float:
+        number = _convert_number(number)
+    
+    # Validate numeric range (optional - you can adjust these limits)
+    if abs(number) > MAX_NUMBER:
+        raise ValueError(_too_large_message(number))
+    return number
+
+def _convert_number(number):
+    """
+    Normalize a value like _validate_number, without the range check.
+    
+    Args:
+        number: Value passed by the caller.
+    
+    Returns:
+        int, float, Decimal or Fraction: The normalized number.
+    
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted.
+    """
+    cls = type(number)
+    if cls is int or cls is float:
+        return number
+    convert = _TYPE_DISPATCH.get(cls)
+    if convert is None:
+        convert = _resolve_type(cls)
+        _TYPE_DISPATCH[cls] = convert
+    return convert(number)
+
+def _none_message(number):
+    """Message for None input."""
+    return "Number cannot be None"
+
+def _bool_message(number):
+    """Message for boolean input."""
+    return f"Boolean values are not supported. Use 0 or 1 instead of {number}"
+
+def _type_message(number):
+    """Message for unsupported input types."""
+    return (
+        f"Unsupported type: {type(number).__name__}. "
+        "Expected int, float, Decimal, or numeric string"
+    )
+
+def _reject_none(number):
+    """Reject None."""
+    raise TypeError(_none_message(number))
+
+def _reject_bool(number):
+    """Reject booleans, which are integers in Python but not meaningful here."""
+    raise TypeError(_bool_message(number))
+
+def _reject_type(number):
+    """Reject any other type."""
+    raise TypeError(_type_message(number))
+
+def _convert_decimal(number):
+    """Keep Decimals exact; those without a fractional part become int."""
+    if not number.is_finite():
+        raise ValueError(f"'{number}' is not a valid number")
+    if number.as_tuple().exponent >= 0:
+        return int(number)
+    return number
+
+def _convert_rational(number):
+    """Keep fractions exact; whole ones become int."""
+    if number.denominator == 1:
+        return int(number.numerator)
+    return number
+
+def _convert_real(number):
+    """Convert other real numbers (e.g. NumPy floats) to float."""
+    number = float(number)
+    if not math.isfinite(number):
+        raise ValueError(f"'{number}' is not a valid number")
+    return number
+
+def _resolve_type(cls):
+    """
+    Pick the converter for an input type.
+    
+    Args:
+        cls (type): Type of the value passed by the caller.
+    
+    Returns:
+        callable: Function converting a value of ``cls`` for _validate_number.
+    """
+    # Python and NumPy booleans (numpy.bool_, named 'bool' in NumPy 2)
+    if issubclass(cls, bool) or cls.__name__ in ('bool', 'bool_'):
+        return _reject_bool
+    if cls is type(None):
+        return _reject_none
+    if issubclass(cls, str):
+        return parse_number
+    if issubclass(cls, numbers.Integral):
+        return int
+    if issubclass(cls, Decimal):
+        return _convert_decimal
+    if issubclass(cls, numbers.Rational):
+        return _convert_rational
+    if issubclass(cls, numbers.Real):
+        return _convert_real
+    return _reject_type
+
+# Converter per input type, filled on first use by _validate_number.
+# Plain int and float never reach it. Writes are single dict assignments of
+# the same value, so concurrent first use from several threads is harmless.
+_TYPE_DISPATCH = {}
+
+# Error code and message for each converter that always rejects its input
+_REJECTED_TYPES = MappingProxyType({
+    _reject_none: ('none_input', _none_message),
+    _reject_bool: ('boolean_input', _bool_message),
+    _reject_type: ('unsupported_type', _type_message),
+})
+
+def _check_number(number):
+    """
+    Validate like _validate_number, but report errors instead of raising.
+    
+    Args:
+        number: Value passed by the caller.
+    
+    Returns:
+        tuple: ``(number, None)`` with the validated number, or
+               ``(None, ConversionError)`` if the value is invalid.
+    """
+    cls = type(number)
+    if cls is not int and cls is not float:
+        convert = _TYPE_DISPATCH.get(cls)
+        if convert is None:
+            convert = _resolve_type(cls)
+            _TYPE_DISPATCH[cls] = convert
+        if convert is parse_number:
+            value = _parse(number)
+            if value is None:
+                return None, ConversionError(*_parse_error(number))
+            number = value
+        elif convert in _REJECTED_TYPES:
+            code, message = _REJECTED_TYPES[convert]
+            return None, ConversionError(code, message(number))
         else:
-            return result_parts[0] if result_parts else ('शून्य' if lang == 'np' else 'zero')
+            try:
+                number = convert(number)
+            except (TypeError, ValueError) as e:
+                return None, ConversionError('invalid_number', str(e))
     
-    # Handle integer numbers
-    return convert_integer_to_words(number, lang)
+    if abs(number) > MAX_NUMBER:
+        return None, ConversionError('too_large', _too_large_message(number))
+    return number, None
 
 def convert_integer_to_words(number, lang='en'):
     """
     Convert an integer to words in Nepali-style format (crore, lakh, thousand).
     
     Args:
-        number (int): The integer to convert to words.
-        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali.
-                              Defaults to 'en'.
+        number (int): The integer to convert to words. Negative integers get
+                      a "-" prefix, as in convert_to_words.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali,
+                              'rom' for romanized Nepali. Defaults to 'en'.
     
     Returns:
         str: The integer converted to words using Nepali-style grouping.
@@ -168,53 +558,98 @@ def convert_integer_to_words(number, lang='en'):
         'एक लाख बीस हजार'
         >>> convert_integer_to_words(34000000)
         'three crore forty lakh'
+        >>> convert_integer_to_words(-5)
+        '-five'
     """
-    if number == 0:
-        return 'शून्य' if lang == 'np' else 'zero'
+    if number < 0:
+        return f"-{convert_integer_to_words(-number, lang)}"
+    table = _word_table
+    if table is not None and lang in table.languages:
+        return _integer_words_from_table(table, number, lang)
+    return _integer_words(number, lang)
+
+def _integer_words_from_table(table, number, lang):
+    """
+    Convert an integer to words using a precomputed table for the last five digits.
+    
+    Args:
+        number (int): The integer to convert (0 to 999,999,999).
+        lang (str): Language code present in the table.
     
+    Returns:
+        str: The integer converted to words.
+    """
+    if number < 100000:
+        if number < 0:
+            # The table only covers 0-99,999; never index it with a negative offset
+            return _integer_words(number, lang)
+        return table.lookup(number, lang)
+    
+    words = WORDS[lang]
+    scales = SCALES[lang]
     result = []
+    crores, number = divmod(number, 10000000)
+    lakhs, number = divmod(number, 100000)
+    if crores:
+        # Beyond 99 crore the count falls back to digits, as in basic_number_to_words
+        count = words[crores] if crores < 100 else str(crores)
+        result.append(f"{count} {scales['crore']}")
+    if lakhs:
+        result.append(f"{words[lakhs]} {scales['lakh']}")
+    if number:
+        result.append(table.lookup(number, lang))
+    return ' '.join(result)
+
+def _split_groups(number):
+    """
+    Split an integer into Nepali-style groups using GROUPS.
     
-    # Handle crores (10,000,000)
-    if number >= 10000000:
-        crores = number // 10000000
-        if lang == 'np':
-            result.append(f"{basic_number_to_words(crores, lang)} करोड")
-        else:
-            result.append(f"{basic_number_to_words(crores, lang)} crore")
-        number = number % 10000000
+    Args:
+        number (int): Non-negative integer. Counts are below 100 except the
+                      crore count of numbers from 1,000,000,000.
     
-    # Handle lakhs (100,000)
-    if number >= 100000:
-        lakhs = number // 100000
-        if lang == 'np':
-            result.append(f"{basic_number_to_words(lakhs, lang)} लाख")
-        else:
-            result.append(f"{basic_number_to_words(lakhs, lang)} lakh")
-        number = number % 100000
+    Returns:
+        list: ``(count, scale)`` pairs, largest first, skipping empty groups.
+              The final 0-99 part has scale None.
     
-    # Handle thousands (1,000)
-    if number >= 1000:
-        thousands = number // 1000
-        if lang == 'np':
-            result.append(f"{basic_number_to_words(thousands, lang)} हजार")
-        else:
-            result.append(f"{basic_number_to_words(thousands, lang)} thousand")
-        number = number % 1000
+    Examples:
+        >>> _split_groups(1234567)
+        [(12, 'lakh'), (34, 'thousand'), (5, 'hundred'), (67, None)]
+    """
+    groups = []
+    for divisor, scale in GROUPS:
+        if number >= divisor:
+            count, number = divmod(number, divisor)
+            groups.append((count, scale))
+    if number:
+        groups.append((number, None))
+    return groups
+
+def _integer_words(number, lang='en'):
+    """
+    Convert an integer to words by group decomposition, without any table.
     
-    # Handle hundreds (100)
-    if number >= 100:
-        hundreds = number // 100
-        if lang == 'np':
-            result.append(f"{basic_number_to_words(hundreds, lang)} सय")
-        else:
-            result.append(f"{basic_number_to_words(hundreds, lang)} hundred")
-        number = number % 100
+    Args:
+        number (int): The integer to convert; negatives get a "-" prefix.
+        lang (str, optional): Language for output. Defaults to 'en'.
     
-    # Handle remaining (1-99)
-    if number > 0:
-        result.append(basic_number_to_words(number, lang))
+    Returns:
+        str: The integer converted to words.
+    """
+    if number < 0:
+        return f"-{_integer_words(-number, lang)}"
+    if lang not in WORDS:
+        lang = 'en'
+    words = WORDS[lang]
+    if number == 0:
+        return words[0]
     
-    return ' '.join(result)
+    scales = SCALES[lang]
+    # Only a crore count can exceed 99; it falls back to digits, as in basic_number_to_words
+    return ' '.join([
+        f"{words[count] if count < 100 else count} {scales[scale]}" if scale else words[count]
+        for count, scale in _split_groups(number)
+    ])
 
 def basic_number_to_words(number, lang='en'):
     """
@@ -238,25 +673,142 @@ def basic_number_to_words(number, lang='en'):
         >>> basic_number_to_words(90, lang='np')
         'नब्बे'
     """
-    if lang == 'np':
-        # For Nepali, use direct lookup from 0-99
-        if 0 <= number <= 99:
-            return ONES_NP[number]
-        return str(number)  # fallback
+    if 0 <= number <= 99:
+        return WORDS[lang if lang in WORDS else 'en'][number]
+    return str(number)  # fallback
+
+def convert_to_ordinal(number, lang='en'):
+    """
+    Convert a non-negative integer to ordinal words (first, second, पहिलो, दोस्रो).
+    
+    Uses the same group decomposition as convert_integer_to_words; only the last
+    group is replaced by its precomputed ordinal form.
+    
+    Args:
+        number (int or str): Non-negative integer (or integer string) up to 999,999,999.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali.
+                              Defaults to 'en'.
+    
+    Returns:
+        str: The number as ordinal words.
+    
+    Raises:
+        TypeError: If number is not an integer or integer string.
+        ValueError: If number is negative, too large or not a valid integer string.
+    
+    Examples:
+        >>> convert_to_ordinal(21)
+        'twenty-first'
+        >>> convert_to_ordinal(21, lang='np')
+        'एक्काइसौँ'
+        >>> convert_to_ordinal(1, lang='np')
+        'पहिलो'
+        >>> convert_to_ordinal(100)
+        'one hundredth'
+        >>> convert_to_ordinal(120003)
+        'one lakh twenty thousand third'
+    """
+    return _ordinal_words(_validate_ordinal(number), 'np' if lang == 'np' else 'en')
+
+def convert_to_ordinal_batch(numbers, lang='en'):
+    """
+    Convert many integers to ordinal words.
+    
+    Args:
+        numbers (iterable): Non-negative integers (or integer strings).
+        lang (str, optional): Language for output. Defaults to 'en'.
+    
+    Returns:
+        list: Ordinal words, in the same order as ``numbers``.
+    
+    Raises:
+        TypeError: If any value is not an integer or integer string.
+        ValueError: If any value is negative, too large or invalid.
+    
+    Examples:
+        >>> convert_to_ordinal_batch([1, 2, 3])
+        ['first', 'second', 'third']
+    """
+    lang = 'np' if lang == 'np' else 'en'
+    return [_ordinal_words(_validate_ordinal(number), lang) for number in numbers]
+
+def _validate_ordinal(number):
+    """
+    Validate input for ordinal conversion.
+    
+    Args:
+        number: Value passed by the caller.
+    
+    Returns:
+        int: The validated integer.
+    
+    Raises:
+        TypeError: If number is not an integer or integer string.
+        ValueError: If number is negative, too large or not a valid integer string.
+    """
+    if type(number) is not int:
+        if number is None:
+            raise TypeError("Number cannot be None")
+        if isinstance(number, bool):
+            raise TypeError(f"Boolean values are not supported. Use 0 or 1 instead of {number}")
+        if isinstance(number, str):
+            try:
+                number = int(number)
+            except ValueError:
+                raise ValueError(f"'{number}' is not a valid integer")
+        elif isinstance(number, numbers.Integral):
+            number = int(number)
+        else:
+            raise TypeError(f"Unsupported type: {type(number).__name__}. Ordinals require an integer")
+    if number < 0:
+        raise ValueError(f"Ordinals are not defined for negative numbers: {number}")
+    if number > MAX_NUMBER:
+        raise ValueError(f"Number {number} is too large. Maximum supported: 999,999,999")
+    return number
+
+def _ordinal_words(number, lang):
+    """
+    Build ordinal words for a validated integer.
+    
+    Args:
+        number (int): Integer between 0 and 999,999,999.
+        lang (str): 'en' or 'np'.
+    
+    Returns:
+        str: The number as ordinal words.
+    """
+    if number < 100:
+        return ORDINAL_WORDS_STANDALONE[lang][number]
+    
+    words = WORDS[lang]
+    scales = SCALES[lang]
+    groups = _split_groups(number)
+    count, scale = groups.pop()
+    result = [f"{words[c]} {scales[s]}" for c, s in groups]
+    if scale:
+        result.append(f"{words[count]} {ORDINAL_SCALES[lang][scale]}")
     else:
-        # English logic (existing)
-        if number < 20:
-            return ONES[number]
-        elif number < 100:
-            tens_digit = number // 10
-            ones_digit = number % 10
-            if ones_digit == 0:
-                return TENS[tens_digit]
-            else:
-                return f"{TENS[tens_digit]}-{ONES[ones_digit]}"
-        return str(number)  # fallback
+        result.append(ORDINAL_WORDS[lang][count])
+    return ' '.join(result)
 
-def format_number(number, lang='en'):
+def _tables_fingerprint():
+    """
+    Return a digest of all word tables and ENGINE_REVISION.
+    
+    Used to detect precomputed data that was generated from different tables
+    or conversion rules.
+    
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    # Imported here: only the word table and cache snapshots need it
+    import hashlib
+    
+    parts = ([ENGINE_REVISION] + list(ONES) + list(TENS) + list(ONES_NP) + sorted(SCALE_NP.items())
+             + list(ONES_ROM) + sorted(SCALE_ROM.items()))
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+def format_number(number, lang='en', grouping='nepali'):
     """
     Format a number with Nepali-style comma separation.
     
@@ -265,13 +817,20 @@ def format_number(number, lang='en'):
     - Then every 2 digits thereafter
     - Example: 1000000 becomes 10,00,000 (not 1,000,000)
     
+    With ``grouping='international'`` commas go every 3 digits (1,000,000) for
+    readers outside South Asia; digits still follow ``lang``.
+    
     Args:
         number (int or float): The number to format.
         lang (str, optional): Language for output. 'en' for English digits, 'np' for Nepali Unicode digits.
                               Defaults to 'en'.
+        grouping (str, optional): 'nepali' or 'international'. Defaults to 'nepali'.
     
     Returns:
         str: The formatted number string with Nepali-style comma placement.
+    
+    Raises:
+        ValueError: If grouping is not one of GROUPINGS.
         
     Examples:
         >>> format_number(1000000)
@@ -286,20 +845,75 @@ def format_number(number, lang='en'):
         '123.45'
         >>> format_number(123.45, lang='np')
         '१२३.४५'
+        >>> format_number(1000000, grouping='international')
+        '1,000,000'
     """
+    group = _grouping_function(grouping)
+    
     # Handle string input
     if isinstance(number, str):
         try:
-            number = float(number) if '.' in number else int(number)
+            number = parse_number(number)
         except ValueError:
             return str(number)  # Return as-is if not a valid number
     
+    return _format_value(number, lang, group)
+
+def format_number_batch(numbers, lang='en', grouping='nepali'):
+    """
+    Format many numbers with the same language and grouping.
+    
+    Args:
+        numbers (iterable): Values accepted by format_number.
+        lang (str, optional): 'en' or 'np'. Defaults to 'en'.
+        grouping (str, optional): 'nepali' or 'international'. Defaults to 'nepali'.
+    
+    Returns:
+        list: Formatted numbers, in the same order as ``numbers``.
+    
+    Raises:
+        ValueError: If grouping is not one of GROUPINGS.
+    
+    Examples:
+        >>> format_number_batch([1000000, 120000], grouping='international')
+        ['1,000,000', '120,000']
+    """
+    group = _grouping_function(grouping)
+    return [
+        _format_value(number, lang, group) if not isinstance(number, str)
+        else format_number(number, lang, grouping)
+        for number in numbers
+    ]
+
+def _grouping_function(grouping):
+    """Return the integer grouping function for a grouping name."""
+    group = GROUPINGS.get(grouping)
+    if group is None:
+        raise ValueError(f"grouping must be one of {', '.join(GROUPINGS)}, got {grouping!r}")
+    return group
+
+def _format_value(number, lang, group=None):
+    """
+    Format a parsed int or float with Nepali-style commas.
+    
+    Args:
+        number (int or float): The number to format.
+        lang (str): 'en' for English digits, 'np' for Nepali digits.
+        group (callable, optional): Integer grouping function from GROUPINGS.
+                                    Defaults to Nepali grouping.
+    
+    Returns:
+        str: The formatted number.
+    """
+    if group is None:
+        group = _format_integer_part
+    
     # Handle decimal numbers
     if isinstance(number, float):
         if number == int(number):
             # If it's a whole number (like 123.0), treat as integer
             integer_part = int(number)
-            result = _format_integer_part(integer_part)
+            result = group(integer_part)
             return _convert_digits_to_nepali(result) if lang == 'np' else result
         else:
             # Split into integer and decimal parts
@@ -310,12 +924,12 @@ def format_number(number, lang='en'):
                 result = f"0.{decimal_part}"
                 return _convert_digits_to_nepali(result) if lang == 'np' else result
             else:
-                formatted_integer = _format_integer_part(integer_part)
+                formatted_integer = group(integer_part)
                 result = f"{formatted_integer}.{decimal_part}"
                 return _convert_digits_to_nepali(result) if lang == 'np' else result
     
     # Handle integer numbers
-    result = _format_integer_part(number)
+    result = group(number)
     return _convert_digits_to_nepali(result) if lang == 'np' else result
 
 
@@ -329,23 +943,47 @@ def _format_integer_part(number):
     Returns:
         str: Formatted integer with Nepali-style commas.
     """
-    if number == 0:
-        return "0"
+    digits = str(abs(number))
+    length = len(digits)
+    if length <= 3:
+        # Not str(number): that gives 'True' for bool and 'E.A' for an IntEnum
+        return f"-{digits}" if number < 0 else digits
     
-    # Convert to string and reverse for easier processing
-    num_str = str(abs(number))
-    reversed_digits = num_str[::-1]
+    # Slice the groups straight out of the digit string: no reversed copy
+    # and no per-digit list (see benchmarks/bench_memory.py)
+    if length <= 5:
+        formatted = f"{digits[:-3]},{digits[-3:]}"
+    elif length <= 7:
+        formatted = f"{digits[:-5]},{digits[-5:-3]},{digits[-3:]}"
+    elif length <= 9:
+        formatted = f"{digits[:-7]},{digits[-7:-5]},{digits[-5:-3]},{digits[-3:]}"
+    else:
+        formatted = digits[-3:]
+        end = length - 3
+        while end > 0:
+            formatted = f"{digits[max(0, end - 2):end]},{formatted}"
+            end -= 2
+    return f"-{formatted}" if number < 0 else formatted
+
+
+def _format_international(number):
+    """
+    Format an integer with Western grouping (every 3 digits).
     
-    # Add commas: first after 3 digits, then every 2 digits
-    result = []
-    for i, digit in enumerate(reversed_digits):
-        if i == 3 or (i > 3 and (i - 3) % 2 == 0):
-            result.append(',')
-        result.append(digit)
+    Args:
+        number (int): The integer to format.
     
-    # Reverse back and handle negative numbers
-    formatted = ''.join(result[::-1])
-    return f"-{formatted}" if number < 0 else formatted
+    Returns:
+        str: Formatted integer, e.g. "1,000,000".
+    """
+    return f"{number:,}"
+
+
+# Integer grouping functions for format_number(grouping=...)
+GROUPINGS = MappingProxyType({
+    'nepali': _format_integer_part,
+    'international': _format_international,
+})
 
 
 def compact_number(number, precision=1, lang='en'):
@@ -383,37 +1021,26 @@ def compact_number(number, precision=1, lang='en'):
         '४.२ करोड'
     """
     # Type validation (reuse same validation as convert_to_words)
-    if number is None:
-        raise TypeError("Number cannot be None")
-    
-    # Handle string inputs
-    if isinstance(number, str):
-        if number.strip() == '':
-            raise ValueError("Empty string is not a valid number")
-        try:
-            if '.' in number:
-                number = float(number)
-            else:
-                number = int(number)
-        except ValueError:
-            raise ValueError(f"'{number}' is not a valid number")
-    
-    # Handle boolean values
-    if isinstance(number, bool):
-        raise TypeError(f"Boolean values are not supported. Use 0 or 1 instead of {number}")
-    
-    # Check if it's a valid numeric type
-    if not isinstance(number, (int, float)):
-        raise TypeError(f"Unsupported type: {type(number).__name__}. Expected int, float, or numeric string")
+    number = _validate_number(number)
+    if type(number) is not int and type(number) is not float:
+        number = float(number)
+    return _compact_value(number, precision, lang)
+
+def _compact_value(number, precision, lang):
+    """
+    Build the compact form of a validated int or float.
     
-    # Validate numeric range
-    if abs(number) > 999999999:
-        raise ValueError(f"Number {number} is too large. Maximum supported: 999,999,999")
+    Args:
+        number (int or float): Output of _validate_number, as int or float.
+        precision (int): Decimal places to show.
+        lang (str): Language for output.
     
+    Returns:
+        str: Compact representation.
+    """
     # Handle negative numbers
     if number < 0:
-        positive_result = compact_number(abs(number), precision, lang)
-        return f"-{positive_result}"
+        return f"-{_compact_value(-number, precision, lang)}"
     
     # Handle zero
     if number == 0:
@@ -477,8 +1104,4 @@ def _convert_digits_to_nepali(text):
     Returns:
         str: Text with Nepali digits.
     """
-    nepali_digits = ['०', '१', '२', '३', '४', '५', '६', '७', '८', '९']
-    result = text
-    for i, nepali_digit in enumerate(nepali_digits):
-        result = result.replace(str(i), nepali_digit)
-    return result
\ No newline at end of file
+    return text.translate(_NEPALI_DIGITS)
\ No newline at end of file
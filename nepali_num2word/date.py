@@ -0,0 +1,136 @@
+"""
+Bikram Sambat (BS) date to words for nepali-num2word.
+
+Dates are written the way they appear on Nepali forms, e.g. 2081-03-15 becomes
+"दुई हजार एकासी साल असार पन्ध्र गते". Each component is cached on its own:
+years go through the number-word engine in ``core`` once per distinct year,
+while months and days come straight from precomputed tables.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+
+from .core import WORDS, convert_integer_to_words
+
+# BS month names (1 = Baisakh ... 12 = Chaitra)
+MONTHS_NP = (
+    'बैशाख', 'जेठ', 'असार', 'साउन', 'भदौ', 'असोज',
+    'कात्तिक', 'मंसिर', 'पुस', 'माघ', 'फागुन', 'चैत'
+)
+
+MONTHS_EN = (
+    'Baisakh', 'Jestha', 'Asar', 'Shrawan', 'Bhadra', 'Ashwin',
+    'Kartik', 'Mangsir', 'Poush', 'Magh', 'Falgun', 'Chaitra'
+)
+
+# BS months have up to 32 days
+MAX_DAY = 32
+
+# "2081-03-15", "2081/3/15", "२०८१.०३.१५"
+_DATE_PATTERN = re.compile(r'^\s*([0-9०-९]{1,4})\s*[-/.]\s*([0-9०-९]{1,2})\s*[-/.]\s*([0-9०-९]{1,2})\s*$')
+
+
+@lru_cache(maxsize=1024)
+def _year_words(year, lang):
+    """Words for a year, cached."""
+    return convert_integer_to_words(year, lang)
+
+
+def convert_date_to_words(date, lang='en'):
+    """
+    Convert a Bikram Sambat date to words.
+
+    Args:
+        date (str, tuple or date-like): The BS date as a "YYYY-MM-DD" string
+                              (``-``, ``/`` or ``.`` separators, Western or
+                              Devanagari digits), a ``(year, month, day)`` tuple,
+                              or a BS date object with ``year``, ``month`` and
+                              ``day``. Gregorian ``datetime.date`` values are
+                              rejected; convert them to BS first.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali.
+                              Defaults to 'en'.
+
+    Returns:
+        str: The date in words.
+
+    Raises:
+        TypeError: If date is not a supported type, including Gregorian
+                   ``datetime.date``/``datetime.datetime`` values.
+        ValueError: If the date is malformed or out of range.
+
+    Examples:
+        >>> convert_date_to_words('2081-03-15', lang='np')
+        'दुई हजार एकासी साल असार पन्ध्र गते'
+        >>> convert_date_to_words((2081, 3, 15))
+        'Asar fifteen, two thousand eighty-one'
+    """
+    year, month, day = _parse_date(date)
+    if lang == 'np':
+        return f"{_year_words(year, 'np')} साल {MONTHS_NP[month - 1]} {WORDS['np'][day]} गते"
+    return f"{MONTHS_EN[month - 1]} {WORDS['en'][day]}, {_year_words(year, 'en')}"
+
+
+def convert_date_to_words_batch(dates, lang='en'):
+    """
+    Convert many Bikram Sambat dates to words.
+
+    Args:
+        dates (iterable): Dates in any form accepted by convert_date_to_words.
+        lang (str, optional): Language for output. Defaults to 'en'.
+
+    Returns:
+        list: The dates in words, in the same order as ``dates``.
+
+    Raises:
+        TypeError: If any date is not a supported type.
+        ValueError: If any date is malformed or out of range.
+    """
+    return [convert_date_to_words(date, lang) for date in dates]
+
+
+def _parse_date(date):
+    """
+    Split a date into validated (year, month, day) integers.
+
+    Args:
+        date: Value passed to convert_date_to_words.
+
+    Returns:
+        tuple: ``(year, month, day)``.
+
+    Raises:
+        TypeError: If date is not a supported type.
+        ValueError: If the date is malformed or out of range.
+    """
+    if isinstance(date, str):
+        match = _DATE_PATTERN.match(date)
+        if match is None:
+            raise ValueError(f"'{date}' is not a valid date. Expected YYYY-MM-DD")
+        # int() reads Devanagari digits directly
+        year, month, day = int(match[1]), int(match[2]), int(match[3])
+    elif isinstance(date, tuple):
+        if len(date) != 3:
+            raise ValueError(f"Date tuple must be (year, month, day), got {date}")
+        year, month, day = date
+    elif isinstance(date, datetime.date):
+        # A Gregorian date read as BS would give a wrong date without any error
+        raise TypeError(
+            f"{type(date).__name__} is a Gregorian (AD) date. "
+            "Pass a BS date as a (year, month, day) tuple, a 'YYYY-MM-DD' string or a BS date object"
+        )
+    elif hasattr(date, 'year') and hasattr(date, 'month') and hasattr(date, 'day'):
+        year, month, day = date.year, date.month, date.day
+    else:
+        raise TypeError(f"Unsupported type: {type(date).__name__}. Expected str, tuple or date object")
+
+    for part in (year, month, day):
+        if type(part) is not int:
+            raise TypeError(f"Date parts must be integers, got {type(part).__name__}")
+    if not 1 <= year <= 9999:
+        raise ValueError(f"Year {year} is out of range (1-9999)")
+    if not 1 <= month <= 12:
+        raise ValueError(f"Month {month} is out of range (1-12)")
+    if not 1 <= day <= MAX_DAY:
+        raise ValueError(f"Day {day} is out of range (1-{MAX_DAY})")
+    return year, month, day
@@ -0,0 +1,102 @@
+"""
+Reusable number formatter for nepali-num2word.
+
+A ``NumberFormatter`` fixes the grouping (Nepali ``10,00,000`` or international
+``1,000,000``) and the digits (ASCII or Devanagari) once. Both groupings are
+plain functions in ``core.GROUPINGS``, so the formatter just holds the chosen
+one: formatting in either mode costs the same, and integers skip
+format_number's type checks. Other numeric types (``Decimal``, ``Fraction``,
+NumPy scalars) are normalized like convert_to_words input before formatting.
+"""
+
+from decimal import Decimal
+
+from .core import _NEPALI_DIGITS, _convert_number, _format_value, _grouping_function, format_number
+
+
+class NumberFormatter:
+    """
+    Formatter with a fixed language and grouping.
+
+    Args:
+        lang (str, optional): 'en' for ASCII digits, 'np' for Devanagari digits.
+                              Defaults to 'en'.
+        grouping (str, optional): 'nepali' or 'international'. Defaults to 'nepali'.
+
+    Raises:
+        ValueError: If grouping is not one of core.GROUPINGS.
+
+    Examples:
+        >>> NumberFormatter(grouping='international').format(1000000)
+        '1,000,000'
+        >>> NumberFormatter(lang='np').format_batch([1000000, 120000])
+        ['१०,००,०००', '१,२०,०००']
+    """
+
+    __slots__ = ('lang', 'grouping', '_group', '_digits')
+
+    def __init__(self, lang='en', grouping='nepali'):
+        self.lang = lang
+        self.grouping = grouping
+        self._group = _grouping_function(grouping)
+        self._digits = _NEPALI_DIGITS if lang == 'np' else None
+
+    def format(self, number):
+        """
+        Format one number, like ``format_number(number, lang, grouping)``.
+
+        Other numeric types are first normalized as in convert_to_words:
+        integral values become int, other ``Decimal`` values keep every digit
+        (``Decimal('123456.780')`` gives ``'1,23,456.780'``), and other real
+        numbers are formatted as floats.
+
+        Args:
+            number (int, float, str, Decimal or other real number): The number
+                              to format. Invalid strings are returned unchanged.
+
+        Returns:
+            str: The formatted number.
+
+        Raises:
+            TypeError: If number is None, a boolean or not a numeric type.
+            ValueError: If number is a non-finite ``Decimal`` or real number.
+        """
+        if type(number) is int:
+            result = self._group(number)
+            return result if self._digits is None else result.translate(self._digits)
+        if type(number) is float:
+            return _format_value(number, self.lang, self._group)
+        if isinstance(number, str):
+            return format_number(number, self.lang, self.grouping)
+
+        number = _convert_number(number)
+        if type(number) is int:
+            result = self._group(number)
+        elif isinstance(number, Decimal):
+            integer, _, fraction = format(abs(number), 'f').partition('.')
+            result = f"{'-' if number < 0 else ''}{self._group(int(integer))}.{fraction}"
+        else:
+            # Fractions and other exact reals have no finite digit string
+            return _format_value(float(number), self.lang, self._group)
+        return result if self._digits is None else result.translate(self._digits)
+
+    def format_batch(self, numbers):
+        """
+        Format many numbers.
+
+        Args:
+            numbers (iterable): Values accepted by format_number.
+
+        Returns:
+            list: Formatted numbers, in the same order as ``numbers``.
+        """
+        group = self._group
+        digits = self._digits
+        fmt = self.format
+        if digits is None:
+            return [group(number) if type(number) is int else fmt(number) for number in numbers]
+        return [group(number).translate(digits) if type(number) is int else fmt(number)
+                for number in numbers]
+
+    def __repr__(self):
+        return f"NumberFormatter(lang={self.lang!r}, grouping={self.grouping!r})"
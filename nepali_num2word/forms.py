@@ -0,0 +1,120 @@
+"""
+Lazy multi-form results for nepali-num2word.
+
+``number_forms()`` validates its input once and returns a small ``NumberForms``
+object. The words, Nepali-style grouping and compact form are each computed on
+first access and then kept, so asking for all three costs one validation
+instead of three.
+"""
+
+from .core import (
+    _compact_value, _format_integer_part, _format_value, _NEPALI_DIGITS,
+    _number_words, _validate_number, convert_integer_to_words,
+)
+
+
+class NumberForms:
+    """
+    Words, grouped digits and compact form of one number, computed lazily.
+
+    Create instances with ``number_forms()``, which validates the input.
+
+    Attributes:
+        value (int, float, Decimal or Fraction): The validated number.
+        lang (str): Language for output.
+        precision (int): Decimal places for the compact form.
+
+    Examples:
+        >>> forms = number_forms(120000)
+        >>> forms.words
+        'one lakh twenty thousand'
+        >>> forms.formatted
+        '1,20,000'
+        >>> forms.compact
+        '1.2 lakhs'
+    """
+
+    __slots__ = ('value', 'lang', 'precision', '_words', '_formatted', '_compact')
+
+    def __init__(self, value, lang='en', precision=1):
+        self.value = value
+        self.lang = lang
+        self.precision = precision
+        self._words = None
+        self._formatted = None
+        self._compact = None
+
+    @property
+    def words(self):
+        """str: Same as ``convert_to_words(value, lang)``."""
+        words = self._words
+        if words is None:
+            value = self.value
+            if type(value) is int and value >= 0:
+                words = convert_integer_to_words(value, self.lang)
+            else:
+                words = _number_words(value, self.lang)
+            self._words = words
+        return words
+
+    @property
+    def formatted(self):
+        """str: Same as ``format_number(value, lang)``."""
+        formatted = self._formatted
+        if formatted is None:
+            value = self.value
+            if type(value) is int:
+                formatted = _format_integer_part(value)
+                if self.lang == 'np':
+                    formatted = formatted.translate(_NEPALI_DIGITS)
+            else:
+                formatted = _format_value(_as_int_or_float(value), self.lang)
+            self._formatted = formatted
+        return formatted
+
+    @property
+    def compact(self):
+        """str: Same as ``compact_number(value, precision, lang)``."""
+        compact = self._compact
+        if compact is None:
+            compact = self._compact = _compact_value(
+                _as_int_or_float(self.value), self.precision, self.lang)
+        return compact
+
+    def __repr__(self):
+        return f"NumberForms({self.value!r}, lang={self.lang!r})"
+
+
+def _as_int_or_float(value):
+    """Convert Decimal and Fraction values to float for formatting."""
+    if type(value) is int or type(value) is float:
+        return value
+    return float(value)
+
+
+def number_forms(number, lang='en', precision=1):
+    """
+    Validate a number once and return its lazily computed forms.
+
+    Args:
+        number (int, float, str or other real number): The number, accepted
+                              exactly like ``convert_to_words`` accepts it.
+        lang (str, optional): Language for output. 'en' for English, 'np' for Nepali.
+                              Defaults to 'en'.
+        precision (int, optional): Decimal places for the compact form. Defaults to 1.
+
+    Returns:
+        NumberForms: Object with ``words``, ``formatted`` and ``compact`` attributes.
+
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted to a numeric value.
+
+    Examples:
+        >>> forms = number_forms(4200000, lang='np')
+        >>> forms.words
+        'बयालीस लाख'
+        >>> forms.compact
+        '४२ लाख'
+    """
+    return NumberForms(_validate_number(number), lang, precision)
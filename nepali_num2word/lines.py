@@ -0,0 +1,126 @@
+"""
+Bytes input for newline-delimited ASCII number feeds.
+
+Feeds arrive as bytes such as ``b"120000\\n-25\\n1234.50\\n"``. Decoding every
+line to ``str`` and parsing it as a string costs more than the conversion
+itself for short numbers. ``convert_lines()`` splits the buffer once, checks
+each line with the bytes methods ``isdigit()``/``partition()`` and hands it to
+``int()``/``float()``, which accept ASCII bytes directly, so no ``str`` object
+is created per line.
+
+Line format: optional ``+``/``-``, ASCII digits, optional ``.`` and digits
+(``"12.50"`` or ``".5"``), optional trailing ``\\r``. A final newline does not
+start another line.
+"""
+
+import math
+
+from .core import MAX_NUMBER, ConversionError, _number_words, _too_large_message
+
+# Longest integer line passed to int(): longer than any value in range, and
+# int() refuses more than 4300 digits
+_MAX_INT_DIGITS = 20
+
+
+def convert_lines(data, lang='en', errors='raise'):
+    """
+    Convert newline-delimited ASCII numbers to words.
+
+    Args:
+        data (bytes, bytearray or memoryview): The feed, one number per line.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+        errors (str, optional): 'raise' or 'return', as in convert_to_words_batch.
+                                Defaults to 'raise'.
+
+    Returns:
+        list: With ``errors='raise'``, the words for each line.
+        tuple: With ``errors='return'``, ``(results, errors)`` as in
+               convert_to_words_batch, with codes 'empty_string',
+               'invalid_string' and 'too_large'.
+
+    Raises:
+        ValueError: With ``errors='raise'``, if a line is not a number or is out
+                    of range (the message gives the 1-based line number), or if
+                    ``errors`` is not 'raise' or 'return'.
+
+    Examples:
+        >>> convert_lines(b"120000\\n-25\\n12.50\\n")
+        ['one lakh twenty thousand', '-twenty-five', 'twelve rupees and fifty paise']
+        >>> convert_lines(memoryview(b"5\\r\\nx\\r\\n"), errors='return')
+        (['five', None], [None, ConversionError(code='invalid_string', message="Line 2: 'x' is not a valid number")])
+    """
+    if errors not in ('raise', 'return'):
+        raise ValueError(f"errors must be 'raise' or 'return', got {errors!r}")
+    if type(data) is not bytes:
+        # One copy of the whole buffer; memoryview has no split()
+        data = bytes(data)
+    lines = data.split(b'\n')
+    if lines[-1] == b'':
+        lines.pop()
+
+    results = []
+    failures = []
+    for index, line in enumerate(lines, 1):
+        if len(line) <= _MAX_INT_DIGITS and line.isdigit():
+            value = int(line)
+        else:
+            value = _parse_line(line)
+            if value is None:
+                error = _line_error(index, line)
+                if errors == 'raise':
+                    raise ValueError(error.message)
+                results.append(None)
+                failures.append(error)
+                continue
+        if value > MAX_NUMBER or value < -MAX_NUMBER:
+            # Over-long lines parse to inf; show them as written
+            shown = _line_text(line) if math.isinf(value) else value
+            error = ConversionError('too_large', f"Line {index}: {_too_large_message(shown)}")
+            if errors == 'raise':
+                raise ValueError(error.message)
+            results.append(None)
+            failures.append(error)
+            continue
+        results.append(_number_words(value, lang))
+        failures.append(None)
+    if errors == 'raise':
+        return results
+    return results, failures
+
+
+def _parse_line(line):
+    """
+    Parse a line that is not short plain digits; return None if it is invalid.
+
+    Integers too long for int() give inf (or -inf), like decimals beyond the
+    float range do in float().
+    """
+    if line[-1:] == b'\r':
+        line = line[:-1]
+    digits = line[1:] if line[:1] in (b'-', b'+') else line
+    whole, dot, fraction = digits.partition(b'.')
+    if dot:
+        if fraction.isdigit() and (not whole or whole.isdigit()):
+            return float(line)
+        return None
+    if not whole.isdigit():
+        return None
+    if len(whole) > _MAX_INT_DIGITS:
+        whole = whole.lstrip(b'0') or b'0'
+        if len(whole) > _MAX_INT_DIGITS:
+            return -math.inf if line[:1] == b'-' else math.inf
+        # Keep the sign, drop the leading zeros
+        line = line[:len(line) - len(digits)] + whole
+    return int(line)
+
+
+def _line_error(index, line):
+    """ConversionError for a line that failed _parse_line."""
+    if not line.strip():
+        return ConversionError('empty_string', f"Line {index}: empty line is not a valid number")
+    return ConversionError('invalid_string', f"Line {index}: '{_line_text(line)}' is not a valid number")
+
+
+def _line_text(line):
+    """A line as text for error messages."""
+    return line.rstrip(b'\r').decode('ascii', errors='replace')
@@ -0,0 +1,126 @@
+"""
+Mixed-script output for nepali-num2word: digits followed by scale words.
+
+Newspapers and SMS templates write amounts as "१ लाख २० हजार" or
+"1 lakh 20 thousand", between the full words of ``convert_to_words`` and the
+rounded ``compact_number``. ``convert_to_mixed()`` splits the number into the
+same crore/lakh/thousand groups as the word engine and writes each group's
+count as digits, so the output is exact.
+"""
+
+from .core import (
+    CURRENCY, SCALES, _convert_digits_to_nepali, _split_currency, _split_groups, _validate_number,
+)
+
+# Digits for every group count 0-999, per numeral system
+NUMERALS = {
+    'ascii': tuple(str(n) for n in range(1000)),
+    'devanagari': tuple(_convert_digits_to_nepali(str(n)) for n in range(1000)),
+}
+
+
+def convert_to_mixed(number, lang='en', digits=None):
+    """
+    Convert a number to digits with scale words.
+
+    Each crore, lakh and thousand group is written as digits followed by its
+    scale word; the last part below 1000 is written as digits alone. Decimal
+    amounts are read as rupees and paise, like convert_to_words.
+
+    Args:
+        number (int, float, str or other real number): Any value accepted by
+                          convert_to_words.
+        lang (str, optional): Language of the scale words: 'en', 'np' or 'rom'.
+                              Defaults to 'en'.
+        digits (str, optional): 'ascii' or 'devanagari'. Defaults to
+                                'devanagari' for 'np' and 'ascii' otherwise.
+
+    Returns:
+        str: The mixed-script representation.
+
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted or is out of range, or
+                    digits is not one of NUMERALS.
+
+    Examples:
+        >>> convert_to_mixed(120000, lang='np')
+        '१ लाख २० हजार'
+        >>> convert_to_mixed(34567890)
+        '3 crore 45 lakh 67 thousand 890'
+        >>> convert_to_mixed(1234.5, lang='np', digits='ascii')
+        '1 हजार 234 रुपैयाँ र 50 पैसा'
+    """
+    lang, numerals = _resolve(lang, digits)
+    return _mixed_words(_validate_number(number), lang, numerals)
+
+
+def convert_to_mixed_batch(numbers, lang='en', digits=None):
+    """
+    Convert many numbers to digits with scale words.
+
+    Args:
+        numbers (iterable): Values accepted by convert_to_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+        digits (str, optional): 'ascii' or 'devanagari'. Defaults as in
+                                convert_to_mixed.
+
+    Returns:
+        list: Mixed-script strings, in the same order as ``numbers``.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+
+    Examples:
+        >>> convert_to_mixed_batch([1000, 150000], lang='np')
+        ['१ हजार', '१ लाख ५० हजार']
+    """
+    lang, numerals = _resolve(lang, digits)
+    return [_mixed_words(_validate_number(number), lang, numerals) for number in numbers]
+
+
+def _resolve(lang, digits):
+    """Return the language and digit table for the given options."""
+    if lang not in SCALES:
+        lang = 'en'
+    if digits is None:
+        digits = 'devanagari' if lang == 'np' else 'ascii'
+    if digits not in NUMERALS:
+        raise ValueError(f"digits must be one of {', '.join(NUMERALS)}, got {digits!r}")
+    return lang, NUMERALS[digits]
+
+
+def _mixed_words(number, lang, numerals):
+    """Mixed-script text for a validated number, mirroring core._number_words."""
+    if number < 0:
+        return f"-{_mixed_words(-number, lang, numerals)}"
+    if type(number) is int:
+        return _mixed_integer(number, SCALES[lang], numerals)
+
+    parts = _split_currency(number)
+    if not parts:
+        return numerals[0]
+    currency = CURRENCY[lang]
+    scales = SCALES[lang]
+    return currency[4].join([
+        f"{_mixed_integer(amount, scales, numerals)} {currency[unit]}" for amount, unit in parts
+    ])
+
+
+def _mixed_integer(number, scales, numerals):
+    """Digits and scale words for a non-negative integer."""
+    if number < 1000:
+        return numerals[number]
+    parts = []
+    rest = 0
+    for count, scale in _split_groups(number):
+        if scale == 'hundred':
+            rest = count * 100
+        elif scale is None:
+            rest += count
+        else:
+            parts.append(f"{numerals[count]} {scales[scale]}")
+    if rest:
+        parts.append(numerals[rest])
+    return ' '.join(parts)
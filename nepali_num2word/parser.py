@@ -0,0 +1,254 @@
+"""
+Numeric string parser shared by the library and the command-line tools.
+
+Accepts the forms numbers are usually written in Nepal, e.g. "120000",
+"1,20,000", "1,200,000", "१,२०,०००", "  1e5 ", "Rs. 500", "रु. ५००/-" and
+"-123.45". All of them are matched by one regular expression, compiled on
+first use so that importing the package does not pay for it.
+Like int() and float(), it also reads underscores between digits ("1_000")
+and the decimal digits of any script ("١٢٣").
+"""
+
+import math
+import unicodedata
+from decimal import Decimal
+
+_NUMBER_TEMPLATE = r'''
+    \s*
+    (?P<sign>[-+])?\s*
+    (?:(?:rs\.?|npr\.?|रु\.?|रू\.?)\s*)?          # optional currency prefix
+    (?P<sign2>[-+])?
+    (?P<int>
+        {digits}                                  # no grouping
+      | {d}{{1,3}}(?:,{d}{{3}})+                  # Western grouping 1,200,000
+      | {d}{{1,2}}(?:,{d}{{2}})+,{d}{{3}}         # Nepali grouping 12,00,000
+    )
+    (?:\.(?P<frac>{digits}))?
+    (?:[eE](?P<exp>[-+]?{exponent}))?
+    \s*(?:/-)?\s*                                 # optional "/-" suffix
+    '''
+
+# Compiled by _compile_patterns() on first use:
+# _NUMBER_PATTERN matches ASCII and Devanagari digits, which int() and float()
+# read directly. _UNICODE_NUMBER_PATTERN is the fallback for what int() and
+# float() also accept: decimal digits of any script and single underscores
+# between digits ("1_000", "١٢٣"); it is kept apart because its nested repeats
+# make the common case about 25% slower. _PLAIN_DECIMAL matches plain ASCII
+# decimals such as "-123.45", which float() parses directly.
+_NUMBER_PATTERN = _UNICODE_NUMBER_PATTERN = _PLAIN_DECIMAL = None
+
+# Largest exponent _decimal_parts expands into digits
+_MAX_DIGITS_EXPONENT = 1000
+
+
+
+class _DigitTable(dict):
+    """str.translate table mapping any decimal digit to ASCII, filled on first use."""
+
+    def __missing__(self, code):
+        digit = unicodedata.decimal(chr(code), None)
+        self[code] = value = code if digit is None else 48 + digit
+        return value
+
+
+_ASCII_DIGITS = _DigitTable()
+
+# Most digits of a parsed value: the float range, sys.float_info.max_10_exp + 1
+_MAX_DIGITS = 309
+
+
+def parse_number(text):
+    """
+    Parse a numeric string to int or float.
+
+    Handles Western and Nepali grouping commas, Devanagari digits, surrounding
+    whitespace, a currency prefix (Rs, NPR, रु), a trailing "/-" and exponents.
+    Values without a decimal point are returned as int, so "1e5" gives 100000.
+
+    Args:
+        text (str): String representation of the number.
+
+    Returns:
+        Union[int, float]: Parsed number as int or float.
+
+    Raises:
+        ValueError: If the string cannot be parsed as a number, or its value is
+                    beyond the float range.
+
+    Examples:
+        >>> parse_number('1,20,000')
+        120000
+        >>> parse_number('१,२०,०००')
+        120000
+        >>> parse_number('Rs. 500')
+        500
+        >>> parse_number(' 1e5 ')
+        100000
+        >>> parse_number('-123.45')
+        -123.45
+    """
+    value = _parse(text)
+    if value is None:
+        raise ValueError(_parse_error(text)[1])
+    return value
+
+
+def _compile_patterns():
+    """Compile the regular expressions, once; ``re`` is imported only here."""
+    global _NUMBER_PATTERN, _UNICODE_NUMBER_PATTERN, _PLAIN_DECIMAL
+    import re
+
+    flags = re.VERBOSE | re.IGNORECASE
+    _PLAIN_DECIMAL = re.compile(r'-?[0-9]+\.[0-9]+')
+    _UNICODE_NUMBER_PATTERN = re.compile(
+        _NUMBER_TEMPLATE.format(d=r'\d', digits=r'(?:\d+(?:_\d+)*)?', exponent=r'\d+(?:_\d+)*'), flags,
+    )
+    # Assigned last: callers test it to see whether the patterns exist. Threads
+    # racing here get the same objects back from the re module's cache.
+    _NUMBER_PATTERN = re.compile(
+        _NUMBER_TEMPLATE.format(d='[0-9०-९]', digits='[0-9०-९]*', exponent='[0-9०-९]+'), flags,
+    )
+
+
+def _parse(text):
+    """
+    Parse a numeric string without raising.
+
+    Args:
+        text (str): String representation of the number.
+
+    Returns:
+        int, float or None: The parsed number, or None if the string is not
+                            valid or its value is beyond the float range.
+    """
+    # Fast paths for plain ASCII integers and decimals. Longer strings go on:
+    # int() refuses more than 4300 digits and float() would give inf.
+    if len(text) <= _MAX_DIGITS:
+        if text.isdigit() and text.isascii():
+            return int(text)
+        if _NUMBER_PATTERN is None:
+            _compile_patterns()
+        if _PLAIN_DECIMAL.fullmatch(text):
+            return float(text)
+
+    match = _match(text)
+    if match is None:
+        return None
+
+    sign, sign2, integer, frac, exp = match.group('sign', 'sign2', 'int', 'frac', 'exp')
+    negative = (sign or sign2) == '-'
+    if match.re is _UNICODE_NUMBER_PATTERN:
+        # Underscores and other scripts' zeros would skew the digit counts below
+        integer, frac, exp = _ascii_digits(integer), _ascii_digits(frac), _ascii_digits(exp)
+    integer = integer.replace(',', '')
+
+    if frac is None and (exp is None or exp[0] != '-'):
+        # Integer mantissa: exact int, no float rounding of "1e30"
+        integer = integer.lstrip('0०')
+        if not integer:
+            return 0
+        shift = (exp or '0').lstrip('+').lstrip('0०')
+        # An exponent of four or more digits is beyond _MAX_DIGITS anyway
+        shift = int(shift or '0') if len(shift) < 4 else _MAX_DIGITS
+        if len(integer) + shift > _MAX_DIGITS:
+            return None
+        value = int(integer) * 10 ** shift
+    else:
+        value = float(f"{integer or '0'}.{frac or ''}e{exp or '0'}")
+        if math.isinf(value):
+            return None
+    return -value if negative else value
+
+
+def _ascii_digits(digits):
+    """Drop grouping commas and underscores and map the digits to ASCII (None stays None)."""
+    if digits is None:
+        return None
+    digits = digits.replace(',', '').replace('_', '')
+    return digits if digits.isascii() else digits.translate(_ASCII_DIGITS)
+
+
+def _match(text):
+    """Return the _NUMBER_PATTERN match of a well-formed numeric string, or None."""
+    if _NUMBER_PATTERN is None:
+        _compile_patterns()
+    match = _NUMBER_PATTERN.fullmatch(text)
+    if match is None and ('_' in text or not text.isascii()):
+        match = _UNICODE_NUMBER_PATTERN.fullmatch(text)
+    if match is None or not (match['int'] or match['frac']) or (match['sign'] and match['sign2']):
+        return None
+    return match
+
+
+def _parse_error(text):
+    """
+    Classify a string that _parse or _decimal_parts rejected.
+
+    Args:
+        text (str): The rejected string.
+
+    Returns:
+        tuple: ``(code, message)`` with code 'empty_string', 'too_large' (well
+               formed, but too many digits) or 'invalid_string'.
+    """
+    if text.strip() == '':
+        return 'empty_string', "Empty string is not a valid number"
+    if _match(text) is not None:
+        return 'too_large', _too_large_message(text.strip())
+    return 'invalid_string', f"'{text}' is not a valid number"
+
+
+def _too_large_message(number):
+    """Message for values outside the supported range."""
+    return f"Number {number} is too large. Maximum supported: 999,999,999"
+
+
+def _decimal_parts(text):
+    """
+    Split a numeric string into its exact digits, without a float round trip.
+
+    Accepts the same forms as parse_number. An exponent shifts the decimal
+    point exactly (via Decimal).
+
+    Args:
+        text (str): String representation of the number.
+
+    Returns:
+        tuple or None: ``(negative, integer, fraction)`` where ``integer`` is an
+                       int and ``fraction`` the digits after the point as written,
+                       mapped to ASCII (possibly ''), or None if the string
+                       is not valid or its integer part has more than
+                       _MAX_DIGITS digits.
+
+    Examples:
+        >>> _decimal_parts('-12.3450')
+        (True, 12, '3450')
+        >>> _decimal_parts('१२.३४')
+        (False, 12, '34')
+        >>> _decimal_parts('1.5e-3')
+        (False, 0, '0015')
+        >>> _decimal_parts('5e-1')
+        (False, 0, '5')
+    """
+    match = _match(text)
+    if match is None:
+        return None
+
+    sign, sign2, integer, frac, exp = match.group('sign', 'sign2', 'int', 'frac', 'exp')
+    negative = (sign or sign2) == '-'
+    integer = _ascii_digits(integer).lstrip('0') or '0'
+    frac = _ascii_digits(frac or '')
+    if exp is not None:
+        exp = _ascii_digits(exp)
+        # Four digits already exceed _MAX_DIGITS_EXPONENT; int() of very long
+        # exponents would fail
+        digits = exp.lstrip('+-').lstrip('0')
+        if len(digits) > 4 or int(digits or '0') > _MAX_DIGITS_EXPONENT:
+            return None
+        # No fraction digit is added that was not written: "1e-3" has one digit
+        mantissa = f"{integer}.{frac}" if frac else integer
+        shifted = Decimal(f"{mantissa}e{exp}")
+        integer, _, frac = format(shifted, 'f').partition('.')
+    if len(integer) > _MAX_DIGITS:
+        return None
+    return negative, int(integer), frac
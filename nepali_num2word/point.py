@@ -0,0 +1,138 @@
+"""
+Decimal-point words for nepali-num2word ("twelve point three four five").
+
+``convert_to_words`` reads fractions as rupees and paise, rounded to two
+places. Scientific and statistical text needs every digit instead:
+"twelve point three four five" or "बाह्र दशमलव तीन चार पाँच". The digits after
+the point are taken exactly as written in a string or ``Decimal`` (no float
+round trip) and mapped to words with one ``str.translate`` call through a
+precomputed digit table.
+"""
+
+import math
+from decimal import Decimal
+from types import MappingProxyType
+
+from .core import MAX_NUMBER, WORDS, _convert_number, _too_large_message, convert_integer_to_words
+from .parser import _decimal_parts, _parse_error
+
+# Word for the decimal point, per language
+POINT_WORDS = MappingProxyType({
+    'en': 'point',
+    'np': 'दशमलव',
+    'rom': 'dashamlav',
+})
+
+# str.translate tables: ASCII digit -> " <digit word>". Fractions in other
+# scripts reach them already mapped to ASCII by _decimal_parts.
+_FRACTION_TABLES = MappingProxyType({
+    lang: {ord(str(d)): f" {WORDS[lang][d]}" for d in range(10)}
+    for lang in POINT_WORDS
+})
+
+
+def convert_to_point_words(number, lang='en'):
+    """
+    Convert a number to words, reading every digit after the decimal point.
+
+    Strings and ``Decimal`` values keep all their digits, including trailing
+    zeros ("12.50" gives "twelve point five zero"). Floats use their shortest
+    repr ("0.1", not the binary expansion).
+
+    Args:
+        number (int, float, str, Decimal or other real number): The number.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Returns:
+        str: The integer part in words, then the point word and one word per
+             fractional digit.
+
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted or its integer part is out of range.
+
+    Examples:
+        >>> convert_to_point_words('12.345')
+        'twelve point three four five'
+        >>> convert_to_point_words('12.345', lang='np')
+        'बाह्र दशमलव तीन चार पाँच'
+        >>> convert_to_point_words(-0.05)
+        '-zero point zero five'
+    """
+    if lang not in POINT_WORDS:
+        lang = 'en'
+    negative, integer, fraction = _point_parts(number)
+    words = convert_integer_to_words(integer, lang)
+    if fraction:
+        words = f"{words} {POINT_WORDS[lang]}{fraction.translate(_FRACTION_TABLES[lang])}"
+    return f"-{words}" if negative else words
+
+
+def convert_to_point_words_batch(numbers, lang='en'):
+    """
+    Convert many numbers to decimal-point words.
+
+    Args:
+        numbers (iterable): Values accepted by convert_to_point_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Returns:
+        list: The words, in the same order as ``numbers``.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+
+    Examples:
+        >>> convert_to_point_words_batch(['3.14', '2.50'])
+        ['three point one four', 'two point five zero']
+    """
+    if lang not in POINT_WORDS:
+        lang = 'en'
+    point = POINT_WORDS[lang]
+    table = _FRACTION_TABLES[lang]
+    results = []
+    for number in numbers:
+        negative, integer, fraction = _point_parts(number)
+        words = convert_integer_to_words(integer, lang)
+        if fraction:
+            words = f"{words} {point}{fraction.translate(table)}"
+        results.append(f"-{words}" if negative else words)
+    return results
+
+
+def _point_parts(number):
+    """
+    Return ``(negative, integer, fraction digits)`` of a value.
+
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number is invalid or its integer part is out of range.
+    """
+    if isinstance(number, str):
+        whole, _, fraction = number.partition('.')
+        # Plain "123.45", at most nine integer digits: skip the regex of _decimal_parts
+        if (len(whole) <= 9 and whole.isascii() and whole.isdigit()
+                and (fraction == '' or fraction.isascii() and fraction.isdigit())):
+            return False, int(whole), fraction
+        parts = _decimal_parts(number)
+        if parts is None:
+            raise ValueError(_parse_error(number)[1])
+        if parts[1] > MAX_NUMBER:
+            raise ValueError(_too_large_message(number.strip()))
+        return parts
+
+    value = _convert_number(number)
+    if type(value) is float and not math.isfinite(value):
+        raise ValueError(f"'{value}' is not a valid number")
+    # Only the integer part is limited, as for strings
+    if abs(value) >= MAX_NUMBER + 1:
+        raise ValueError(_too_large_message(number))
+    if type(value) is int:
+        return value < 0, abs(value), ''
+    negative = value < 0
+    if not isinstance(value, Decimal):
+        # Shortest repr digits of the float, e.g. 0.1 -> "0.1"
+        value = Decimal(repr(float(value)))
+    integer, _, fraction = format(abs(value), 'f').partition('.')
+    return negative, int(integer), fraction
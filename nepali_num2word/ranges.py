@@ -0,0 +1,83 @@
+"""
+Incremental words for consecutive ranges in nepali-num2word.
+
+For long ranges such as every amount from 1 to 1,00,00,000 only the last group
+changes from one value to the next. ``iter_range_words()`` works like an
+odometer: the text for the crore/lakh/thousand groups is rebuilt only when the
+thousands change, the hundreds part only when the hundreds change, and each
+value just appends its precomputed 0-99 word.
+"""
+
+from .core import MAX_NUMBER, SCALES, WORDS
+
+
+def iter_range_words(start, stop=None, step=1, lang='en'):
+    """
+    Yield the words for every value of ``range(start, stop, step)``.
+
+    Gives the same strings as ``convert_integer_to_words`` for each value.
+
+    Args:
+        start (int): First value, or the stop value if ``stop`` is omitted
+                     (like ``range``).
+        stop (int, optional): End of the range (exclusive). Defaults to None.
+        step (int, optional): Step, may be negative. Defaults to 1.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Yields:
+        str: The words for each value, in range order.
+
+    Raises:
+        ValueError: If the range contains values outside 0-999,999,999,
+                    or step is 0.
+
+    Examples:
+        >>> list(iter_range_words(99, 102))
+        ['ninety-nine', 'one hundred', 'one hundred one']
+        >>> list(iter_range_words(120000, 120002, lang='np'))
+        ['एक लाख बीस हजार', 'एक लाख बीस हजार एक']
+    """
+    numbers = range(start) if stop is None else range(start, stop, step)
+    if numbers and (min(numbers[0], numbers[-1]) < 0 or max(numbers[0], numbers[-1]) > MAX_NUMBER):
+        raise ValueError(f"Range values must be between 0 and {MAX_NUMBER:,}")
+    return _iter_range_words(numbers, lang if lang in WORDS else 'en')
+
+
+def _iter_range_words(numbers, lang):
+    """Generator behind iter_range_words, run on a validated range."""
+    words = WORDS[lang]
+    scales = SCALES[lang]
+    crore_words, lakh_words, thousand_words, hundred_words = (
+        tuple(f"{word} {scales[scale]}" for word in words)
+        for scale in ('crore', 'lakh', 'thousand', 'hundred')
+    )
+    # " <word>" for the last group; nothing when it is zero
+    suffixes = ('',) + tuple(f" {word}" for word in words[1:])
+
+    last_hundreds = last_thousands = None
+    upper = prefix = ''
+    for number in numbers:
+        hundreds, low = divmod(number, 100)
+        if hundreds != last_hundreds:
+            last_hundreds = hundreds
+            thousands, hundred_digit = divmod(hundreds, 10)
+            if thousands != last_thousands:
+                last_thousands = thousands
+                crores, rest = divmod(thousands, 10000)
+                lakhs, thousand_count = divmod(rest, 100)
+                parts = []
+                if crores:
+                    parts.append(crore_words[crores])
+                if lakhs:
+                    parts.append(lakh_words[lakhs])
+                if thousand_count:
+                    parts.append(thousand_words[thousand_count])
+                upper = ' '.join(parts)
+            if hundred_digit:
+                prefix = f"{upper} {hundred_words[hundred_digit]}" if upper else hundred_words[hundred_digit]
+            else:
+                prefix = upper
+        if prefix:
+            yield prefix + suffixes[low]
+        else:
+            yield words[low]
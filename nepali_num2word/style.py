@@ -0,0 +1,168 @@
+"""
+Output styles for number words in nepali-num2word.
+
+Cheque printers and reports need variants of the default words: UPPERCASE or
+Title Case, "twenty five" without hyphens, British "one hundred and one", or a
+"Rupees ... Only" frame. Running ``.upper()``/``.title()`` and concatenating on
+every result allocates each string twice. A ``WordStyle`` applies the style
+once to the word, scale and currency tables (per language, on first use), so
+styled output is built exactly like the default output and costs the same.
+"""
+
+from .core import CURRENCY, SCALES, WORDS, _split_currency, _split_groups, _validate_number
+
+CASES = ('lower', 'upper', 'title')
+
+
+class WordStyle:
+    """
+    A set of style options, compiled into styled word tables.
+
+    Casing follows ``str.upper()``/``str.title()``, so ``WordStyle(case='title')``
+    gives the same text as ``convert_to_words(...).title()``. Devanagari has no
+    case, so casing leaves Nepali words unchanged. Hyphen and "and" options only
+    affect English.
+
+    Args:
+        case (str, optional): 'lower', 'upper' or 'title'. Defaults to 'lower'.
+        hyphen (bool, optional): Hyphenate 21-99 ("twenty-five"). Defaults to True.
+        use_and (bool, optional): Insert "and" before a final group below 100,
+                                  as in "one hundred and one". Defaults to False.
+        prefix (str, optional): Text before every result, e.g. "Rupees ".
+                                Defaults to ''.
+        suffix (str, optional): Text after every result, e.g. " Only". Defaults to ''.
+        rupee_word (bool, optional): Name the rupee unit in amounts with paise
+                                     ("... rupees and ... paise"). Cheque styles
+                                     that start with "Rupees" turn it off.
+                                     Defaults to True.
+
+    Raises:
+        ValueError: If case is not one of CASES.
+
+    Examples:
+        >>> WordStyle(case='upper').convert(120000)
+        'ONE LAKH TWENTY THOUSAND'
+        >>> WordStyle(use_and=True, hyphen=False).convert(125)
+        'one hundred and twenty five'
+        >>> CHEQUE.convert(1234.5)
+        'Rupees One Thousand Two Hundred Thirty-Four And Fifty Paise Only'
+    """
+
+    __slots__ = ('case', 'hyphen', 'use_and', 'prefix', 'suffix', 'rupee_word', '_tables')
+
+    def __init__(self, case='lower', hyphen=True, use_and=False, prefix='', suffix='', rupee_word=True):
+        if case not in CASES:
+            raise ValueError(f"case must be one of {', '.join(CASES)}, got {case!r}")
+        self.case = case
+        self.hyphen = hyphen
+        self.use_and = use_and
+        self.prefix = prefix
+        self.suffix = suffix
+        self.rupee_word = rupee_word
+        self._tables = {}
+
+    def _apply_case(self, text):
+        if self.case == 'upper':
+            return text.upper()
+        if self.case == 'title':
+            return text.title()
+        return text
+
+    def _compile(self, lang):
+        """
+        Build the styled tables for one language.
+
+        Returns:
+            tuple: ``(words, final_words, scales, currency)`` where ``final_words``
+                   are the words used for a last group below 100 that follows
+                   other groups (with "and" if ``use_and``).
+        """
+        words = WORDS[lang]
+        if not self.hyphen:
+            words = tuple(word.replace('-', ' ') for word in words)
+        words = tuple(self._apply_case(word) for word in words)
+        if self.use_and and lang == 'en':
+            and_word = self._apply_case('and')
+            final_words = tuple(f"{and_word} {word}" for word in words)
+        else:
+            final_words = words
+        scales = {key: self._apply_case(word) for key, word in SCALES[lang].items()}
+        currency = tuple(self._apply_case(word) for word in CURRENCY[lang])
+        tables = (words, final_words, scales, currency)
+        self._tables[lang] = tables
+        return tables
+
+    def convert(self, number, lang='en'):
+        """
+        Convert a number to words in this style.
+
+        Args:
+            number (int, float, str or other real number): Any value accepted by
+                              convert_to_words.
+            lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+        Returns:
+            str: The styled words.
+
+        Raises:
+            TypeError: If number is not a valid numeric type.
+            ValueError: If number cannot be converted or is out of range.
+        """
+        if lang not in WORDS:
+            lang = 'en'
+        tables = self._tables.get(lang) or self._compile(lang)
+        return f"{self.prefix}{self._words(_validate_number(number), tables)}{self.suffix}"
+
+    def convert_batch(self, numbers, lang='en'):
+        """
+        Convert many numbers to words in this style.
+
+        Args:
+            numbers (iterable): Values accepted by convert_to_words.
+            lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+        Returns:
+            list: The styled words, in the same order as ``numbers``.
+        """
+        return [self.convert(number, lang) for number in numbers]
+
+    def _words(self, number, tables):
+        """Styled words for a validated number, mirroring core._number_words."""
+        if number < 0:
+            return f"-{self._words(-number, tables)}"
+        if type(number) is int:
+            return _styled_integer(number, tables)
+
+        parts = _split_currency(number)
+        if not parts:
+            return tables[0][0]
+        currency = tables[3]
+        # Units 0 and 1 are rupee/rupees, which cheque styles leave out
+        return currency[4].join([
+            f"{_styled_integer(amount, tables)} {currency[unit]}" if unit > 1 or self.rupee_word
+            else _styled_integer(amount, tables)
+            for amount, unit in parts
+        ])
+
+    def __repr__(self):
+        return (f"WordStyle(case={self.case!r}, hyphen={self.hyphen!r}, use_and={self.use_and!r}, "
+                f"prefix={self.prefix!r}, suffix={self.suffix!r}, rupee_word={self.rupee_word!r})")
+
+
+def _styled_integer(number, tables):
+    """Integer words from styled tables, using the same groups as the engine."""
+    words, final_words, scales, _ = tables
+    if number < 0:
+        return f"-{_styled_integer(-number, tables)}"
+    if number < 100:
+        return words[number]
+    groups = _split_groups(number)
+    count, scale = groups[-1]
+    if scale is None:
+        groups.pop()
+        return ' '.join([f"{words[c]} {scales[s]}" for c, s in groups] + [final_words[count]])
+    return ' '.join([f"{words[c]} {scales[s]}" for c, s in groups])
+
+
+# "Rupees One Lakh Twenty Thousand Only"
+CHEQUE = WordStyle(case='title', prefix='Rupees ', suffix=' Only', rupee_word=False)
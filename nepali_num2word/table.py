@@ -0,0 +1,263 @@
+"""
+Precomputed on-disk word table for nepali-num2word.
+
+The table stores the finished words for every value from 0 to 99,999 in each
+supported language, so converting a number becomes at most three lookups
+(crore, lakh and the last five digits). It is optional: nothing changes until
+``install_word_table()`` is called.
+
+File layout (all integers little-endian):
+    header:   magic (8s), format version (H), language count (H),
+              entries per language (I), CRC-32 of payload (I),
+              table fingerprint (32s), language codes (4s each)
+    payload:  for each language, ``entries + 1`` uint32 offsets into the blob,
+              followed by one UTF-8 blob holding all words back to back
+
+The file is memory-mapped on first lookup, so processes using the same file
+share its pages through the OS page cache.
+
+Usage:
+    python -m nepali_num2word.table build words.bin
+    python -m nepali_num2word.table verify words.bin
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+from . import core
+
+MAGIC = b'NPNWTBL\x00'
+FORMAT_VERSION = 1
+TABLE_SIZE = 100000
+LANGUAGES = ('en', 'np', 'rom')
+
+_HEADER = struct.Struct('<8sHHII32s')
+_LANG_CODE = struct.Struct('<4s')
+
+
+def write_word_table(path, languages=LANGUAGES):
+    """
+    Generate a word table file for 0-99,999.
+
+    Args:
+        path (str): Destination file path.
+        languages (tuple, optional): Language codes to include. Defaults to ('en', 'np', 'rom').
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+    offsets = array('I')
+    blob = bytearray()
+    for lang in languages:
+        offsets.append(len(blob))
+        for number in range(TABLE_SIZE):
+            blob += core._integer_words(number, lang).encode('utf-8')
+            offsets.append(len(blob))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    payload = offsets.tobytes() + bytes(blob)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(languages), TABLE_SIZE,
+        zlib.crc32(payload), bytes.fromhex(core._tables_fingerprint()),
+    )
+    codes = b''.join(_LANG_CODE.pack(lang.encode('ascii')) for lang in languages)
+    with open(path, 'wb') as handle:
+        handle.write(header)
+        handle.write(codes)
+        handle.write(payload)
+    return len(header) + len(codes) + len(payload)
+
+
+class WordTable:
+    """
+    Read-only, lazily memory-mapped word table.
+
+    The file is opened and validated on the first lookup, not on construction.
+    Lookups are safe to call from multiple threads.
+
+    Args:
+        path (str): Path to a file produced by ``write_word_table``.
+        verify (bool, optional): Check the CRC-32 of the payload when the file
+                                 is opened. Defaults to True.
+
+    Raises:
+        ValueError: On first use, if the file is corrupt, has an unknown format
+                    or was generated from different word tables.
+    """
+
+    def __init__(self, path, verify=True):
+        self.path = path
+        self.verify = verify
+        self._languages = ()
+        self._lock = threading.Lock()
+        self._mm = None
+        self._offsets = {}
+        self._blob_base = 0
+
+    def _open(self):
+        with self._lock:
+            if self._mm is not None:
+                return self._mm
+            with open(self.path, 'rb') as handle:
+                mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self._load_header(mm)
+            except Exception:
+                mm.close()
+                raise
+            self._mm = mm
+            return mm
+
+    def _load_header(self, mm):
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a word table: file too short")
+        magic, version, lang_count, size, crc, fingerprint = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a word table: bad magic")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported word table version {version}, expected {FORMAT_VERSION}")
+        if size != TABLE_SIZE:
+            raise ValueError(f"Word table has {size} entries, expected {TABLE_SIZE}")
+        if fingerprint.hex() != core._tables_fingerprint():
+            raise ValueError(f"{self.path} was generated from different word tables; rebuild it")
+
+        position = _HEADER.size
+        languages = []
+        for _ in range(lang_count):
+            languages.append(_LANG_CODE.unpack_from(mm, position)[0].rstrip(b'\x00').decode('ascii'))
+            position += _LANG_CODE.size
+        if self.verify and zlib.crc32(memoryview(mm)[position:]) != crc:
+            raise ValueError(f"{self.path} failed its integrity check (CRC mismatch)")
+
+        for lang in languages:
+            end = position + (TABLE_SIZE + 1) * 4
+            if sys.byteorder == 'little':
+                offsets = memoryview(mm)[position:end].cast('I')
+            else:
+                offsets = array('I', mm[position:end])
+                offsets.byteswap()
+            self._offsets[lang] = offsets
+            position = end
+        self._blob_base = position
+        self._languages = tuple(languages)
+
+    @property
+    def languages(self):
+        """tuple: Language codes stored in the table (opens the file if needed)."""
+        if self._mm is None:
+            self._open()
+        return self._languages
+
+    def lookup(self, number, lang='en'):
+        """
+        Return the words for ``number`` (0-99,999) in ``lang``.
+
+        Args:
+            number (int): Value between 0 and 99,999.
+            lang (str, optional): Language code. Defaults to 'en'.
+
+        Returns:
+            str: The number in words.
+
+        Raises:
+            ValueError: If number is outside 0-99,999.
+        """
+        if not 0 <= number < TABLE_SIZE:
+            raise ValueError(f"Word table covers 0 to {TABLE_SIZE - 1:,}, got {number}")
+        if self._mm is None:
+            self._open()
+        offsets = self._offsets[lang]
+        base = self._blob_base
+        return self._mm[base + offsets[number]:base + offsets[number + 1]].decode('utf-8')
+
+    def check(self):
+        """
+        Compare every entry with the live conversion engine.
+
+        Returns:
+            list: ``(lang, number)`` pairs whose stored words differ (empty if valid).
+        """
+        self._open()
+        return [
+            (lang, number)
+            for lang in self.languages
+            for number in range(TABLE_SIZE)
+            if self.lookup(number, lang) != core._integer_words(number, lang)
+        ]
+
+    def close(self):
+        """
+        Unmap the file. A later lookup maps it again.
+
+        Must not be called while other threads may be looking up words.
+        """
+        with self._lock:
+            if self._mm is not None:
+                for offsets in self._offsets.values():
+                    if isinstance(offsets, memoryview):
+                        offsets.release()
+                self._offsets = {}
+                self._mm.close()
+                self._mm = None
+
+
+def install_word_table(path, verify=True):
+    """
+    Use a precomputed word table for all subsequent conversions.
+
+    The file is mapped lazily on the first conversion, not by this call.
+
+    Args:
+        path (str): Path to a file produced by ``write_word_table``.
+        verify (bool, optional): Check the CRC-32 when the file is opened.
+                                 Defaults to True.
+
+    Returns:
+        WordTable: The installed table.
+    """
+    table = WordTable(path, verify=verify)
+    core._word_table = table
+    return table
+
+
+def uninstall_word_table():
+    """
+    Stop using the precomputed word table and fall back to the engine.
+
+    The mapping is released once no thread holds a reference to the table.
+    """
+    core._word_table = None
+
+
+def main():
+    """Command-line entry point for building and verifying word tables."""
+    parser = argparse.ArgumentParser(description='Build or verify a precomputed word table.')
+    parser.add_argument('command', choices=['build', 'verify'])
+    parser.add_argument('path', help='Path of the word table file')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            size = write_word_table(args.path)
+            print(f"Wrote {size:,} bytes to {args.path}")
+        else:
+            table = WordTable(args.path)
+            mismatches = table.check()
+            table.close()
+            if mismatches:
+                print(f"Error: {len(mismatches)} entries differ from the engine", file=sys.stderr)
+                sys.exit(1)
+            print(f"{args.path} is valid")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Token-ID output for bulk conversions in nepali-num2word.
+
+Every result of ``convert_to_words`` is a sequence of words from a small fixed
+vocabulary: the 0-99 words and scale words of each language, the currency
+words and a minus sign. ``convert_to_tokens()`` stores results as 16-bit token
+IDs into the shared ``VOCABULARY`` (``array('H')``) plus one 32-bit offset per
+result, which takes a few bytes per word instead of a Python string object per
+result. Strings are rebuilt on demand by indexing or ``decode_tokens()``.
+"""
+
+from array import array
+
+from .core import CURRENCY, GROUPS, SCALES, WORDS, _split_currency, _split_groups, _validate_number
+
+# Languages with token IDs, in vocabulary order
+TOKEN_LANGUAGES = ('en', 'np', 'rom')
+
+# Token 0 is the minus sign; it is written without a following space
+MINUS = 0
+
+
+def _build_vocabulary():
+    """
+    Lay out the shared vocabulary and the token IDs of each language.
+
+    Returns:
+        tuple: ``(vocabulary, ids)`` where ``ids[lang]`` is a tuple of
+               ``(first 0-99 token, scale tokens by key, currency tokens)``.
+    """
+    vocabulary = ['-']
+    ids = {}
+    for lang in TOKEN_LANGUAGES:
+        first = len(vocabulary)
+        vocabulary.extend(WORDS[lang])
+        scales = {}
+        for _, scale in GROUPS:
+            scales[scale] = len(vocabulary)
+            vocabulary.append(SCALES[lang][scale])
+        # rupee, rupees, paisa, paise, connector
+        currency = tuple(range(len(vocabulary), len(vocabulary) + 5))
+        vocabulary.extend(word.strip() for word in CURRENCY[lang])
+        ids[lang] = (first, scales, currency)
+    return tuple(vocabulary), ids
+
+
+VOCABULARY, _TOKEN_IDS = _build_vocabulary()
+
+
+class TokenizedWords:
+    """
+    Words for many numbers, stored as token IDs into ``VOCABULARY``.
+
+    Result ``i`` is ``tokens[offsets[i]:offsets[i + 1]]``. Indexing and iteration
+    decode results to strings on demand.
+
+    Attributes:
+        lang (str): Language of the results.
+        tokens (array): Token IDs of all results back to back (``array('H')``).
+        offsets (array): ``len(self) + 1`` start positions into ``tokens``
+                         (``array('I')``, so at most 2**32 - 1 tokens per instance).
+
+    Examples:
+        >>> words = convert_to_tokens([120000, 5])
+        >>> words[0]
+        'one lakh twenty thousand'
+        >>> list(words.token_ids(0))
+        [2, 102, 21, 103]
+    """
+
+    __slots__ = ('lang', 'tokens', 'offsets')
+
+    def __init__(self, lang='en', tokens=None, offsets=None):
+        self.lang = lang
+        self.tokens = array('H') if tokens is None else tokens
+        self.offsets = array('I', [0]) if offsets is None else offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return decode_tokens(self.token_ids(index))
+
+    def __iter__(self):
+        tokens = self.tokens
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield decode_tokens(tokens[offsets[i]:offsets[i + 1]])
+
+    def token_ids(self, index):
+        """
+        Return the token IDs of one result.
+
+        Args:
+            index (int): Result index (negative values count from the end).
+
+        Returns:
+            array: Token IDs into ``VOCABULARY``.
+        """
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("TokenizedWords index out of range")
+        return self.tokens[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def nbytes(self):
+        """int: Bytes used by the token and offset buffers."""
+        return (len(self.tokens) * self.tokens.itemsize
+                + len(self.offsets) * self.offsets.itemsize)
+
+    def __repr__(self):
+        return f"TokenizedWords({len(self)} results, {len(self.tokens)} tokens, lang={self.lang!r})"
+
+
+def decode_tokens(ids):
+    """
+    Turn token IDs back into the words string.
+
+    Args:
+        ids (iterable): Token IDs into ``VOCABULARY``.
+
+    Returns:
+        str: The same string ``convert_to_words`` returns.
+
+    Examples:
+        >>> decode_tokens([0, 2, 102])
+        '-one lakh'
+    """
+    words = [VOCABULARY[i] for i in ids]
+    if words and words[0] == '-':
+        return '-' + ' '.join(words[1:])
+    return ' '.join(words)
+
+
+def convert_to_tokens(numbers, lang='en'):
+    """
+    Convert many numbers to words stored as token IDs.
+
+    Accepts the same values as ``convert_to_words``; decoding result ``i`` gives
+    exactly ``convert_to_words(numbers[i], lang)``.
+
+    Args:
+        numbers (iterable): Values accepted by convert_to_words.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Returns:
+        TokenizedWords: The results as token IDs with one offset per value.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range.
+
+    Examples:
+        >>> words = convert_to_tokens([120000, 123.45], lang='np')
+        >>> words[1]
+        'एक सय तेइस रुपैयाँ र पैँतालीस पैसा'
+    """
+    if lang not in _TOKEN_IDS:
+        lang = 'en'
+    first, scales, currency = _TOKEN_IDS[lang]
+
+    def integer_ids(number):
+        if number == 0:
+            return [first]
+        ids = []
+        for count, scale in _split_groups(number):
+            ids.append(first + count)
+            if scale:
+                ids.append(scales[scale])
+        return ids
+
+    result = TokenizedWords(lang)
+    tokens = result.tokens
+    offsets = result.offsets
+    for number in numbers:
+        number = _validate_number(number)
+        if number < 0:
+            tokens.append(MINUS)
+            number = -number
+        if type(number) is int:
+            tokens.fromlist(integer_ids(number))
+        else:
+            tokens.fromlist(_currency_ids(number, integer_ids, first, currency))
+        offsets.append(len(tokens))
+    return result
+
+
+def _currency_ids(number, integer_ids, first, currency):
+    """Token IDs for a non-negative non-integer amount, split by core._split_currency."""
+    parts = _split_currency(number)
+    if not parts:
+        return [first]
+
+    ids = []
+    for amount, unit in parts:
+        if ids:
+            ids.append(currency[4])
+        ids += integer_ids(amount)
+        ids.append(currency[unit])
+    return ids
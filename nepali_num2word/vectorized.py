@@ -0,0 +1,143 @@
+"""
+NumPy backend for formatting integer arrays with Nepali-style commas.
+
+``format_number_array()`` gives the same strings as calling ``format_number``
+on every element, without a Python-level loop over elements: digit counts
+come from one ``searchsorted``, digits from repeated vectorized ``divmod`` by
+10 (one pass per digit position), and the digits and commas are written into
+a fixed-width code-unit matrix that is a view of the result array.
+
+Requires NumPy (``pip install nepali-num2word[numpy]``); the rest of the
+package does not.
+
+Examples:
+    >>> import numpy as np
+    >>> format_number_array(np.array([1000000, -120000, 5]))
+    array(['10,00,000', '-1,20,000', '5'], dtype='<U10')
+    >>> format_number_array([120000], lang='np', dtype='S')
+    array([b'\\xe0\\xa5\\xa7,\\xe0\\xa5\\xa8\\xe0\\xa5\\xa6,\\xe0\\xa5\\xa6\\xe0\\xa5\\xa6\\xe0\\xa5\\xa6'],
+          dtype='|S20')
+"""
+
+import numpy as np
+
+# Rows converted at a time, bounding the temporary digit matrices
+CHUNK_SIZE = 1 << 16
+
+# 10**1 .. 10**19: a value has 1 + (number of powers <= value) digits
+_POWERS = np.array([10 ** k for k in range(1, 20)], dtype=np.uint64)
+
+# Code units of a digit d, per (dtype, lang): constant lead units, then
+# ``base + d`` as the last unit
+_DIGIT_UNITS = {
+    ('U', 'en'): ((), 0x30),
+    ('U', 'np'): ((), 0x0966),
+    ('S', 'en'): ((), 0x30),
+    # UTF-8 of U+0966..U+096F
+    ('S', 'np'): ((0xE0, 0xA5), 0xA6),
+}
+
+_UNIT_TYPES = {'U': np.uint32, 'S': np.uint8}
+
+
+def _comma_right_of(index):
+    """True if a comma follows the digit ``index`` places from the right (3, 5, 7, ...)."""
+    return index >= 3 and index % 2 == 1
+
+
+def format_number_array(values, lang='en', dtype='U'):
+    """
+    Format an integer array with Nepali-style commas.
+
+    Element for element the result equals ``format_number(int(value), lang)``
+    (encoded as UTF-8 for ``dtype='S'``).
+
+    Args:
+        values (array_like): Signed or unsigned integers of any shape.
+        lang (str, optional): 'en' for ASCII digits, 'np' for Devanagari digits.
+                              Defaults to 'en'.
+        dtype (str, optional): 'U' for a str array, or 'S' for a fixed-width
+                               bytes array of UTF-8 text (a quarter of the
+                               memory of 'U' for ASCII digits). Defaults to 'U'.
+
+    Returns:
+        numpy.ndarray: Formatted strings with the same shape as ``values``.
+
+    Raises:
+        TypeError: If values is not an integer array.
+        ValueError: If dtype is not 'U' or 'S'.
+    """
+    if dtype not in _UNIT_TYPES:
+        raise ValueError(f"dtype must be 'U' or 'S', got {dtype!r}")
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.empty(values.shape, dtype=f'{dtype}1')
+    if values.dtype.kind not in 'iu':
+        raise TypeError(f"format_number_array needs an integer array, got dtype {values.dtype}; "
+                        f"use format_number for other values")
+    flat = values.ravel()
+
+    if values.dtype.kind == 'i':
+        negative = flat < 0
+        # abs() of the int64 minimum wraps to itself, which as uint64 is 2**63: still exact
+        magnitudes = np.abs(flat.astype(np.int64)).astype(np.uint64)
+    else:
+        negative = None
+        magnitudes = flat.astype(np.uint64)
+    has_sign = negative is not None and bool(negative.any())
+    max_digits = 1 + int(np.searchsorted(_POWERS, magnitudes.max(), side='right'))
+
+    unit = _UNIT_TYPES[dtype]
+    lead, base = _DIGIT_UNITS[(dtype, 'np' if lang == 'np' else 'en')]
+    digit_width = len(lead) + 1
+    # lengths[n]: code units of an n-digit value without sign
+    lengths = [0]
+    for index in range(max_digits):
+        lengths.append(lengths[-1] + digit_width + _comma_right_of(index))
+    body_width = lengths[-1]
+    width = body_width + has_sign
+    # Division is about twice as fast in 32 bits
+    work_type = np.uint32 if max_digits < 10 else np.uint64
+    ten = work_type(10)
+    base = work_type(base)
+
+    result = np.zeros(flat.size, dtype=f'{dtype}{width}')
+    units = result.view(unit).reshape(flat.size, width)
+
+    for start in range(0, flat.size, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, flat.size)
+        chunk = magnitudes[start:stop]
+        out = units[start:stop]
+
+        # Every value right-aligned, padded with zero digits, written straight
+        # into the output rows; most values have the maximum digit count
+        body = out[:, :body_width]
+        quotient = chunk.astype(work_type)
+        end = body_width
+        for index in range(max_digits):
+            quotient, digit = np.divmod(quotient, ten)
+            if _comma_right_of(index):
+                end -= 1
+                body[:, end] = ord(',')
+            body[:, end - 1] = digit + base
+            if lead:
+                body[:, end - digit_width:end - 1] = lead
+            end -= digit_width
+
+        # Shorter values: move the significant tail to the front. Rows are
+        # grouped by digit count, so this loops over widths, not elements.
+        digits = np.searchsorted(_POWERS, chunk, side='right') + 1
+        for count in np.unique(digits).tolist():
+            if count == max_digits:
+                continue
+            rows = np.flatnonzero(digits == count)
+            length = lengths[count]
+            tail = body[rows, body_width - length:]
+            out[rows] = 0
+            out[rows, :length] = tail
+
+        if has_sign:
+            rows = np.flatnonzero(negative[start:stop])
+            out[rows, 1:] = out[rows, :-1]
+            out[rows, 0] = ord('-')
+    return result.reshape(values.shape)
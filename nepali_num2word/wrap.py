@@ -0,0 +1,170 @@
+"""
+Fixed-width line wrapping of amounts in words for print layouts.
+
+Cheque and voucher fields hold a fixed number of columns per line. In
+Devanagari the number of characters is not the display width: vowel signs
+such as "ु" and "ै", the virama "्" and the candrabindu "ँ" take no column of
+their own. ``display_width()`` measures text; the width of every vocabulary
+word (``tokens.VOCABULARY``) is measured once at import, and
+``wrap_words()`` wraps the token IDs of the result, so wrapping only adds up
+precomputed integers.
+"""
+
+import unicodedata
+
+from .tokens import MINUS, VOCABULARY, convert_to_tokens
+
+_VIRAMA = '्'
+
+
+def display_width(text):
+    """
+    Number of columns ``text`` takes when printed.
+
+    Non-spacing and enclosing marks and format characters (categories Mn, Me
+    and Cf) take no column; wide and full-width characters take two; all other
+    characters, including spacing vowel signs such as "ा", take one. Like
+    terminal width tables (wcwidth), each consonant of a conjunct counts.
+
+    Args:
+        text (str): Text to measure.
+
+    Returns:
+        int: Display width in columns.
+
+    Examples:
+        >>> display_width('रुपैयाँ')
+        4
+        >>> display_width('twenty-five')
+        11
+    """
+    width = 0
+    for char in text:
+        if unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+# Display width of every vocabulary word, indexed by token ID
+TOKEN_WIDTHS = tuple(display_width(word) for word in VOCABULARY)
+
+
+def wrap_words(number, width, lang='en'):
+    """
+    Convert a number to words wrapped into lines of at most ``width`` columns.
+
+    Lines break between words. A word wider than ``width`` on its own is
+    split between grapheme clusters, so a vowel sign or a conjunct is never
+    separated from its consonant.
+
+    Args:
+        number (int, float, str or other real number): Any value accepted by
+                          convert_to_words.
+        width (int): Maximum display width of a line.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Returns:
+        list: The lines; joined with spaces they give ``convert_to_words(number, lang)``
+              unless a word had to be split.
+
+    Raises:
+        TypeError: If number is not a valid numeric type.
+        ValueError: If number cannot be converted or is out of range, or width
+                    is less than 1.
+
+    Examples:
+        >>> wrap_words(123456789, 20)
+        ['twelve crore', 'thirty-four lakh', 'fifty-six thousand', 'seven hundred', 'eighty-nine']
+        >>> wrap_words(120000.5, 15, lang='np')
+        ['एक लाख बीस हजार', 'रुपैयाँ र पचास पैसा']
+    """
+    return wrap_words_batch((number,), width, lang)[0]
+
+
+def wrap_words_batch(numbers, width, lang='en'):
+    """
+    Convert many numbers to wrapped words.
+
+    Args:
+        numbers (iterable): Values accepted by convert_to_words.
+        width (int): Maximum display width of a line.
+        lang (str, optional): 'en', 'np' or 'rom'. Defaults to 'en'.
+
+    Returns:
+        list: One list of lines per number, in the same order as ``numbers``.
+
+    Raises:
+        TypeError: If any value is not a valid numeric type.
+        ValueError: If any value is invalid or out of range, or width is less than 1.
+    """
+    if width < 1:
+        raise ValueError(f"width must be at least 1, got {width}")
+    words = convert_to_tokens(numbers, lang)
+    tokens = words.tokens
+    offsets = words.offsets
+    return [_wrap_ids(tokens[offsets[i]:offsets[i + 1]], width) for i in range(len(offsets) - 1)]
+
+
+def _wrap_ids(ids, width):
+    """Greedy wrap of one result's token IDs."""
+    lines = []
+    line = []
+    used = 0
+    minus = False
+    for token in ids:
+        if token == MINUS:
+            minus = True
+            continue
+        word = VOCABULARY[token]
+        size = TOKEN_WIDTHS[token]
+        if minus:
+            word = f"-{word}"
+            size += 1
+            minus = False
+        if line and used + 1 + size <= width:
+            line.append(word)
+            used += 1 + size
+            continue
+        if line:
+            lines.append(' '.join(line))
+        if size <= width:
+            line = [word]
+            used = size
+        else:
+            pieces = _split_word(word, width)
+            lines.extend(pieces[:-1])
+            line = [pieces[-1]]
+            used = display_width(pieces[-1])
+    if line:
+        lines.append(' '.join(line))
+    return lines
+
+
+def _split_word(word, width):
+    """Split a word wider than ``width`` into pieces between grapheme clusters."""
+    pieces = []
+    piece = ''
+    used = 0
+    for cluster in _clusters(word):
+        size = display_width(cluster)
+        if piece and used + size > width:
+            pieces.append(piece)
+            piece = ''
+            used = 0
+        piece += cluster
+        used += size
+    pieces.append(piece)
+    return pieces
+
+
+def _clusters(word):
+    """Yield grapheme clusters: a base character with its marks, joining conjuncts after a virama."""
+    cluster = ''
+    for char in word:
+        if cluster and unicodedata.category(char)[0] != 'M' and not cluster.endswith(_VIRAMA):
+            yield cluster
+            cluster = ''
+        cluster += char
+    if cluster:
+        yield cluster
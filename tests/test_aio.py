@@ -0,0 +1,112 @@
+"""
+Tests for the asyncio-friendly API.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word.aio import (
+    compact_number_async, convert_to_words_async, format_number_async, stream_words,
+)
+
+NUMBERS = list(range(0, 999999999, 333331)) + [-120000, 123.45, "1,20,000"]
+
+
+async def _agen(values):
+    for value in values:
+        yield value
+
+
+async def _max_loop_gap(work, interval=0.001):
+    """Run ``work`` while a ticker measures the longest event-loop stall."""
+    gaps = []
+    done = False
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            gaps.append(now - last - interval)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    return max(gaps), elapsed
+
+
+class TestAsyncResults:
+    """Async results must equal the synchronous functions."""
+    
+    def test_batch_functions(self):
+        """Test the batch functions inline and on a thread pool."""
+        async def main(executor):
+            return (
+                await convert_to_words_async(NUMBERS, 'np', chunk_size=100, executor=executor),
+                await format_number_async(NUMBERS, 'np', chunk_size=100, executor=executor),
+                await compact_number_async(NUMBERS, 2, chunk_size=7, executor=executor),
+            )
+        expected = (
+            [convert_to_words(n, 'np') for n in NUMBERS],
+            [format_number(n, 'np') for n in NUMBERS],
+            [compact_number(n, 2) for n in NUMBERS],
+        )
+        assert asyncio.run(main(None)) == expected
+        with ThreadPoolExecutor(4) as executor:
+            assert asyncio.run(main(executor)) == expected
+    
+    def test_process_pool(self):
+        """Test offloading to a process pool."""
+        with ProcessPoolExecutor(2) as executor:
+            result = asyncio.run(convert_to_words_async(NUMBERS, chunk_size=500, executor=executor))
+        assert result == [convert_to_words(n) for n in NUMBERS]
+    
+    def test_stream_and_async_input(self):
+        """Test the async generator with an async iterable as input."""
+        async def main():
+            return [words async for words in stream_words(_agen(NUMBERS), 'rom', chunk_size=9)]
+        assert asyncio.run(main()) == [convert_to_words(n, 'rom') for n in NUMBERS]
+    
+    def test_errors(self):
+        """Test raising and returning errors."""
+        with pytest.raises(ValueError, match="'abc' is not a valid number"):
+            asyncio.run(convert_to_words_async([1, "abc"]))
+        results, errors = asyncio.run(convert_to_words_async([1, "abc", 2], errors='return', chunk_size=2))
+        assert results == ["one", None, "two"]
+        assert errors[1].code == 'invalid_string'
+        with pytest.raises(ValueError, match="chunk_size"):
+            asyncio.run(convert_to_words_async([1], chunk_size=0))
+
+
+class TestEventLoopLatency:
+    """The event loop must keep running during a large conversion."""
+    
+    def test_chunked_conversion_keeps_loop_responsive(self):
+        """Test that chunking bounds the longest stall of the loop."""
+        numbers = list(range(0, 999999999, 5000))
+        
+        async def blocking():
+            # A plain synchronous call stalls the loop for the whole run
+            [convert_to_words(n) for n in numbers]
+        
+        async def chunked():
+            await convert_to_words_async(numbers, chunk_size=500)
+        
+        async def offloaded():
+            with ThreadPoolExecutor(1) as executor:
+                await convert_to_words_async(numbers, chunk_size=5000, executor=executor)
+        
+        blocked_gap, blocked_time = asyncio.run(_max_loop_gap(blocking))
+        chunked_gap, _ = asyncio.run(_max_loop_gap(chunked))
+        offloaded_gap, _ = asyncio.run(_max_loop_gap(offloaded))
+        assert blocked_gap > blocked_time * 0.9
+        assert chunked_gap < blocked_gap / 5
+        assert offloaded_gap < blocked_gap / 5
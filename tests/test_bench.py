@@ -0,0 +1,49 @@
+"""
+Tests for the built-in self-benchmark.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from nepali_num2word.bench import FUNCTIONS, format_report, run_benchmarks, workloads
+
+
+class TestBench:
+    """Test cases for nepali_num2word.bench."""
+    
+    def test_workloads_are_deterministic(self):
+        """Test that every run generates the same inputs."""
+        assert workloads(500) == workloads(500)
+        assert workloads(10)['int'] == workloads(500)['int'][:10]
+    
+    def test_report(self):
+        """Test the report structure and text rendering."""
+        report = run_benchmarks(count=200)
+        assert report['meta']['count'] == 200
+        assert len(report['results']) == len(FUNCTIONS) * 2 * len(workloads(1))
+        for row in report['results']:
+            assert row['ops'] == 200
+            assert row['ops_per_sec'] > 0
+            assert row['p50_ns'] <= row['p90_ns'] <= row['p99_ns']
+        text = format_report(report)
+        assert 'convert_to_words' in text and 'p99' in text
+    
+    def test_cli_bench_json(self):
+        """Test --bench --json on the format CLI."""
+        cli_path = Path(__file__).parent.parent / "cli" / "format_main.py"
+        result = subprocess.run(
+            [sys.executable, str(cli_path), "--bench", "--json"],
+            capture_output=True, text=True, cwd=Path(__file__).parent.parent,
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout)
+        assert {row['function'] for row in report['results']} == {'format_number'}
+    
+    def test_cli_requires_number_without_bench(self):
+        """Test that the number is still required for normal use."""
+        cli_path = Path(__file__).parent.parent / "cli" / "main.py"
+        result = subprocess.run([sys.executable, str(cli_path)], capture_output=True, text=True)
+        assert result.returncode == 2
+        assert "number" in result.stderr
@@ -0,0 +1,184 @@
+"""
+Tests for the result cache and its warm-start snapshots.
+"""
+
+import struct
+import threading
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word import cache as cache_module
+from nepali_num2word import core
+from nepali_num2word.cache import ResultCache
+
+VALUES = [0, 5, 120000, -120000, 123.45, 5.0, "1,20,000", "abc"]
+
+
+class TestResultCache:
+    """Cached results must equal the uncached functions."""
+    
+    def test_results_and_types(self):
+        """Test that int, float and str inputs are cached separately."""
+        cache = ResultCache()
+        for _ in range(2):
+            for lang in ('en', 'np'):
+                for value in VALUES[:-1]:
+                    assert cache.convert_to_words(value, lang) == convert_to_words(value, lang)
+                    assert cache.compact_number(value, 2, lang) == compact_number(value, 2, lang)
+                for value in VALUES:
+                    assert cache.format_number(value, lang) == format_number(value, lang)
+        assert cache.convert_to_words(5) == "five"
+        assert cache.convert_to_words(5.0) == "five rupees"
+    
+    def test_errors_are_not_cached(self):
+        """Test that invalid values raise every time."""
+        cache = ResultCache()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.convert_to_words("abc")
+            with pytest.raises(TypeError):
+                cache.convert_to_words(None)
+        assert len(cache) == 0
+    
+    def test_maxsize(self):
+        """Test that the cache stops growing at maxsize."""
+        cache = ResultCache(maxsize=10)
+        for number in range(100):
+            assert cache.convert_to_words(number) == convert_to_words(number)
+        assert len(cache) == 10
+    
+    def test_least_recently_used_evicted(self):
+        """Test that a full cache evicts the least recently used entry."""
+        cache = ResultCache(maxsize=3)
+        for number in (1, 2, 3):
+            cache.convert_to_words(number)
+        cache.convert_to_words(1)
+        cache.convert_to_words(4)
+        keys = [key[4] for key in cache._entries]
+        assert keys == [3, 1, 4]
+        assert ResultCache(maxsize=0).convert_to_words(5) == "five"
+    
+    def test_grouping(self):
+        """Test that format_number results are cached per grouping."""
+        cache = ResultCache()
+        for _ in range(2):
+            assert cache.format_number(1000000) == "10,00,000"
+            assert cache.format_number(1000000, grouping='international') == "1,000,000"
+        assert len(cache) == 2
+    
+    def test_concurrent_hits_and_maxsize(self):
+        """Test that no hit is lost and maxsize holds under concurrent use."""
+        cache = ResultCache(maxsize=50)
+        cache.convert_to_words(7)
+        
+        def work():
+            for number in range(200):
+                cache.convert_to_words(7)
+                cache.convert_to_words(number)
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 8 threads x 200 calls, plus the hit of number 7 in each loop
+        assert cache._entries[('words', 'en', None, 'i', 7)][1] == 8 * 201
+        assert len(cache) == 50
+
+
+class TestSnapshots:
+    """Snapshots must round-trip and be invalidated on version or table changes."""
+    
+    def test_round_trip_and_hot_set(self, tmp_path):
+        """Test saving the most used entries and loading them back."""
+        cache = ResultCache()
+        for _ in range(3):
+            cache.convert_to_words(120000, 'np')
+            cache.format_number(123.45)
+            cache.compact_number("4200000", 1, 'np')
+        for number in range(100):
+            cache.convert_to_words(number)
+        path = tmp_path / "hot.snap"
+        assert cache.save(str(path), limit=3) == 3
+        
+        restored = ResultCache()
+        assert restored.load(str(path)) == 3
+        assert len(restored) == 3
+        entries = restored._entries
+        assert entries[('words', 'np', None, 'i', 120000)][0] == "एक लाख बीस हजार"
+        assert entries[('format', 'en', 'nepali', 'f', 123.45)][0] == "123.45"
+        assert entries[('compact', 'np', 1, 's', "4200000")][0] == "४२ लाख"
+        assert restored.convert_to_words(120000, 'np') == "एक लाख बीस हजार"
+    
+    def test_late_hot_key_saved(self, tmp_path):
+        """Test that an amount that becomes hot after the cache is full reaches the snapshot."""
+        cache = ResultCache(maxsize=10)
+        for number in range(100):
+            cache.convert_to_words(number)
+        for _ in range(5):
+            cache.convert_to_words(120000)
+        path = tmp_path / "hot.snap"
+        assert cache.save(str(path), limit=1) == 1
+        restored = ResultCache()
+        restored.load(str(path))
+        assert list(restored._entries) == [('words', 'en', None, 'i', 120000)]
+    
+    def test_load_respects_maxsize_and_existing(self, tmp_path):
+        """Test that loading fills only free slots and keeps existing entries."""
+        cache = ResultCache()
+        for number in range(50):
+            cache.convert_to_words(number)
+        path = tmp_path / "hot.snap"
+        cache.save(str(path))
+        small = ResultCache(maxsize=20)
+        small.convert_to_words(7)
+        assert small.load(str(path)) <= 19
+        assert len(small) <= 20
+        assert small.convert_to_words(7) == "seven"
+    
+    def test_stale_snapshot_ignored(self, tmp_path, monkeypatch):
+        """Test invalidation by package version and word tables."""
+        cache = ResultCache()
+        cache.convert_to_words(1)
+        path = tmp_path / "hot.snap"
+        cache.save(str(path))
+        monkeypatch.setattr(cache_module, "__version__", "99.0.0")
+        assert ResultCache().load(str(path)) == 0
+        monkeypatch.undo()
+        monkeypatch.setattr(core, "_tables_fingerprint", lambda: "00" * 32)
+        assert ResultCache().load(str(path)) == 0
+        monkeypatch.undo()
+        monkeypatch.setattr(core, "ENGINE_REVISION", core.ENGINE_REVISION + 1)
+        assert ResultCache().load(str(path)) == 0
+    
+    def test_long_version(self, tmp_path, monkeypatch):
+        """Test versions longer than 16 bytes, which differ only at the end."""
+        monkeypatch.setattr(cache_module, "__version__", "1.0.0.dev20261019+local.build1")
+        cache = ResultCache()
+        cache.convert_to_words(1)
+        path = tmp_path / "hot.snap"
+        cache.save(str(path))
+        assert ResultCache().load(str(path)) == 1
+        monkeypatch.setattr(cache_module, "__version__", "1.0.0.dev20261019+local.build2")
+        assert ResultCache().load(str(path)) == 0
+    
+    def test_older_format_ignored(self, tmp_path):
+        """Test that a snapshot in an older format counts as stale."""
+        path = tmp_path / "old.snap"
+        path.write_bytes(struct.pack('<8sH', cache_module.MAGIC, 1) + bytes(60))
+        assert ResultCache().load(str(path)) == 0
+    
+    def test_corrupt_snapshot_rejected(self, tmp_path):
+        """Test integrity checks."""
+        cache = ResultCache()
+        cache.convert_to_words(1)
+        path = tmp_path / "hot.snap"
+        cache.save(str(path))
+        data = bytearray(path.read_bytes())
+        data[-3] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="integrity check"):
+            ResultCache().load(str(path))
+        path.write_bytes(b"not a snapshot at all, clearly not" * 3)
+        with pytest.raises(ValueError, match="bad magic"):
+            ResultCache().load(str(path))
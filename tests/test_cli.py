@@ -111,6 +111,14 @@ class TestFormatCLI:
         else:
             pytest.skip("Format CLI not available in test environment")
 
+    def test_format_cli_international(self):
+        """Test format CLI with international grouping."""
+        returncode, stdout, stderr = self.run_format_cli(["1000000", "--grouping", "international"])
+        if returncode == 0:
+            assert stdout == "1,000,000"
+        else:
+            pytest.skip("Format CLI not available in test environment")
+
 
 class TestCompactCLI:
     """Test cases for compact CLI."""
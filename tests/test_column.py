@@ -0,0 +1,81 @@
+"""
+Tests for Arrow-style UTF-8 column output.
+"""
+
+import random
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word.column import (
+    Utf8Column, compact_number_column, convert_to_words_column, format_number_column,
+)
+
+
+@pytest.fixture
+def numbers():
+    rng = random.Random(5)
+    values = [0, 7, 99, 100, 120000, 999999999, -120000, 123.45, 0.5, "1,20,000"]
+    return values + [rng.randint(0, 999999999) for _ in range(3000)]
+
+
+class TestColumns:
+    """Test cases for the bulk column writers."""
+    
+    def test_words_match_convert_to_words(self, numbers):
+        """Test that every string equals convert_to_words."""
+        for lang in ('en', 'np', 'rom'):
+            column = convert_to_words_column(numbers, lang)
+            assert list(column) == [convert_to_words(n, lang) for n in numbers]
+    
+    def test_format_and_compact(self, numbers):
+        """Test formatting and compact strings."""
+        for lang in ('en', 'np'):
+            assert list(format_number_column(numbers, lang, capacity=16)) == [format_number(n, lang) for n in numbers]
+            assert list(compact_number_column(numbers, 2, lang)) == [
+                compact_number(n, 2, lang) for n in numbers
+            ]
+        assert list(format_number_column(["abc"])) == ["abc"]
+    
+    def test_buffer_layout(self):
+        """Test that data and offsets follow the Arrow utf8 layout."""
+        column = convert_to_words_column([1, 25, 1], lang='np')
+        data = bytes(column.data_view)
+        offsets = column.offsets_view
+        assert offsets.format == 'i' and offsets.itemsize == 4
+        assert data == "एकपच्चिसएक".encode('utf-8')
+        assert [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(3)] == ["एक", "पच्चिस", "एक"]
+        assert len(column.data) == column.nbytes
+    
+    def test_large_offsets(self):
+        """Test int64 offsets."""
+        column = convert_to_words_column([1, 2], large_offsets=True)
+        assert column.offsets.typecode == 'q'
+        assert column.offsets_view.itemsize == 8
+        assert list(column) == ["one", "two"]
+    
+    def test_geometric_growth_and_views(self):
+        """Test growth from a tiny buffer and that views do not copy."""
+        column = Utf8Column(capacity=1)
+        sizes = set()
+        for _ in range(1000):
+            column.append(b"abc")
+            sizes.add(len(column.data))
+        assert len(sizes) <= 13
+        assert column.nbytes == 3000 and column[999] == "abc"
+        view = column.data_view
+        column.data[0:1] = b"x"
+        assert view[0:1] == b"x"
+        with pytest.raises(BufferError):
+            column.extend([b"y" * len(column.data)])
+        view.release()
+        column.extend([b"y" * 10])
+        assert column[-1] == "y" * 10
+    
+    def test_errors_propagate(self):
+        """Test that invalid values raise like the single-value functions."""
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_words_column([1, 1000000000])
+        with pytest.raises(TypeError):
+            compact_number_column([None])
+        with pytest.raises(IndexError):
+            Utf8Column()[0]
@@ -2,8 +2,12 @@
 Tests for the core functionality of nepali-num2word package.
 """
 
+import enum
+import subprocess
+import sys
+
 import pytest
-from nepali_num2word import convert_to_words, format_number, compact_number
+from nepali_num2word import convert_to_words, convert_to_words_batch, format_number, compact_number
 
 
 class TestConvertToWords:
@@ -146,6 +150,14 @@ class TestNegativeNumbers:
             result = convert_to_words(number)
             assert result == expected, f"convert_to_words({number}) should return '{expected}', got '{result}'"
     
+    def test_negative_integer_helper(self):
+        """Test that convert_integer_to_words keeps the sign instead of indexing WORDS backwards."""
+        from nepali_num2word.core import _integer_words, convert_integer_to_words
+        assert convert_integer_to_words(-5) == "-five"
+        assert convert_integer_to_words(-123456) == "-one lakh twenty-three thousand four hundred fifty-six"
+        assert convert_integer_to_words(-120000, lang='np') == "-एक लाख बीस हजार"
+        assert _integer_words(-5) == "-five"
+    
     def test_zero_cases(self):
         """Test various zero cases."""
         assert convert_to_words(0) == "zero"
@@ -279,6 +291,20 @@ class TestFormatNumber:
         for number, expected in test_cases:
             result = format_number(number)
             assert result == expected, f"format_number({number}) should return '{expected}', got '{result}'"
+    
+    def test_format_number_int_subclasses(self):
+        """Test that bool and IntEnum members format as their integer value."""
+        class Amount(enum.IntEnum):
+            SMALL = 5
+            LARGE = 120000
+            NEGATIVE = -7
+        
+        assert format_number(True) == "1"
+        assert format_number(False) == "0"
+        assert format_number(Amount.SMALL) == "5"
+        assert format_number(Amount.NEGATIVE) == "-7"
+        assert format_number(Amount.LARGE, lang='np') == "१,२०,०००"
+        assert format_number(Amount.SMALL, grouping='international') == "5"
 
 
 class TestErrorHandling:
@@ -341,6 +367,44 @@ class TestErrorHandling:
         assert convert_to_words("0.0") == "zero"
 
 
+class TestNumericTypes:
+    """Test support for numeric types beyond int, float and str."""
+    
+    def test_decimal_input(self):
+        """Test that Decimal values keep exact semantics."""
+        from decimal import Decimal
+        assert convert_to_words(Decimal("123")) == "one hundred twenty-three"
+        assert convert_to_words(Decimal("123.45")) == "one hundred twenty-three rupees and forty-five paise"
+        assert convert_to_words(Decimal("5.00")) == "five rupees"
+        assert convert_to_words(Decimal("-0.01")) == "-one paisa"
+        assert compact_number(Decimal("4200000")) == "42 lakhs"
+        with pytest.raises(ValueError):
+            convert_to_words(Decimal("NaN"))
+    
+    def test_fraction_input(self):
+        """Test that Fraction values are converted exactly."""
+        from fractions import Fraction
+        assert convert_to_words(Fraction(10, 2)) == "five"
+        assert convert_to_words(Fraction(5, 2)) == "two rupees and fifty paise"
+        assert compact_number(Fraction(3, 2) * 100000) == "1.5 lakhs"
+    
+    def test_numpy_scalars(self):
+        """Test that NumPy scalars behave like their Python counterparts."""
+        np = pytest.importorskip("numpy")
+        assert convert_to_words(np.int64(120000)) == "one lakh twenty thousand"
+        assert convert_to_words(np.int32(-5), lang='np') == "-पाँच"
+        assert convert_to_words(np.float64(123.45)) == convert_to_words(123.45)
+        assert convert_to_words(np.float32(0.5)) == "fifty paise"
+        assert compact_number(np.int64(42000000)) == "4.2 crores"
+        with pytest.raises(TypeError, match="Boolean values are not supported"):
+            convert_to_words(np.bool_(True))
+    
+    def test_unsupported_numeric_type(self):
+        """Test that complex numbers are still rejected."""
+        with pytest.raises(TypeError, match="Unsupported type: complex"):
+            convert_to_words(1 + 2j)
+
+
 class TestCompactNumber:
     """Test cases for compact_number function."""
     
@@ -513,3 +577,75 @@ class TestEdgeCases:
         
         assert "one hundred twenty-three" in int_result
         assert "one hundred twenty-three" in float_result
+
+
+class TestConvertToWordsBatch:
+    """Test cases for convert_to_words_batch."""
+    
+    INVALID = [
+        (None, 'none_input', TypeError),
+        (True, 'boolean_input', TypeError),
+        ([1], 'unsupported_type', TypeError),
+        ('', 'empty_string', ValueError),
+        ('   ', 'empty_string', ValueError),
+        ('abc', 'invalid_string', ValueError),
+        (1000000000, 'too_large', ValueError),
+        ('-1e10', 'too_large', ValueError),
+        ('9' * 5000, 'too_large', ValueError),
+        ('1e400', 'too_large', ValueError),
+        (float('nan'), 'invalid_number', ValueError),
+    ]
+    
+    def test_matches_single_calls(self):
+        """Test that valid values give the same words as convert_to_words."""
+        numbers = [0, 5, 120000, -123, 123.45, "1,20,000", "Rs. 500"]
+        for lang in ('en', 'np'):
+            expected = [convert_to_words(n, lang) for n in numbers]
+            assert convert_to_words_batch(numbers, lang) == expected
+            assert convert_to_words_batch(numbers, lang, errors='return') == (expected, [None] * len(numbers))
+    
+    def test_raise_mode(self):
+        """Test that the default mode raises like convert_to_words."""
+        with pytest.raises(ValueError, match="'abc' is not a valid number"):
+            convert_to_words_batch([1, 'abc'])
+    
+    def test_error_codes_match_exceptions(self):
+        """Test that each error carries the code and the exact exception message."""
+        for value, code, exception in self.INVALID:
+            results, errors = convert_to_words_batch([1, value, 2], errors='return')
+            assert results == ['one', None, 'two']
+            assert errors[0] is None and errors[2] is None
+            assert errors[1].code == code, value
+            with pytest.raises(exception) as info:
+                convert_to_words(value)
+            assert errors[1].message == str(info.value)
+    
+    def test_invalid_errors_argument(self):
+        """Test that an unknown errors mode is rejected."""
+        with pytest.raises(ValueError, match="errors must be 'raise' or 'return'"):
+            convert_to_words_batch([1], errors='ignore')
+
+
+class TestPackageImport:
+    """Test that importing the package stays cheap."""
+    
+    def test_submodules_load_on_first_use(self):
+        """Test that only the core engine is imported until another name is used."""
+        code = (
+            "import sys, nepali_num2word\n"
+            "loaded = sorted(m for m in sys.modules if m.startswith('nepali_num2word.'))\n"
+            "print(loaded, nepali_num2word.parser._NUMBER_PATTERN is None)\n"
+            "nepali_num2word.wrap_words\n"
+            "print('nepali_num2word.wrap' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.splitlines() == ["['nepali_num2word.core', 'nepali_num2word.parser'] True", "True"]
+    
+    def test_lazy_names_are_exported(self):
+        """Test that every name in __all__ resolves."""
+        import nepali_num2word
+        for name in nepali_num2word.__all__:
+            assert getattr(nepali_num2word, name) is not None
+        assert set(nepali_num2word.__all__) <= set(dir(nepali_num2word))
+        with pytest.raises(AttributeError):
+            nepali_num2word.not_a_function
@@ -0,0 +1,70 @@
+"""
+Tests for Bikram Sambat date to words conversion.
+"""
+
+import datetime
+from collections import namedtuple
+
+import pytest
+from nepali_num2word import convert_date_to_words, convert_date_to_words_batch
+from nepali_num2word import date as bs_date
+
+
+class TestConvertDateToWords:
+    """Test cases for convert_date_to_words."""
+    
+    def test_nepali_output(self):
+        """Test the Nepali form used on government documents."""
+        assert convert_date_to_words('2081-03-15', lang='np') == "दुई हजार एकासी साल असार पन्ध्र गते"
+        assert convert_date_to_words('2080-01-01', lang='np') == "दुई हजार असी साल बैशाख एक गते"
+        assert convert_date_to_words('2079-12-32', lang='np') == "दुई हजार उनासी साल चैत बत्तीस गते"
+    
+    def test_english_output(self):
+        """Test the English form."""
+        assert convert_date_to_words('2081-03-15') == "Asar fifteen, two thousand eighty-one"
+        assert convert_date_to_words('2000-10-02') == "Magh two, two thousand"
+    
+    def test_input_forms(self):
+        """Test strings, Devanagari digits, tuples and date-like objects."""
+        BSDate = namedtuple('BSDate', 'year month day')
+        expected = "दुई हजार एकासी साल असार पन्ध्र गते"
+        for value in ('2081-03-15', '2081/3/15', ' 2081.03.15 ', '२०८१-०३-१५',
+                      (2081, 3, 15), BSDate(2081, 3, 15)):
+            assert convert_date_to_words(value, lang='np') == expected
+    
+    def test_batch(self):
+        """Test batch conversion matches single calls."""
+        dates = ['2081-03-15', (2080, 1, 1), '२०७९-१२-३०']
+        for lang in ('en', 'np'):
+            assert convert_date_to_words_batch(dates, lang) == [
+                convert_date_to_words(d, lang) for d in dates
+            ]
+    
+    def test_components_are_cached(self):
+        """Test that year and day words are cached separately."""
+        bs_date._year_words.cache_clear()
+        convert_date_to_words_batch(['2081-01-01', '2081-02-02', '2081-03-01'], lang='np')
+        assert bs_date._year_words.cache_info().misses == 1
+        assert bs_date._year_words.cache_info().hits == 2
+    
+    def test_invalid_dates(self):
+        """Test malformed and out-of-range dates."""
+        with pytest.raises(ValueError, match="not a valid date"):
+            convert_date_to_words('2081-03')
+        with pytest.raises(ValueError, match="Month 13"):
+            convert_date_to_words('2081-13-01')
+        with pytest.raises(ValueError, match="Day 33"):
+            convert_date_to_words((2081, 1, 33))
+        with pytest.raises(ValueError, match="Day 0"):
+            convert_date_to_words('2081-01-00')
+        with pytest.raises(TypeError, match="Unsupported type: int"):
+            convert_date_to_words(20810315)
+        with pytest.raises(TypeError, match="must be integers"):
+            convert_date_to_words((2081.0, 3, 15))
+    
+    def test_gregorian_dates_rejected(self):
+        """Test that AD dates are not silently read as BS."""
+        with pytest.raises(TypeError, match="Gregorian"):
+            convert_date_to_words(datetime.date(2024, 3, 15))
+        with pytest.raises(TypeError, match="Gregorian"):
+            convert_date_to_words(datetime.datetime(2024, 3, 15, 10, 30))
@@ -0,0 +1,86 @@
+"""
+Tests for Nepali and international grouping and NumberFormatter.
+"""
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from nepali_num2word import NumberFormatter, format_number, format_number_batch
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(48)
+    ints = [0, 5, -5, 999, 1000, -1000, 100000, 999999999, 10**15]
+    ints += [rng.randint(-999999999, 999999999) for _ in range(1000)]
+    return ints + [123.45, -1234567.5, 0.5, 1000000.0, "1,20,000", "abc"]
+
+
+class TestInternationalGrouping:
+    """Test format_number(grouping='international')."""
+    
+    def test_examples(self):
+        """Test Western comma placement."""
+        assert format_number(1000000, grouping='international') == "1,000,000"
+        assert format_number(120000, grouping='international') == "120,000"
+        assert format_number(-1234567.5, grouping='international') == "-1,234,567.5"
+        assert format_number(999, grouping='international') == "999"
+        assert format_number("10,00,000", grouping='international') == "1,000,000"
+        assert format_number(1000000, lang='np', grouping='international') == "१,०००,०००"
+    
+    def test_same_digits_as_nepali(self, values):
+        """Test that both groupings only differ in comma placement."""
+        for value in values:
+            nepali = format_number(value)
+            international = format_number(value, grouping='international')
+            assert nepali.replace(',', '') == international.replace(',', '')
+    
+    def test_nepali_is_default(self, values):
+        """Test that grouping='nepali' is the existing behaviour."""
+        for value in values:
+            assert format_number(value, grouping='nepali') == format_number(value)
+    
+    def test_invalid_grouping(self):
+        """Test that unknown groupings are rejected."""
+        with pytest.raises(ValueError, match="grouping must be one of nepali, international"):
+            format_number(1000, grouping='indian')
+        with pytest.raises(ValueError, match="grouping must be one of"):
+            NumberFormatter(grouping='western')
+
+
+class TestNumberFormatter:
+    """Test the reusable formatter and batch formatting."""
+    
+    @pytest.mark.parametrize('lang', ['en', 'np'])
+    @pytest.mark.parametrize('grouping', ['nepali', 'international'])
+    def test_matches_format_number(self, values, lang, grouping):
+        """Test format, format_batch and format_number_batch against format_number."""
+        expected = [format_number(value, lang, grouping) for value in values]
+        formatter = NumberFormatter(lang, grouping)
+        assert [formatter.format(value) for value in values] == expected
+        assert formatter.format_batch(values) == expected
+        assert format_number_batch(values, lang, grouping) == expected
+    
+    def test_other_numeric_types(self):
+        """Test that Decimal and Fraction values are normalized before formatting."""
+        formatter = NumberFormatter()
+        assert formatter.format(Decimal('123456.78')) == "1,23,456.78"
+        assert formatter.format(Decimal('123456.780')) == "1,23,456.780"
+        assert formatter.format(Decimal('-1234567.5')) == "-12,34,567.5"
+        assert formatter.format(Decimal('-0.05')) == "-0.05"
+        assert formatter.format(Decimal('1E+6')) == "10,00,000"
+        assert formatter.format(Fraction(5, 2)) == "2.5"
+        assert formatter.format(Fraction(4, 2)) == "2"
+        assert NumberFormatter('np').format(Decimal('120000.50')) == "१,२०,०००.५०"
+        assert NumberFormatter(grouping='international').format(Decimal('1234567.89')) == "1,234,567.89"
+        assert formatter.format_batch([Decimal('1000.5'), 1000]) == ["1,000.5", "1,000"]
+        with pytest.raises(ValueError):
+            formatter.format(Decimal('NaN'))
+        with pytest.raises(TypeError):
+            formatter.format(None)
+    
+    def test_repr(self):
+        """Test the repr."""
+        assert repr(NumberFormatter('np')) == "NumberFormatter(lang='np', grouping='nepali')"
@@ -0,0 +1,60 @@
+"""
+Tests for the lazy multi-form result object.
+"""
+
+from decimal import Decimal
+
+import pytest
+from nepali_num2word import (
+    NumberForms, compact_number, convert_to_words, format_number, number_forms,
+)
+
+
+class TestNumberForms:
+    """Test cases for number_forms and NumberForms."""
+    
+    def test_forms_match_individual_functions(self):
+        """Test that each form equals the separate function call."""
+        for number in (0, 5, 999, 1500, 120000, 4200000, 34000000, -120000, 123.45, "1000000"):
+            for lang in ('en', 'np'):
+                forms = number_forms(number, lang)
+                assert forms.words == convert_to_words(number, lang)
+                assert forms.formatted == format_number(
+                    float(number) if isinstance(number, str) and '.' in number else
+                    int(number) if isinstance(number, str) else number, lang)
+                assert forms.compact == compact_number(number, lang=lang)
+    
+    def test_precision(self):
+        """Test that precision is used for the compact form."""
+        assert number_forms(1234567, precision=2).compact == compact_number(1234567, precision=2)
+    
+    def test_lazy_and_memoized(self):
+        """Test that forms are computed on first access only."""
+        forms = number_forms(120000)
+        assert forms._words is None and forms._formatted is None and forms._compact is None
+        words = forms.words
+        assert forms._words is words
+        assert forms.words is words
+        assert forms._compact is None
+    
+    def test_slots(self):
+        """Test that the result object has no instance dict."""
+        forms = number_forms(1)
+        assert isinstance(forms, NumberForms)
+        assert not hasattr(forms, '__dict__')
+        with pytest.raises(AttributeError):
+            forms.other = 1
+    
+    def test_decimal_value(self):
+        """Test a Decimal input across all forms."""
+        forms = number_forms(Decimal("120000.50"))
+        assert forms.words == "one lakh twenty thousand rupees and fifty paise"
+        assert forms.formatted == "1,20,000.5"
+        assert forms.compact == "1.2 lakhs"
+    
+    def test_validation_errors(self):
+        """Test that invalid input fails immediately."""
+        with pytest.raises(TypeError, match="Number cannot be None"):
+            number_forms(None)
+        with pytest.raises(ValueError, match="too large"):
+            number_forms(1000000000)
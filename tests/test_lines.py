@@ -0,0 +1,65 @@
+"""
+Tests for newline-delimited bytes input.
+"""
+
+import random
+
+import pytest
+from nepali_num2word import ConversionError, convert_lines, convert_to_words
+
+
+class TestConvertLines:
+    """Test parsing numbers straight from byte buffers."""
+    
+    def test_matches_convert_to_words(self):
+        """Test that every line converts like the same value as a str."""
+        rng = random.Random(47)
+        texts = [str(rng.randint(-999999999, 999999999)) for _ in range(2000)]
+        texts += [f"{rng.randint(0, 99999)}.{rng.randint(0, 99):02d}" for _ in range(500)]
+        data = '\n'.join(texts).encode('ascii')
+        for lang in ('en', 'np', 'rom'):
+            assert convert_lines(data, lang) == [convert_to_words(text, lang) for text in texts]
+    
+    @pytest.mark.parametrize('buffer_type', [bytes, bytearray, memoryview])
+    def test_buffer_types(self, buffer_type):
+        """Test bytes, bytearray and memoryview input."""
+        data = buffer_type(b"120000\n-25\n12.50\n")
+        assert convert_lines(data) == ["one lakh twenty thousand", "-twenty-five",
+                                       "twelve rupees and fifty paise"]
+    
+    def test_line_endings(self):
+        """Test CRLF, a missing final newline and an empty buffer."""
+        assert convert_lines(b"1\r\n2\r\n") == ["one", "two"]
+        assert convert_lines(b"1\n2") == ["one", "two"]
+        assert convert_lines(b"+5\n.5\n-0\n") == ["five", "fifty paise", "zero"]
+        assert convert_lines(b"") == []
+    
+    def test_errors_raise(self):
+        """Test that errors name the line."""
+        with pytest.raises(ValueError, match="Line 2: 'abc' is not a valid number"):
+            convert_lines(b"1\nabc\n")
+        with pytest.raises(ValueError, match="Line 1: Number 1000000000 is too large"):
+            convert_lines(b"1000000000\n")
+        with pytest.raises(ValueError, match="errors must be"):
+            convert_lines(b"1\n", errors='ignore')
+    
+    def test_errors_return(self):
+        """Test errors as values, with strict line syntax."""
+        results, errors = convert_lines(b"7\n\n1e5\n 7\n1_000\n1.\n1000000000\n", errors='return')
+        assert results == ["seven", None, None, None, None, None, None]
+        assert errors[0] is None
+        assert errors[1] == ConversionError('empty_string', "Line 2: empty line is not a valid number")
+        assert [error.code for error in errors[2:6]] == ['invalid_string'] * 4
+        assert errors[6].code == 'too_large'
+    
+    def test_long_lines(self):
+        """Test lines beyond int()'s 4300-digit limit and long runs of leading zeros."""
+        zeros = b"0" * 5000
+        assert convert_lines(b"-" + zeros + b"5\n" + zeros + b"\r\n-" + zeros + b"\n") == ["-five", "zero", "zero"]
+        results, errors = convert_lines(b"9" * 5000 + b"\n-" + b"9" * 5000 + b"\n" + b"9" * 400 + b".5\n",
+                                        errors='return')
+        assert results == [None, None, None]
+        assert [error.code for error in errors] == ['too_large'] * 3
+        assert errors[1].message.startswith("Line 2: Number -999")
+        with pytest.raises(ValueError, match="Line 1: Number 9+ is too large"):
+            convert_lines(b"9" * 5000)
@@ -0,0 +1,78 @@
+"""
+Allocation budget tests.
+
+Each conversion may allocate at most a fixed number of transient bytes per
+call (tracemalloc peak above the baseline) and must not keep anything
+allocated once its result is dropped. Budgets have headroom over the
+measured values (see benchmarks/bench_memory.py) so they only fail on real
+regressions, such as a new per-digit list or a cache that grows per call.
+"""
+
+import random
+import tracemalloc
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word.core import _convert_digits_to_nepali, _format_integer_part
+
+# Peak transient bytes per call
+BUDGETS = {
+    'convert_to_words_en': 1024,
+    'convert_to_words_np': 1200,
+    'convert_to_words_rupees': 1024,
+    'format_number': 512,
+    'format_integer_part': 512,
+    'convert_digits_to_nepali': 320,
+    'compact_number': 384,
+}
+
+# Bytes still allocated after 2,000 calls whose results were dropped
+LEAK_BUDGET = 4096
+
+_rng = random.Random(44)
+NUMBERS = [_rng.randint(0, 999999999) for _ in range(2000)]
+
+CALLS = {
+    'convert_to_words_en': (lambda n: convert_to_words(n), NUMBERS),
+    'convert_to_words_np': (lambda n: convert_to_words(n, 'np'), NUMBERS),
+    'convert_to_words_rupees': (lambda n: convert_to_words(n), [n / 100 for n in NUMBERS]),
+    'format_number': (lambda n: format_number(n, 'np'), NUMBERS),
+    'format_integer_part': (_format_integer_part, NUMBERS),
+    'convert_digits_to_nepali': (_convert_digits_to_nepali, [str(n) for n in NUMBERS]),
+    'compact_number': (lambda n: compact_number(n), NUMBERS),
+}
+
+
+@pytest.fixture
+def traced():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+@pytest.mark.parametrize('name', sorted(CALLS))
+class TestAllocationBudgets:
+    """Test allocations per call against the budgets."""
+    
+    def test_peak_per_call(self, name, traced):
+        """Test that no call allocates more than its budget."""
+        func, values = CALLS[name]
+        func(values[0])
+        worst = 0
+        for value in values:
+            # Restarting clears the traces and the peak; reset_peak() needs Python 3.9
+            tracemalloc.stop()
+            tracemalloc.start()
+            func(value)
+            worst = max(worst, tracemalloc.get_traced_memory()[1])
+        assert worst <= BUDGETS[name], f"{name} allocated {worst} bytes in one call"
+    
+    def test_nothing_retained(self, name, traced):
+        """Test that dropped results leave nothing allocated."""
+        func, values = CALLS[name]
+        func(values[0])
+        base = tracemalloc.get_traced_memory()[0]
+        for value in values:
+            func(value)
+        retained = tracemalloc.get_traced_memory()[0] - base
+        assert retained <= LEAK_BUDGET, f"{name} retained {retained} bytes over {len(values)} calls"
@@ -0,0 +1,161 @@
+"""
+Tests for call metrics and Prometheus export.
+"""
+
+import gc
+import threading
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number
+from nepali_num2word.metrics import LATENCY_BUCKETS, Metrics
+
+
+@pytest.fixture
+def metrics():
+    return Metrics(enabled=True)
+
+
+class TestMetrics:
+    """Test counting, histograms and export formats."""
+    
+    def test_instrumented_results_unchanged(self, metrics):
+        """Test that wrapped functions return the same results."""
+        words = metrics.instrument(convert_to_words)
+        assert words(120000) == "one lakh twenty thousand"
+        assert words(120000, 'np') == convert_to_words(120000, 'np')
+        assert words.__name__ == 'convert_to_words'
+    
+    def test_counts_per_function_and_language(self, metrics):
+        """Test that lang is read from positional and keyword arguments."""
+        words = metrics.instrument(convert_to_words)
+        compact = metrics.instrument(compact_number)
+        words(1)
+        words(2, 'np')
+        words(3, lang='np')
+        compact(1500000, 2, 'np')
+        compact(1500000)
+        snapshot = metrics.snapshot()
+        assert snapshot['convert_to_words']['en']['calls'] == 1
+        assert snapshot['convert_to_words']['np']['calls'] == 2
+        assert snapshot['compact_number']['np']['calls'] == 1
+        assert snapshot['compact_number']['en']['calls'] == 1
+    
+    def test_errors_by_type(self, metrics):
+        """Test that errors are counted by exception type and re-raised."""
+        words = metrics.instrument(convert_to_words)
+        with pytest.raises(ValueError):
+            words("abc")
+        with pytest.raises(TypeError):
+            words([1])
+        with pytest.raises(ValueError):
+            words(10**12)
+        entry = metrics.snapshot()['convert_to_words']['en']
+        assert entry['calls'] == 3
+        assert entry['errors'] == {'TypeError': 1, 'ValueError': 2}
+    
+    def test_histogram_is_cumulative(self, metrics):
+        """Test bucket counts and the latency sum."""
+        for elapsed in (500, 2000, 10**9):
+            metrics.record('convert_to_words', 'en', elapsed)
+        entry = metrics.snapshot()['convert_to_words']['en']
+        buckets = entry['latency_buckets']
+        assert list(buckets) == list(LATENCY_BUCKETS) + ['+Inf']
+        assert buckets[1e-06] == 1
+        assert buckets[2.5e-06] == 2
+        assert buckets[0.1] == 2
+        assert buckets['+Inf'] == 3
+        assert entry['latency_sum_seconds'] == pytest.approx(1.0000025)
+    
+    def test_disabled(self, metrics):
+        """Test that nothing is recorded while disabled."""
+        words = metrics.instrument(format_number)
+        metrics.enabled = False
+        assert words(1000000) == "10,00,000"
+        assert metrics.snapshot() == {}
+        metrics.enabled = True
+        words(1000000)
+        assert metrics.snapshot()['format_number']['en']['calls'] == 1
+    
+    def test_off_by_default(self):
+        """Test that recording is opt-in."""
+        metrics = Metrics()
+        words = metrics.instrument(convert_to_words)
+        assert words(5) == "five"
+        assert metrics.enabled is False
+        assert metrics.snapshot() == {}
+    
+    def test_threads_are_merged(self, metrics):
+        """Test that per-thread counters add up."""
+        words = metrics.instrument(convert_to_words)
+        
+        def worker():
+            for number in range(1000):
+                words(number)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        entry = metrics.snapshot()['convert_to_words']['en']
+        assert entry['calls'] == 8000
+        assert entry['latency_buckets']['+Inf'] == 8000
+        metrics.reset()
+        assert metrics.snapshot() == {}
+    
+    def test_ended_threads_are_folded_into_totals(self, metrics):
+        """Test that shards of ended threads are dropped without losing counts."""
+        words = metrics.instrument(convert_to_words)
+        for _ in range(50):
+            thread = threading.Thread(target=lambda: [words(number) for number in range(10)])
+            thread.start()
+            thread.join()
+        gc.collect()
+        assert len(metrics._shards) == 0
+        assert metrics.snapshot()['convert_to_words']['en']['calls'] == 500
+        words(1)
+        assert len(metrics._shards) == 1
+        assert metrics.snapshot()['convert_to_words']['en']['calls'] == 501
+    
+    def test_snapshot_while_recording(self, metrics):
+        """Test snapshots taken while other threads record new keys."""
+        words = metrics.instrument(convert_to_words)
+        stop = threading.Event()
+        
+        def worker(offset):
+            lang = 0
+            while not stop.is_set():
+                lang += 1
+                words(offset, lang=f"x{offset}-{lang % 50}")
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(20):
+                metrics.snapshot()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        snapshot = metrics.snapshot()['convert_to_words']
+        assert sum(values['calls'] for values in snapshot.values()) > 0
+    
+    def test_prometheus_format(self, metrics):
+        """Test the text exposition output."""
+        words = metrics.instrument(convert_to_words)
+        words(5, 'np')
+        with pytest.raises(ValueError):
+            words("x", 'np')
+        metrics.record('custom', 'a"b', 100)
+        text = metrics.to_prometheus()
+        lines = text.splitlines()
+        assert text.endswith('\n')
+        assert '# TYPE nepali_num2word_calls_total counter' in lines
+        assert '# TYPE nepali_num2word_latency_seconds histogram' in lines
+        assert 'nepali_num2word_calls_total{function="convert_to_words",lang="np"} 2' in lines
+        assert ('nepali_num2word_errors_total{function="convert_to_words",lang="np",'
+                'exception="ValueError"} 1') in lines
+        assert 'nepali_num2word_latency_seconds_bucket{function="convert_to_words",lang="np",le="+Inf"} 2' in lines
+        assert 'nepali_num2word_latency_seconds_count{function="convert_to_words",lang="np"} 2' in lines
+        assert 'nepali_num2word_calls_total{function="custom",lang="a\\"b"} 1' in lines
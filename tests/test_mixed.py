@@ -0,0 +1,80 @@
+"""
+Tests for mixed-script output (digits with scale words).
+"""
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from nepali_num2word import convert_to_mixed, convert_to_mixed_batch
+
+
+class TestConvertToMixed:
+    """Test digits-plus-scale-word output."""
+    
+    def test_nepali(self):
+        """Test Nepali scale words with Devanagari digits by default."""
+        assert convert_to_mixed(120000, lang='np') == "१ लाख २० हजार"
+        assert convert_to_mixed(34567890, lang='np') == "३ करोड ४५ लाख ६७ हजार ८९०"
+        assert convert_to_mixed(999, lang='np') == "९९९"
+        assert convert_to_mixed(0, lang='np') == "०"
+    
+    def test_english_and_romanized(self):
+        """Test English and romanized scale words with ASCII digits."""
+        assert convert_to_mixed(120000) == "1 lakh 20 thousand"
+        assert convert_to_mixed(100500) == "1 lakh 500"
+        assert convert_to_mixed(10000001) == "1 crore 1"
+        assert convert_to_mixed(120000, lang='rom') == "1 lakh 20 hajar"
+        assert convert_to_mixed(999999999) == "99 crore 99 lakh 99 thousand 999"
+    
+    def test_digits_option(self):
+        """Test choosing the numeral system independently of the language."""
+        assert convert_to_mixed(120000, lang='np', digits='ascii') == "1 लाख 20 हजार"
+        assert convert_to_mixed(120000, digits='devanagari') == "१ lakh २० thousand"
+        with pytest.raises(ValueError, match="digits must be one of"):
+            convert_to_mixed(1, digits='roman')
+    
+    def test_rupees_and_signs(self):
+        """Test decimal amounts, negative numbers and string input."""
+        assert convert_to_mixed(1234.5) == "1 thousand 234 rupees and 50 paise"
+        assert convert_to_mixed(1.01, lang='np') == "१ रुपैयाँ र १ पैसा"
+        assert convert_to_mixed(0.5) == "50 paise"
+        assert convert_to_mixed(-120000) == "-1 lakh 20 thousand"
+        assert convert_to_mixed("1,20,000", lang='np') == "१ लाख २० हजार"
+    
+    def test_currency_split_matches_engine(self):
+        """Test that rupees and paise are split exactly as convert_to_words splits them."""
+        assert convert_to_mixed(Decimal('12.345')) == "12 rupees and 34 paise"
+        assert convert_to_mixed(Fraction(7, 3)) == "2 rupees and 33 paise"
+        assert convert_to_mixed(0.001) == "0"
+        assert convert_to_mixed(0.995) == "100 paise"
+    
+    def test_groups_match_engine(self):
+        """Test that reading the groups back gives the original number."""
+        scales = {'crore': 10000000, 'lakh': 100000, 'thousand': 1000}
+        rng = random.Random(45)
+        for number in [rng.randint(0, 999999999) for _ in range(2000)]:
+            tokens = convert_to_mixed(number).split()
+            total = 0
+            for index, token in enumerate(tokens):
+                if token in scales:
+                    total += int(tokens[index - 1]) * scales[token]
+            if tokens[-1] not in scales:
+                total += int(tokens[-1])
+            assert total == number
+    
+    def test_errors(self):
+        """Test invalid input raises like convert_to_words."""
+        with pytest.raises(ValueError):
+            convert_to_mixed("abc")
+        with pytest.raises(TypeError):
+            convert_to_mixed(None)
+        with pytest.raises(ValueError):
+            convert_to_mixed(10**12)
+    
+    def test_batch(self):
+        """Test the batch variant."""
+        numbers = [1000, 150000, 1.5, "20,00,000"]
+        assert convert_to_mixed_batch(numbers, lang='np') == [convert_to_mixed(n, lang='np') for n in numbers]
+        assert convert_to_mixed_batch([], lang='np') == []
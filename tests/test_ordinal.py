@@ -0,0 +1,135 @@
+"""
+Tests for ordinal word conversion.
+"""
+
+import pytest
+from nepali_num2word import convert_to_words, convert_to_ordinal, convert_to_ordinal_batch
+
+
+def english_reference(number):
+    """Derive the English ordinal from the cardinal words, independently of the tables."""
+    irregular = {'one': 'first', 'two': 'second', 'three': 'third', 'five': 'fifth',
+                 'eight': 'eighth', 'nine': 'ninth', 'twelve': 'twelfth'}
+    words = convert_to_words(number)
+    head, sep, last = words.rpartition(' ')
+    prefix, hyphen, unit = last.rpartition('-')
+    if unit in irregular:
+        unit = irregular[unit]
+    elif unit.endswith('y'):
+        unit = unit[:-1] + 'ieth'
+    else:
+        unit += 'th'
+    return head + sep + prefix + hyphen + unit
+
+
+def nepali_reference(number):
+    """Derive the Nepali ordinal from the cardinal words, independently of the tables."""
+    standalone = {1: 'पहिलो', 2: 'दोस्रो', 3: 'तेस्रो', 4: 'चौथो'}
+    if number in standalone:
+        return standalone[number]
+    words = convert_to_words(number, lang='np')
+    head, sep, last = words.rpartition(' ')
+    if last == 'छ':
+        last = 'छैटौँ'
+    elif last == 'नौ':
+        last = 'नवौँ'
+    elif last[-1] in 'कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह':
+        last += 'ौँ'
+    else:
+        last += 'औँ'
+    return head + sep + last
+
+
+class TestOrdinalEnglish:
+    """Test cases for English ordinals."""
+    
+    def test_basic_ordinals(self):
+        """Test well-known ordinal forms."""
+        test_cases = [
+            (0, "zeroth"),
+            (1, "first"),
+            (2, "second"),
+            (3, "third"),
+            (5, "fifth"),
+            (12, "twelfth"),
+            (20, "twentieth"),
+            (21, "twenty-first"),
+            (99, "ninety-ninth"),
+            (100, "one hundredth"),
+            (101, "one hundred first"),
+            (1000, "one thousandth"),
+            (100000, "one lakhth"),
+            (10000000, "one croreth"),
+            (120003, "one lakh twenty thousand third"),
+        ]
+        for number, expected in test_cases:
+            assert convert_to_ordinal(number) == expected
+    
+    def test_exhaustive_1_to_10000(self):
+        """Test every value from 1 to 10,000 against the reference rules."""
+        for number in range(1, 10001):
+            assert convert_to_ordinal(number) == english_reference(number), number
+
+
+class TestOrdinalNepali:
+    """Test cases for Nepali ordinals."""
+    
+    def test_basic_ordinals(self):
+        """Test well-known Nepali ordinal forms."""
+        test_cases = [
+            (1, "पहिलो"),
+            (2, "दोस्रो"),
+            (3, "तेस्रो"),
+            (4, "चौथो"),
+            (5, "पाँचौँ"),
+            (6, "छैटौँ"),
+            (9, "नवौँ"),
+            (10, "दशौँ"),
+            (21, "एक्काइसौँ"),
+            (60, "साठीऔँ"),
+            (100, "एक सयौँ"),
+            (101, "एक सय एकौँ"),
+            (1000, "एक हजारौँ"),
+            (100000, "एक लाखौँ"),
+            (10000000, "एक करोडौँ"),
+        ]
+        for number, expected in test_cases:
+            assert convert_to_ordinal(number, lang='np') == expected
+    
+    def test_exhaustive_1_to_10000(self):
+        """Test every value from 1 to 10,000 against the reference rules."""
+        for number in range(1, 10001):
+            assert convert_to_ordinal(number, lang='np') == nepali_reference(number), number
+    
+    def test_ordinals_are_unique(self):
+        """Test that no two values share an ordinal."""
+        for lang in ('en', 'np'):
+            results = convert_to_ordinal_batch(range(1, 10001), lang=lang)
+            assert len(set(results)) == 10000
+
+
+class TestOrdinalBatchAndErrors:
+    """Test cases for batch conversion and invalid input."""
+    
+    def test_batch_matches_single(self):
+        """Test that batch conversion matches single calls."""
+        numbers = [1, 22, 333, 4444, 55555, 666666, 7777777, 88888888, "999"]
+        for lang in ('en', 'np'):
+            assert convert_to_ordinal_batch(numbers, lang) == [
+                convert_to_ordinal(n, lang) for n in numbers
+            ]
+    
+    def test_invalid_input(self):
+        """Test that invalid values raise the usual exceptions."""
+        with pytest.raises(TypeError, match="Number cannot be None"):
+            convert_to_ordinal(None)
+        with pytest.raises(TypeError, match="Boolean values are not supported"):
+            convert_to_ordinal(True)
+        with pytest.raises(TypeError, match="Ordinals require an integer"):
+            convert_to_ordinal(1.5)
+        with pytest.raises(ValueError, match="negative"):
+            convert_to_ordinal(-1)
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_ordinal(1000000000)
+        with pytest.raises(ValueError, match="'abc' is not a valid integer"):
+            convert_to_ordinal("abc")
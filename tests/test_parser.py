@@ -0,0 +1,106 @@
+"""
+Tests for the shared numeric string parser.
+"""
+
+import pytest
+from nepali_num2word import compact_number, convert_to_words, format_number, parse_number
+
+
+class TestParseNumber:
+    """Test cases for parse_number."""
+    
+    def test_plain_numbers(self):
+        """Test the forms accepted before the parser existed."""
+        test_cases = [
+            ("123", 123),
+            ("-456", -456),
+            ("+7", 7),
+            ("123.45", 123.45),
+            ("0.0", 0.0),
+            ("१२३", 123),
+        ]
+        for text, expected in test_cases:
+            result = parse_number(text)
+            assert result == expected and type(result) is type(expected), text
+    
+    def test_grouping_commas(self):
+        """Test Nepali and Western grouping."""
+        assert parse_number("1,20,000") == 120000
+        assert parse_number("12,34,56,789") == 123456789
+        assert parse_number("1,200,000") == 1200000
+        assert parse_number("1,000.50") == 1000.5
+        assert parse_number("१,२०,०००") == 120000
+    
+    def test_whitespace_currency_and_exponent(self):
+        """Test surrounding whitespace, currency markers and exponents."""
+        assert parse_number("  1e5 ") == 100000
+        assert type(parse_number("1e5")) is int
+        assert parse_number("1.5e3") == 1500.0
+        assert parse_number("2E-2") == 0.02
+        assert parse_number("Rs. 500") == 500
+        assert parse_number("rs500") == 500
+        assert parse_number("NPR 1,000.50") == 1000.5
+        assert parse_number("रु. ५००/-") == 500
+        assert parse_number("-Rs. 5") == -5
+        assert parse_number("Rs -5") == -5
+    
+    def test_exponents_stay_exact(self):
+        """Test integer mantissas without float rounding, and values beyond the float range."""
+        assert parse_number("1e30") == 10 ** 30
+        assert parse_number("-12e25") == -12 * 10 ** 25
+        assert parse_number("0e99999") == 0
+        assert parse_number("१e३") == 1000
+        for text in ("1e400", "-1e400", "1.5e400", "1e99999"):
+            with pytest.raises(ValueError, match="is too large"):
+                parse_number(text)
+    
+    def test_long_digit_strings(self):
+        """Test strings beyond int()'s 4300-digit limit and the float range."""
+        assert parse_number("0" * 5000 + "7") == 7
+        for text in ("9" * 5000, "9" * 400 + ".5", "-" + "1" * 310):
+            with pytest.raises(ValueError, match="is too large"):
+                parse_number(text)
+    
+    def test_underscores_and_unicode_digits(self):
+        """Test the forms int() and float() accepted before the regular expression."""
+        assert parse_number("1_000") == 1000
+        assert parse_number("1_000.2_5") == 1000.25
+        assert parse_number("١٢٣") == 123
+        assert parse_number("١٢٣.٤٥") == 123.45
+        assert parse_number("১e২") == 100
+        assert convert_to_words("1_000") == "one thousand"
+        assert format_number("١٢٣٤٥") == "12,345"
+        for text in ("1__0", "_1", "1_", "1._5", "1,00_0"):
+            with pytest.raises(ValueError, match="is not a valid number"):
+                parse_number(text)
+    
+    def test_too_large_message(self):
+        """Test that too-large strings get the same message as too-large numbers."""
+        with pytest.raises(ValueError, match=r"^Number 1e400 is too large\. Maximum supported: 999,999,999$"):
+            parse_number(" 1e400 ")
+    
+    def test_invalid_strings(self):
+        """Test strings that must be rejected."""
+        for text in ("abc", "12a", "1.2.3", "--1", "1 000", "12,34", "1,2345", ".", "Rs.", "- -1"):
+            with pytest.raises(ValueError, match="is not a valid number"):
+                parse_number(text)
+        for text in ("", "   "):
+            with pytest.raises(ValueError, match="Empty string is not a valid number"):
+                parse_number(text)
+
+
+class TestParserInCoreFunctions:
+    """The core functions accept every form the parser accepts."""
+    
+    def test_core_functions(self):
+        """Test words, formatting and compact form from grouped strings."""
+        assert convert_to_words("1,20,000") == "one lakh twenty thousand"
+        assert convert_to_words("Rs. 123.45") == "one hundred twenty-three rupees and forty-five paise"
+        assert convert_to_words("१,२०,०००", lang='np') == "एक लाख बीस हजार"
+        assert format_number("1,200,000") == "12,00,000"
+        assert compact_number("  4.2e7 ") == "4.2 crores"
+    
+    def test_format_number_exponents(self):
+        """Test exponents beyond the float range are returned as given, and large ones exactly."""
+        assert format_number("1e400") == "1e400"
+        assert format_number("1e30") == "10,00,00,00,00,00,00,00,00,00,00,00,00,00,000"
@@ -0,0 +1,97 @@
+"""
+Tests for decimal-point words.
+"""
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from nepali_num2word import convert_to_point_words, convert_to_point_words_batch, convert_to_words
+
+
+class TestConvertToPointWords:
+    """Test exact "point" decimals."""
+    
+    def test_examples(self):
+        """Test the basic English, Nepali and romanized forms."""
+        assert convert_to_point_words('12.345') == "twelve point three four five"
+        assert convert_to_point_words('12.345', 'np') == "बाह्र दशमलव तीन चार पाँच"
+        assert convert_to_point_words('12.345', 'rom') == "bahra dashamlav tin char panch"
+        assert convert_to_point_words('120000.5') == "one lakh twenty thousand point five"
+    
+    def test_exact_digits(self):
+        """Test that every written digit is kept, with no float rounding."""
+        assert convert_to_point_words('2.50') == "two point five zero"
+        assert convert_to_point_words('0.1000000000000000055511') == (
+            "zero point one" + " zero" * 16 + " five five five one one")
+        assert convert_to_point_words(Decimal('3.14159265358979323846')).endswith(
+            "nine seven nine three two three eight four six")
+        assert convert_to_point_words(Decimal('-1E-3')) == "-zero point zero zero one"
+        assert convert_to_point_words('1.5e-3') == "zero point zero zero one five"
+        assert convert_to_point_words('1.25e2') == "one hundred twenty-five"
+        assert convert_to_point_words('1e-3') == "zero point zero zero one"
+        assert convert_to_point_words('5e-1') == "zero point five"
+        assert convert_to_point_words('1e0') == "one"
+    
+    def test_integer_part_limit(self):
+        """Test that only the integer part is limited, whatever the input type."""
+        top = "nine hundred ninety-nine"
+        assert convert_to_point_words('999999999.999999').endswith("point" + " nine" * 6)
+        assert convert_to_point_words(999999999.99).endswith(top + " point nine nine")
+        assert convert_to_point_words(Decimal('999999999.99')).endswith(top + " point nine nine")
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_point_words(Decimal('1e5000'))
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_point_words('9' * 5000)
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_point_words('1e1000')
+    
+    def test_string_forms(self):
+        """Test grouping commas, Devanagari digits and currency prefixes."""
+        assert convert_to_point_words('1,20,000.05') == "one lakh twenty thousand point zero five"
+        assert convert_to_point_words('१२.३४', 'np') == "बाह्र दशमलव तीन चार"
+        assert convert_to_point_words('١٢.٣٤') == "twelve point three four"
+        assert convert_to_point_words('1_000.2_5') == "one thousand point two five"
+        assert convert_to_point_words(' -.5 ') == "-zero point five"
+        assert convert_to_point_words('12.') == "twelve"
+    
+    def test_numbers(self):
+        """Test int, float (shortest repr) and Fraction input."""
+        assert convert_to_point_words(7) == "seven"
+        assert convert_to_point_words(-7) == "-seven"
+        assert convert_to_point_words(0.1) == "zero point one"
+        assert convert_to_point_words(1e-05) == "zero point zero zero zero zero one"
+        assert convert_to_point_words(Fraction(1, 4)) == "zero point two five"
+    
+    def test_integer_part_matches_engine(self):
+        """Test the integer part against convert_to_words."""
+        rng = random.Random(50)
+        for _ in range(500):
+            integer = rng.randint(0, 999999999)
+            for lang in ('en', 'np'):
+                words = convert_to_point_words(f"{integer}.{rng.randint(0, 999)}", lang)
+                assert words.startswith(convert_to_words(integer, lang) + ' ')
+    
+    def test_errors(self):
+        """Test the same errors as convert_to_words."""
+        with pytest.raises(ValueError, match="'abc' is not a valid number"):
+            convert_to_point_words('abc')
+        with pytest.raises(ValueError, match="Empty string"):
+            convert_to_point_words('  ')
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_point_words('1000000000.5')
+        with pytest.raises(ValueError, match="too large"):
+            convert_to_point_words(Decimal('1e12'))
+        with pytest.raises(ValueError):
+            convert_to_point_words(Decimal('NaN'))
+        with pytest.raises(TypeError):
+            convert_to_point_words(None)
+        with pytest.raises(TypeError):
+            convert_to_point_words(True)
+    
+    def test_batch(self):
+        """Test the batch variant."""
+        values = ['3.14', '2.50', Decimal('0.001'), 5, 0.25]
+        for lang in ('en', 'np', 'rom'):
+            assert convert_to_point_words_batch(values, lang) == [convert_to_point_words(v, lang) for v in values]
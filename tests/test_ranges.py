@@ -0,0 +1,38 @@
+"""
+Tests for incremental range enumeration.
+"""
+
+import pytest
+from nepali_num2word import iter_range_words
+from nepali_num2word.core import convert_integer_to_words
+
+
+class TestIterRangeWords:
+    """Results must equal convert_integer_to_words for every value."""
+    
+    @pytest.mark.parametrize("lang", ['en', 'np', 'rom'])
+    def test_consecutive_ranges(self, lang):
+        """Test ranges crossing hundred, thousand, lakh and crore boundaries."""
+        for start, stop in ((0, 2500), (99900, 100200), (9999900, 10000200), (999999000, 1000000000)):
+            expected = [convert_integer_to_words(n, lang) for n in range(start, stop)]
+            assert list(iter_range_words(start, stop, lang=lang)) == expected
+    
+    def test_steps(self):
+        """Test large and negative steps."""
+        for numbers in (range(0, 999999999, 9876543), range(120500, 119400, -7), range(5, 1000000, 1001)):
+            expected = [convert_integer_to_words(n, 'np') for n in numbers]
+            assert list(iter_range_words(numbers.start, numbers.stop, numbers.step, 'np')) == expected
+    
+    def test_single_argument_and_empty(self):
+        """Test range-style arguments."""
+        assert list(iter_range_words(3)) == ['zero', 'one', 'two']
+        assert list(iter_range_words(5, 5)) == []
+    
+    def test_invalid_ranges(self):
+        """Test values outside the supported range."""
+        with pytest.raises(ValueError, match="between 0 and 999,999,999"):
+            iter_range_words(-1, 5)
+        with pytest.raises(ValueError, match="between 0 and 999,999,999"):
+            iter_range_words(999999990, 1000000001)
+        with pytest.raises(ValueError):
+            iter_range_words(0, 10, 0)
@@ -0,0 +1,55 @@
+"""
+Tests for romanized Nepali output (lang='rom').
+"""
+
+from nepali_num2word import convert_to_words, convert_to_words_batch
+from nepali_num2word.core import ONES_NP, ONES_ROM, SCALE_NP, SCALE_ROM
+
+
+class TestRomanizedWords:
+    """Test cases for convert_to_words with lang='rom'."""
+    
+    def test_tables_match_nepali(self):
+        """Test that the romanized tables line up with the Nepali ones."""
+        assert len(ONES_ROM) == len(ONES_NP) == 100
+        assert len(set(ONES_ROM)) == 100
+        assert SCALE_ROM.keys() == SCALE_NP.keys()
+    
+    def test_integers(self):
+        """Test integer conversion."""
+        test_cases = [
+            (0, "shunya"),
+            (5, "panch"),
+            (25, "pachchis"),
+            (100, "ek saya"),
+            (120000, "ek lakh bis hajar"),
+            (34000000, "tin karod chalis lakh"),
+            (999999999, "unansaya karod unansaya lakh unansaya hajar nau saya unansaya"),
+        ]
+        for number, expected in test_cases:
+            assert convert_to_words(number, lang='rom') == expected
+    
+    def test_currency_and_negatives(self):
+        """Test rupees, paisa and negative numbers."""
+        assert convert_to_words(123.45, lang='rom') == "ek saya teis rupaiyan ra paintalis paisa"
+        assert convert_to_words(1.01, lang='rom') == "ek rupaiyan ra ek paisa"
+        assert convert_to_words(0.5, lang='rom') == "pachas paisa"
+        assert convert_to_words(0.0, lang='rom') == "shunya"
+        assert convert_to_words(-120, lang='rom') == "-ek saya bis"
+    
+    def test_gsm7_safe(self):
+        """Test that every output is plain ASCII."""
+        results = convert_to_words_batch(range(0, 1000000, 997), lang='rom')
+        assert all(words.isascii() for words in results)
+    
+    def test_batch(self):
+        """Test batch conversion, including errors as values."""
+        assert convert_to_words_batch([1, 2], lang='rom') == ["ek", "dui"]
+        results, errors = convert_to_words_batch([1, "x"], lang='rom', errors='return')
+        assert results == ["ek", None]
+        assert errors[1].code == 'invalid_string'
+    
+    def test_unknown_language_falls_back_to_english(self):
+        """Test that unknown language codes still give English words."""
+        assert convert_to_words(120000, lang='xx') == "one lakh twenty thousand"
+        assert convert_to_words(1.5, lang='xx') == "one rupee and fifty paise"
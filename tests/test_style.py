@@ -0,0 +1,71 @@
+"""
+Tests for precompiled output styles.
+"""
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from nepali_num2word import CHEQUE, WordStyle, convert_to_words
+
+
+@pytest.fixture
+def numbers():
+    rng = random.Random(11)
+    values = [0, 1, 21, 100, 101, 1005, 120000, 120001, 999999999, -25, 123.45, 1.01, 0.5, "1,20,000",
+              0.001, 0.995, Decimal('12.345'), Fraction(7, 3)]
+    return values + [rng.randint(0, 999999999) for _ in range(1000)]
+
+
+class TestWordStyle:
+    """Styled output must equal post-processing the default output."""
+    
+    def test_default_style_matches_engine(self, numbers):
+        """Test that the default style changes nothing."""
+        style = WordStyle()
+        for lang in ('en', 'np', 'rom'):
+            assert style.convert_batch(numbers, lang) == [convert_to_words(n, lang) for n in numbers]
+    
+    def test_casing_matches_str_methods(self, numbers):
+        """Test upper and title case against str.upper() and str.title()."""
+        upper = WordStyle(case='upper')
+        title = WordStyle(case='title')
+        for lang in ('en', 'np', 'rom'):
+            for number in numbers:
+                words = convert_to_words(number, lang)
+                assert upper.convert(number, lang) == words.upper()
+                assert title.convert(number, lang) == words.title()
+    
+    def test_hyphen(self, numbers):
+        """Test removing hyphens from 21-99."""
+        style = WordStyle(hyphen=False)
+        for number in numbers:
+            words = convert_to_words(number)
+            sign, body = ('-', words[1:]) if words.startswith('-') else ('', words)
+            assert style.convert(number) == sign + body.replace('-', ' ')
+        assert style.convert(125) == "one hundred twenty five"
+        assert style.convert(-25) == "-twenty five"
+    
+    def test_and_insertion(self):
+        """Test British "and" before the final group."""
+        style = WordStyle(use_and=True)
+        assert style.convert(101) == "one hundred and one"
+        assert style.convert(1005) == "one thousand and five"
+        assert style.convert(120025) == "one lakh twenty thousand and twenty-five"
+        assert style.convert(120000) == "one lakh twenty thousand"
+        assert style.convert(25) == "twenty-five"
+        assert style.convert(101, 'np') == convert_to_words(101, 'np')
+    
+    def test_cheque(self):
+        """Test the "Rupees ... Only" cheque style."""
+        assert CHEQUE.convert(120000) == "Rupees One Lakh Twenty Thousand Only"
+        assert CHEQUE.convert(1234.5) == "Rupees One Thousand Two Hundred Thirty-Four And Fifty Paise Only"
+        assert convert_to_words(5, style=CHEQUE) == "Rupees Five Only"
+    
+    def test_errors(self):
+        """Test invalid options and values."""
+        with pytest.raises(ValueError, match="case must be one of"):
+            WordStyle(case='shout')
+        with pytest.raises(ValueError, match="'abc' is not a valid number"):
+            CHEQUE.convert("abc")
@@ -0,0 +1,108 @@
+"""
+Tests for the precomputed on-disk word table.
+"""
+
+import pytest
+from nepali_num2word import convert_to_words, core
+from nepali_num2word.table import (
+    TABLE_SIZE, WordTable, install_word_table, uninstall_word_table, write_word_table,
+)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    """Build one word table file for the whole module."""
+    path = tmp_path_factory.mktemp("table") / "words.bin"
+    write_word_table(str(path))
+    return path
+
+
+@pytest.fixture
+def installed(table_path):
+    """Install the word table for a single test."""
+    table = install_word_table(str(table_path))
+    yield table
+    uninstall_word_table()
+
+
+class TestWordTable:
+    """Test cases for WordTable."""
+    
+    def test_lazy_open(self, table_path):
+        """Test that the file is not mapped until the first lookup."""
+        table = WordTable(str(table_path))
+        assert table._mm is None
+        assert table.lookup(120, 'en') == "one hundred twenty"
+        assert table._mm is not None
+        table.close()
+    
+    def test_all_entries_match_engine(self, table_path):
+        """Test every stored entry against the conversion engine."""
+        table = WordTable(str(table_path))
+        assert table.languages == ('en', 'np', 'rom')
+        assert table.check() == []
+        table.close()
+    
+    def test_lookup_out_of_range(self, table_path):
+        """Test that lookups outside 0-99,999 raise instead of reading other entries."""
+        table = WordTable(str(table_path))
+        for number in (-5, -1, TABLE_SIZE):
+            with pytest.raises(ValueError, match="covers 0 to 99,999"):
+                table.lookup(number)
+        table.close()
+    
+    def test_corrupt_file_rejected(self, table_path, tmp_path):
+        """Test that a flipped byte fails the integrity check."""
+        data = bytearray(table_path.read_bytes())
+        data[-10] ^= 0xFF
+        corrupt = tmp_path / "corrupt.bin"
+        corrupt.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="integrity check"):
+            WordTable(str(corrupt)).lookup(1)
+    
+    def test_not_a_table_rejected(self, tmp_path):
+        """Test that arbitrary files are rejected."""
+        bogus = tmp_path / "bogus.bin"
+        bogus.write_bytes(b"x" * 100)
+        with pytest.raises(ValueError, match="bad magic"):
+            WordTable(str(bogus)).lookup(1)
+    
+    def test_stale_table_rejected(self, table_path, monkeypatch):
+        """Test that a table built from other word tables is rejected."""
+        monkeypatch.setattr(core, "_tables_fingerprint", lambda: "00" * 32)
+        with pytest.raises(ValueError, match="different word tables"):
+            WordTable(str(table_path)).lookup(1)
+
+
+class TestInstalledTable:
+    """Conversions must be unchanged when the table is installed."""
+    
+    def test_results_match_engine(self, installed):
+        """Test numbers below and above the table range."""
+        numbers = [0, 1, 99, 100, 999, 99999, 100000, 100001, 120000,
+                   10000000, 12345678, 999999999, -120000, 123.45]
+        for lang in ('en', 'np', 'rom'):
+            for number in numbers:
+                with_table = convert_to_words(number, lang)
+                core._word_table = None
+                without_table = convert_to_words(number, lang)
+                core._word_table = installed
+                assert with_table == without_table
+    
+    def test_crore_count_beyond_99(self, installed):
+        """Test the digit fallback of convert_integer_to_words from 100 crore, with and without the table."""
+        for table in (installed, None):
+            core._word_table = table
+            assert core.convert_integer_to_words(1000000000) == "100 crore"
+            assert core.convert_integer_to_words(12345678901, 'np') == "1234 करोड छपन्न लाख अठहत्तर हजार नौ सय एक"
+        core._word_table = installed
+    
+    def test_negative_integers(self, installed):
+        """Test that negative integers never index the table with a negative offset."""
+        assert core.convert_integer_to_words(-5) == "-five"
+        assert core.convert_integer_to_words(-123456) == "-one lakh twenty-three thousand four hundred fifty-six"
+        assert core._integer_words_from_table(installed, -5, 'en') == "-five"
+    
+    def test_table_size(self):
+        """Test the documented table range."""
+        assert TABLE_SIZE == 100000
@@ -0,0 +1,46 @@
+"""
+Tests for immutability of lookup tables and thread safety.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from nepali_num2word import convert_to_words, format_number, compact_number
+from nepali_num2word import core
+
+
+class TestImmutableTables:
+    """Lookup tables must not be modifiable by callers."""
+    
+    def test_sequence_tables_are_tuples(self):
+        """Test that word lists are immutable tuples."""
+        for table in (core.ONES, core.TENS, core.ONES_NP):
+            assert isinstance(table, tuple)
+            with pytest.raises(TypeError):
+                table[1] = 'changed'
+    
+    def test_scale_table_is_read_only(self):
+        """Test that the Nepali scale mapping cannot be changed."""
+        with pytest.raises(TypeError):
+            core.SCALE_NP['lakh'] = 'changed'
+        assert core.SCALE_NP['lakh'] == 'लाख'
+
+
+class TestThreadSafety:
+    """Concurrent calls must return the same results as serial calls."""
+    
+    def test_concurrent_results_match_serial(self):
+        """Test all public functions from many threads at once."""
+        numbers = list(range(0, 999999999, 7654321)) + [-120000, 123.45, "4200000"]
+        
+        def run_all(lang):
+            return [
+                (convert_to_words(n, lang), format_number(n, lang), compact_number(n, lang=lang))
+                for n in numbers
+            ]
+        
+        expected = {lang: run_all(lang) for lang in ('en', 'np')}
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [(lang, pool.submit(run_all, lang)) for lang in ('en', 'np') * 8]
+            for lang, future in futures:
+                assert future.result() == expected[lang]
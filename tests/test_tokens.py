@@ -0,0 +1,55 @@
+"""
+Tests for token-ID output.
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+from nepali_num2word import TokenizedWords, convert_to_tokens, convert_to_words, decode_tokens
+from nepali_num2word.tokens import VOCABULARY
+
+
+class TestConvertToTokens:
+    """Test cases for convert_to_tokens and decoding."""
+    
+    def test_decodes_to_convert_to_words(self):
+        """Test that every decoded result equals convert_to_words."""
+        rng = random.Random(3)
+        numbers = [0, 1, -5, 99, 100, 120000, 999999999, 123.45, -0.5, 0.0, 1.01,
+                   0.999, Decimal('12.30'), "1,20,000"]
+        numbers += [rng.randint(-999999999, 999999999) for _ in range(2000)]
+        numbers += [round(rng.uniform(-1000000, 1000000), 2) for _ in range(2000)]
+        for lang in ('en', 'np', 'rom'):
+            words = convert_to_tokens(numbers, lang)
+            assert len(words) == len(numbers)
+            assert list(words) == [convert_to_words(n, lang) for n in numbers]
+    
+    def test_layout(self):
+        """Test the token and offset arrays."""
+        words = convert_to_tokens([120000, 5, -1])
+        assert words.tokens.typecode == 'H'
+        assert words.offsets.typecode == 'I'
+        assert list(words.offsets) == [0, 4, 5, 7]
+        assert [VOCABULARY[i] for i in words.token_ids(0)] == ['one', 'lakh', 'twenty', 'thousand']
+        assert words.nbytes == 7 * 2 + 4 * 4
+        assert len(VOCABULARY) < 65536
+    
+    def test_indexing(self):
+        """Test indexing, negative indexes and slices."""
+        words = convert_to_tokens([1, 2, 3])
+        assert words[0] == "one"
+        assert words[-1] == "three"
+        assert words[1:] == ["two", "three"]
+        with pytest.raises(IndexError):
+            words[3]
+        assert decode_tokens(words.token_ids(1)) == "two"
+    
+    def test_empty_and_errors(self):
+        """Test empty input and invalid values."""
+        assert len(convert_to_tokens([])) == 0
+        assert isinstance(convert_to_tokens([]), TokenizedWords)
+        with pytest.raises(ValueError, match="'abc' is not a valid number"):
+            convert_to_tokens([1, "abc"])
+        with pytest.raises(TypeError):
+            convert_to_tokens([None])
@@ -0,0 +1,64 @@
+"""
+Tests for the NumPy format_number backend.
+"""
+
+import random
+
+import pytest
+from nepali_num2word import format_number
+
+np = pytest.importorskip("numpy")
+from nepali_num2word.vectorized import CHUNK_SIZE, format_number_array  # noqa: E402
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(46)
+    edge = [0, 1, -1, 999, 1000, -1000, 99999, 100000, -100000, 999999999, 2**63 - 1, -2**63]
+    return edge + [rng.randint(-10**k, 10**k) for k in range(1, 19) for _ in range(500)]
+
+
+class TestFormatNumberArray:
+    """Test the vectorized grouping against format_number."""
+    
+    @pytest.mark.parametrize('lang', ['en', 'np'])
+    def test_matches_scalar(self, values, lang):
+        """Test every element against format_number."""
+        result = format_number_array(np.array(values, dtype=np.int64), lang)
+        assert result.tolist() == [format_number(value, lang) for value in values]
+    
+    @pytest.mark.parametrize('lang', ['en', 'np'])
+    def test_bytes_output(self, values, lang):
+        """Test the fixed-width UTF-8 bytes output."""
+        result = format_number_array(np.array(values, dtype=np.int64), lang, dtype='S')
+        assert result.dtype.kind == 'S'
+        assert [item.decode('utf-8') for item in result.tolist()] == [format_number(v, lang) for v in values]
+    
+    @pytest.mark.parametrize('dtype', ['int8', 'int16', 'int32', 'uint8', 'uint32', 'uint64'])
+    def test_integer_dtypes(self, dtype):
+        """Test narrow, unsigned and full-range integer types."""
+        info = np.iinfo(dtype)
+        array = np.array([info.min, 0, 7, info.max], dtype=dtype)
+        assert format_number_array(array).tolist() == [format_number(int(v)) for v in array.tolist()]
+    
+    def test_shape_and_chunks(self):
+        """Test that the shape is kept and chunk boundaries do not matter."""
+        array = np.arange(-CHUNK_SIZE, CHUNK_SIZE * 2, 37, dtype=np.int64)
+        result = format_number_array(array.reshape(-1, 1), 'np')
+        assert result.shape == (array.size, 1)
+        assert result[:, 0].tolist() == [format_number(int(v), 'np') for v in array.tolist()]
+        assert format_number_array([[1000, 2], [3, 4]]).tolist() == [['1,000', '2'], ['3', '4']]
+    
+    def test_empty(self):
+        """Test an empty input."""
+        assert format_number_array([]).shape == (0,)
+        assert format_number_array(np.empty((0, 3), dtype=np.int64)).shape == (0, 3)
+    
+    def test_errors(self):
+        """Test non-integer arrays and bad dtype arguments."""
+        with pytest.raises(TypeError, match="integer array"):
+            format_number_array(np.array([1.5]))
+        with pytest.raises(TypeError, match="integer array"):
+            format_number_array(["1000"])
+        with pytest.raises(ValueError, match="dtype must be"):
+            format_number_array([1], dtype='O')
@@ -0,0 +1,51 @@
+"""
+Tests for the differential verification harness in tools/.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+import verify_engine
+from nepali_num2word import core
+
+
+class TestVerifyEngine:
+    """Test cases for the sweep and fuzz modes."""
+    
+    def test_check_chunk_matches_reference(self):
+        """Test a chunk across group boundaries."""
+        record = verify_engine.check_chunk(99000, 101000)
+        assert all(count == 0 for count in record['mismatches'].values())
+        assert set(record['checksums']) == set(verify_engine.TARGETS)
+    
+    def test_detects_mismatch(self, monkeypatch):
+        """Test that a broken live engine is reported."""
+        original = core.compact_number
+        monkeypatch.setattr(core, "compact_number",
+                            lambda n, precision=1, lang='en': "x" if n == 1500 else original(n, precision, lang))
+        record = verify_engine.check_chunk(1000, 2000, targets=('compact-en',))
+        assert record['mismatches'] == {'compact-en': 1}
+        assert record['examples'] == {'compact-en': [1500]}
+    
+    def test_sweep_resumes_from_progress(self, tmp_path):
+        """Test that finished chunks are skipped on the next run."""
+        progress = tmp_path / "progress.jsonl"
+        report = verify_engine.sweep(0, 3000, chunk_size=1000, workers=0,
+                                     progress=str(progress), targets=('format',), quiet=True)
+        assert report['chunks'] == 3
+        assert report['values'] == 3000
+        assert report['mismatches'] == {'format': 0}
+        assert len(progress.read_text().splitlines()) == 3
+        
+        # A second run over a larger range only checks the new chunk
+        report = verify_engine.sweep(0, 4000, chunk_size=1000, workers=0,
+                                     progress=str(progress), targets=('format',), quiet=True)
+        assert report['chunks'] == 4
+        assert len(progress.read_text().splitlines()) == 4
+    
+    def test_fuzz_matches_reference(self):
+        """Test random floats and strings against the reference."""
+        report = verify_engine.fuzz(count=2000, seed=1)
+        assert report['mismatches'] == 0, report['examples']
@@ -0,0 +1,84 @@
+"""
+Tests for fixed-width wrapping of words.
+"""
+
+import random
+
+import pytest
+from nepali_num2word import convert_to_words, wrap_words, wrap_words_batch
+from nepali_num2word.tokens import VOCABULARY
+from nepali_num2word.wrap import TOKEN_WIDTHS, display_width
+
+
+@pytest.fixture
+def numbers():
+    rng = random.Random(49)
+    return [0, -5, 123.45, -99999999.99] + [rng.randint(-999999999, 999999999) for _ in range(300)]
+
+
+class TestDisplayWidth:
+    """Test column widths of Devanagari and ASCII text."""
+    
+    def test_combining_marks(self):
+        """Test that non-spacing marks take no column."""
+        assert display_width('रुपैयाँ') == 4
+        assert display_width('अठ्ठाईस') == 6
+        assert display_width('लाख') == 3
+        assert display_width('twenty-five') == 11
+        assert display_width('') == 0
+    
+    def test_precomputed_widths(self):
+        """Test the table covers the whole vocabulary."""
+        assert len(TOKEN_WIDTHS) == len(VOCABULARY)
+        assert all(TOKEN_WIDTHS[i] == display_width(word) for i, word in enumerate(VOCABULARY))
+
+
+class TestWrapWords:
+    """Test greedy wrapping to a display width."""
+    
+    @pytest.mark.parametrize('lang', ['en', 'np', 'rom'])
+    @pytest.mark.parametrize('width', [16, 25, 40])
+    def test_lines_fit_and_rejoin(self, numbers, lang, width):
+        """Test that lines fit and rejoin to the unwrapped words."""
+        for number in numbers:
+            lines = wrap_words(number, width, lang)
+            assert all(0 < display_width(line) <= width for line in lines)
+            assert ' '.join(lines) == convert_to_words(number, lang)
+    
+    @pytest.mark.parametrize('lang', ['en', 'np'])
+    def test_greedy(self, numbers, lang):
+        """Test that the next word would not have fit on the previous line."""
+        for number in numbers:
+            lines = wrap_words(number, 20, lang)
+            for line, following in zip(lines, lines[1:]):
+                first_word = following.split(' ')[0]
+                assert display_width(line) + 1 + display_width(first_word) > 20
+    
+    def test_examples(self):
+        """Test known layouts."""
+        assert wrap_words(123456789, 20) == ['twelve crore', 'thirty-four lakh', 'fifty-six thousand',
+                                            'seven hundred', 'eighty-nine']
+        assert wrap_words(120000.5, 15, 'np') == ['एक लाख बीस हजार', 'रुपैयाँ र पचास पैसा']
+        assert wrap_words(-5, 10) == ['-five']
+        assert wrap_words(5, 100) == ['five']
+    
+    def test_long_words_split_between_clusters(self):
+        """Test that words wider than the line are split without detaching marks."""
+        assert wrap_words(17, 3) == ['sev', 'ent', 'een']
+        assert wrap_words(28, 2, 'np') == ['अ', 'ठ्ठा', 'ईस']
+        for line in wrap_words(999999999, 2, 'np'):
+            assert display_width(line) <= 2 or len(line.split(' ')) == 1
+            assert line[:1] not in 'ािीुूृेैोौंँ्'
+    
+    def test_batch(self, numbers):
+        """Test the batch variant."""
+        assert wrap_words_batch(numbers, 24, 'np') == [wrap_words(n, 24, 'np') for n in numbers]
+    
+    def test_errors(self):
+        """Test invalid width and values."""
+        with pytest.raises(ValueError, match="width must be at least 1"):
+            wrap_words(5, 0)
+        with pytest.raises(ValueError):
+            wrap_words("abc", 20)
+        with pytest.raises(TypeError):
+            wrap_words_batch([1, None], 20)
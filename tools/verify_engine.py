@@ -0,0 +1,281 @@
+"""
+Differential verification harness for the conversion engine.
+
+Compares the live engine in ``nepali_num2word.core`` against the frozen copy in
+``tools/reference_engine.py``.
+
+Two modes are available:
+
+    sweep   Check every integer in a range (by default the full supported range
+            0-999,999,999). The range is split into chunks that run on a process
+            pool. Each finished chunk is appended to a JSON-lines progress file
+            with its CRC-32 checksum, so an interrupted sweep resumes where it
+            stopped.
+
+    fuzz    Check random floats and strings, including invalid ones, through
+            the public functions. Results and raised exceptions (type and
+            message) must match.
+
+Examples:
+    python tools/verify_engine.py sweep --progress sweep.jsonl
+    python tools/verify_engine.py sweep --start 0 --stop 10000000 --workers 8
+    python tools/verify_engine.py fuzz --count 1000000 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from functools import partial
+from multiprocessing import Pool
+
+# Add parent directory to path for importing nepali_num2word
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import reference_engine as reference
+from nepali_num2word import core
+
+MAX_NUMBER = 999999999
+
+# Integer targets: name -> (reference function, live function name in core, kwargs)
+TARGETS = {
+    'words-en': (reference.convert_integer_to_words, 'convert_integer_to_words', {'lang': 'en'}),
+    'words-np': (reference.convert_integer_to_words, 'convert_integer_to_words', {'lang': 'np'}),
+    'format': (reference._format_integer_part, '_format_integer_part', {}),
+    'compact-en': (reference.compact_number, 'compact_number', {'lang': 'en'}),
+    'compact-np': (reference.compact_number, 'compact_number', {'lang': 'np'}),
+}
+
+# Keep at most this many mismatching values per chunk in the progress file
+MAX_REPORTED = 20
+
+
+def check_chunk(start, stop, targets=tuple(TARGETS)):
+    """
+    Compare reference and live outputs for every integer in ``[start, stop)``.
+
+    Args:
+        start (int): First value (inclusive).
+        stop (int): Last value (exclusive).
+        targets (tuple, optional): Names from TARGETS. Defaults to all.
+
+    Returns:
+        dict: Chunk record with ``start``, ``stop``, ``checksums`` (CRC-32 of the
+              live outputs per target), ``mismatches`` (count per target) and
+              ``examples`` (first mismatching values per target).
+    """
+    record = {'start': start, 'stop': stop, 'checksums': {}, 'mismatches': {}, 'examples': {}}
+    for name in targets:
+        ref_func, live_name, kwargs = TARGETS[name]
+        ref_func = partial(ref_func, **kwargs)
+        live_func = partial(getattr(core, live_name), **kwargs)
+        crc = 0
+        mismatches = 0
+        examples = []
+        for block in range(start, stop, 10000):
+            numbers = range(block, min(block + 10000, stop))
+            live = list(map(live_func, numbers))
+            expected = list(map(ref_func, numbers))
+            if live != expected:
+                for number, got, want in zip(numbers, live, expected):
+                    if got != want:
+                        mismatches += 1
+                        if len(examples) < MAX_REPORTED:
+                            examples.append(number)
+            crc = zlib.crc32('\n'.join(live).encode('utf-8'), crc)
+        record['checksums'][name] = f"{crc:08x}"
+        record['mismatches'][name] = mismatches
+        if examples:
+            record['examples'][name] = examples
+    return record
+
+
+def _check_chunk_args(args):
+    return check_chunk(*args)
+
+
+def load_progress(path):
+    """
+    Read finished chunks from a progress file.
+
+    Args:
+        path (str): JSON-lines progress file (may not exist yet).
+
+    Returns:
+        dict: Chunk records keyed by ``(start, stop)``.
+    """
+    done = {}
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as handle:
+            for line in handle:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    done[(record['start'], record['stop'])] = record
+    return done
+
+
+def sweep(start=0, stop=MAX_NUMBER + 1, chunk_size=1000000, workers=None,
+          progress=None, targets=tuple(TARGETS), quiet=False):
+    """
+    Check every integer in ``[start, stop)`` across a process pool.
+
+    Args:
+        start (int, optional): First value. Defaults to 0.
+        stop (int, optional): End of range (exclusive). Defaults to 1,000,000,000.
+        chunk_size (int, optional): Values per chunk. Defaults to 1,000,000.
+        workers (int, optional): Worker processes; 0 runs in this process.
+                                 Defaults to the number of CPUs.
+        progress (str, optional): JSON-lines file used to resume. Defaults to None.
+        targets (tuple, optional): Names from TARGETS. Defaults to all.
+        quiet (bool, optional): Do not print progress lines. Defaults to False.
+
+    Returns:
+        dict: Final report with ``chunks``, ``values``, ``mismatches`` per target,
+              ``examples`` and ``seconds``.
+    """
+    chunks = [(low, min(low + chunk_size, stop)) for low in range(start, stop, chunk_size)]
+    done = load_progress(progress)
+    pending = [(low, high, tuple(targets)) for low, high in chunks if (low, high) not in done]
+    if not quiet:
+        print(f"{len(chunks)} chunks, {len(chunks) - len(pending)} already done, "
+              f"{len(pending)} to check", file=sys.stderr)
+
+    began = time.perf_counter()
+    handle = open(progress, 'a', encoding='utf-8') if progress else None
+
+    def consume(results):
+        for count, record in enumerate(results, 1):
+            done[(record['start'], record['stop'])] = record
+            if handle:
+                handle.write(json.dumps(record) + '\n')
+                handle.flush()
+            if not quiet:
+                bad = sum(record['mismatches'].values())
+                print(f"[{count}/{len(pending)}] {record['start']:,}-{record['stop']:,} "
+                      f"{'OK' if not bad else f'{bad} MISMATCHES'}", file=sys.stderr)
+
+    try:
+        if workers == 0:
+            consume(map(_check_chunk_args, pending))
+        else:
+            with Pool(workers) as pool:
+                consume(pool.imap_unordered(_check_chunk_args, pending))
+    finally:
+        if handle:
+            handle.close()
+
+    records = [done[chunk] for chunk in chunks if chunk in done]
+    report = {
+        'chunks': len(records),
+        'values': sum(record['stop'] - record['start'] for record in records),
+        'mismatches': {name: 0 for name in targets},
+        'examples': {},
+        'seconds': round(time.perf_counter() - began, 3),
+    }
+    for record in records:
+        for name, count in record['mismatches'].items():
+            report['mismatches'][name] = report['mismatches'].get(name, 0) + count
+        for name, values in record['examples'].items():
+            report['examples'].setdefault(name, []).extend(values[:MAX_REPORTED])
+    return report
+
+
+def _outcome(func, *args, **kwargs):
+    """Return ('ok', result) or ('error', exception type name, message)."""
+    try:
+        return ('ok', func(*args, **kwargs))
+    except Exception as e:
+        return ('error', type(e).__name__, str(e))
+
+
+def _random_input(rng):
+    """Generate one random float or string input."""
+    choice = rng.random()
+    if choice < 0.4:
+        return round(rng.uniform(-MAX_NUMBER, MAX_NUMBER), rng.randint(0, 3))
+    if choice < 0.5:
+        return rng.uniform(-1000, 1000)
+    if choice < 0.7:
+        return str(rng.randint(-MAX_NUMBER, MAX_NUMBER))
+    if choice < 0.85:
+        return f"{rng.uniform(-MAX_NUMBER, MAX_NUMBER):.{rng.randint(1, 4)}f}"
+    garbage = ['', ' ', 'abc', '12a', '1.2.3', '--1', '१२३', '0x10', 'nan', '1 000']
+    return rng.choice(garbage)
+
+
+def fuzz(count=100000, seed=0):
+    """
+    Compare reference and live public functions on random floats and strings.
+
+    Args:
+        count (int, optional): Number of random inputs. Defaults to 100,000.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        dict: Report with ``inputs``, ``mismatches`` and up to 20 ``examples``.
+    """
+    rng = random.Random(seed)
+    mismatches = 0
+    examples = []
+    for _ in range(count):
+        value = _random_input(rng)
+        lang = rng.choice(('en', 'np'))
+        precision = rng.randint(0, 3)
+        checks = (
+            ('convert_to_words', (value, lang), {}),
+            ('format_number', (value, lang), {}),
+            ('compact_number', (value, precision, lang), {}),
+        )
+        for name, args, kwargs in checks:
+            expected = _outcome(getattr(reference, name), *args, **kwargs)
+            actual = _outcome(getattr(core, name), *args, **kwargs)
+            if expected != actual:
+                mismatches += 1
+                if len(examples) < MAX_REPORTED:
+                    examples.append({'function': name, 'args': repr(args),
+                                     'expected': expected, 'actual': actual})
+    return {'inputs': count, 'mismatches': mismatches, 'examples': examples}
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Verify the live engine against the frozen reference.')
+    subparsers = parser.add_subparsers(dest='mode', required=True)
+
+    sweep_parser = subparsers.add_parser('sweep', help='Check every integer in a range')
+    sweep_parser.add_argument('--start', type=int, default=0)
+    sweep_parser.add_argument('--stop', type=int, default=MAX_NUMBER + 1)
+    sweep_parser.add_argument('--chunk-size', type=int, default=1000000)
+    sweep_parser.add_argument('--workers', type=int, default=None,
+                              help='Worker processes (default: CPU count, 0: no pool)')
+    sweep_parser.add_argument('--progress', help='JSON-lines progress file for resuming')
+    sweep_parser.add_argument('--targets', default=','.join(TARGETS),
+                              help=f"Comma-separated subset of: {', '.join(TARGETS)}")
+
+    fuzz_parser = subparsers.add_parser('fuzz', help='Check random floats and strings')
+    fuzz_parser.add_argument('--count', type=int, default=100000)
+    fuzz_parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+    if args.mode == 'sweep':
+        targets = tuple(name for name in args.targets.split(',') if name)
+        unknown = [name for name in targets if name not in TARGETS]
+        if unknown:
+            parser.error(f"unknown targets: {', '.join(unknown)}")
+        report = sweep(args.start, args.stop, args.chunk_size, args.workers, args.progress, targets)
+        failed = any(report['mismatches'].values())
+    else:
+        report = fuzz(args.count, args.seed)
+        failed = report['mismatches'] > 0
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()